@@ -0,0 +1,299 @@
+"""Stub of the Paperless-NGX REST endpoints used by the MCP server, for benchmarks.
+
+The corpus is generated deterministically from a seed, so runs with the same
+options serve identical data. Run standalone with:
+
+    uv run python benchmarks/mock_paperless.py --port 8765 --documents 1000
+"""
+
+import argparse
+import asyncio
+import random
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+# Length of ``content`` when the client asks for truncate_content=true
+TRUNCATED_CONTENT_LENGTH = 550
+
+SYLLABLES = (
+    "ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ber", "dan",
+    "fel", "gor", "hin", "jus", "kor", "lin", "mar", "nor", "pel", "quin",
+)  # fmt: skip
+
+METADATA_COUNTS = {
+    "tags": 50,
+    "correspondents": 20,
+    "document_types": 10,
+    "storage_paths": 5,
+    "custom_fields": 5,
+}
+
+
+def build_vocabulary(seed: int, size: int = 3000) -> list[str]:
+    """Generate ``size`` distinct pseudo-words, most frequent first."""
+    rng = random.Random(seed)
+    words: dict[str, None] = {}
+    while len(words) < size:
+        words["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))] = None
+    return list(words)
+
+
+class Corpus:
+    """Deterministic set of documents and metadata served by the stub."""
+
+    def __init__(self, documents: int, content_length: int, seed: int):
+        rng = random.Random(seed)
+        self.vocabulary = build_vocabulary(seed)
+        # Zipf-like word frequencies, as in natural language
+        weights = [1 / (rank + 1) for rank in range(len(self.vocabulary))]
+        base = datetime(2020, 1, 1, tzinfo=UTC)
+
+        self.metadata = {
+            kind: [{"id": i, "name": f"{kind[:-1]} {i}"} for i in range(1, count + 1)]
+            for kind, count in METADATA_COUNTS.items()
+        }
+        for tag in self.metadata["tags"]:
+            tag.update({"color": "#a6cee3", "text_color": "#000000", "document_count": 0})
+
+        self.documents: dict[int, dict[str, Any]] = {}
+        self.tokens: dict[int, set[str]] = {}
+        for doc_id in range(1, documents + 1):
+            words: list[str] = []
+            length = 0
+            while length < content_length:
+                chunk = rng.choices(self.vocabulary, weights, k=64)
+                words.extend(chunk)
+                length += sum(len(w) + 1 for w in chunk)
+            content = " ".join(words)[:content_length]
+            created = base + timedelta(days=rng.randint(0, 5 * 365))
+            modified = created + timedelta(hours=rng.randint(0, 1000))
+            tags = sorted(rng.sample(range(1, METADATA_COUNTS["tags"] + 1), k=rng.randint(0, 4)))
+            for tag_id in tags:
+                self.metadata["tags"][tag_id - 1]["document_count"] += 1
+            self.documents[doc_id] = {
+                "id": doc_id,
+                "title": " ".join(words[:4]).title(),
+                "content": content,
+                "correspondent": rng.randint(1, METADATA_COUNTS["correspondents"]),
+                "document_type": rng.randint(1, METADATA_COUNTS["document_types"]),
+                "storage_path": rng.choice([None, *range(1, METADATA_COUNTS["storage_paths"] + 1)]),
+                "tags": tags,
+                "created": created.isoformat(),
+                "created_date": created.date().isoformat(),
+                "modified": modified.isoformat(),
+                "added": modified.isoformat(),
+                "archive_serial_number": doc_id if rng.random() < 0.5 else None,
+                "original_file_name": f"scan_{doc_id:05d}.pdf",
+                "archived_file_name": f"{doc_id:05d}.pdf",
+                "owner": 1,
+                "notes": [],
+                "custom_fields": [],
+            }
+            self.tokens[doc_id] = set(content.split())
+        for kind, field in (
+            ("correspondents", "correspondent"),
+            ("document_types", "document_type"),
+        ):
+            counts = Counter(doc[field] for doc in self.documents.values())
+            for item in self.metadata[kind]:
+                item["document_count"] = counts[item["id"]]
+
+        self.document_frequency: dict[str, int] = {}
+        for tokens in self.tokens.values():
+            for token in tokens:
+                self.document_frequency[token] = self.document_frequency.get(token, 0) + 1
+
+
+def _paginate(request: Request, items: list[dict[str, Any]]) -> dict[str, Any]:
+    page = int(request.query_params.get("page", 1))
+    page_size = int(request.query_params.get("page_size", 25))
+    start = (page - 1) * page_size
+    more = start + page_size < len(items)
+    return {
+        "count": len(items),
+        "next": f"{request.url.path}?page={page + 1}" if more else None,
+        "previous": f"{request.url.path}?page={page - 1}" if page > 1 else None,
+        "results": items[start : start + page_size],
+    }
+
+
+def _highlights(content: str, terms: list[str]) -> str:
+    """Up to three passages around query terms, marked up like Paperless-NGX's highlights."""
+    words = content.split()
+    passages = []
+    for i, word in enumerate(words):
+        if word in terms:
+            passage = words[max(0, i - 6) : i + 7]
+            passages.append(
+                " ".join(
+                    f'<span class="match term{terms.index(w)}">{w}</span>' if w in terms else w
+                    for w in passage
+                )
+            )
+            if len(passages) == 3:
+                break
+    return "...".join(passages)
+
+
+def _project(document: dict[str, Any], request: Request) -> dict[str, Any]:
+    fields = request.query_params.get("fields")
+    if fields:
+        # Like Paperless-NGX, search hit details are kept whatever fields are requested
+        allowed = {*fields.split(","), "__search_hit__"}
+        document = {k: v for k, v in document.items() if k in allowed}
+    if request.query_params.get("truncate_content") == "true" and "content" in document:
+        document = {**document, "content": document["content"][:TRUNCATED_CONTENT_LENGTH]}
+    return document
+
+
+def create_app(corpus: Corpus, latency: float = 0.0, jitter: float = 0.0) -> Starlette:
+    """
+    Create the stub application.
+
+    Args:
+        corpus: Documents and metadata to serve
+        latency: Seconds added to every response
+        jitter: Maximum random extra seconds added to every response
+    """
+
+    async def delay() -> None:
+        if latency or jitter:
+            await asyncio.sleep(latency + random.uniform(0, jitter))
+
+    async def documents(request: Request) -> JSONResponse:
+        await delay()
+        params = request.query_params
+        ranked: list[tuple[int, float]] | None = None
+        terms: list[str] = []
+        if "query" in params:
+            terms = params["query"].lower().split()
+            ranked = []
+            for doc_id, tokens in corpus.tokens.items():
+                if all(term in tokens for term in terms):
+                    ranked.append((doc_id, sum(1 / corpus.document_frequency[t] for t in terms)))
+            ranked.sort(key=lambda hit: -hit[1])
+        elif "more_like_id" in params:
+            reference = corpus.documents.get(int(params["more_like_id"]))
+            if reference is None:
+                return JSONResponse({"detail": "Not found."}, status_code=404)
+            ranked = [
+                (doc["id"], 1.0)
+                for doc in corpus.documents.values()
+                if doc["document_type"] == reference["document_type"]
+                and doc["id"] != reference["id"]
+            ]
+
+        if ranked is not None:
+            items = [corpus.documents[doc_id] for doc_id, _ in ranked]
+        else:
+            items = list(corpus.documents.values())
+        if "id__in" in params:
+            ids = {int(i) for i in params["id__in"].split(",") if i}
+            items = [doc for doc in items if doc["id"] in ids]
+        if "modified__gt" in params:
+            items = [doc for doc in items if doc["modified"] > params["modified__gt"]]
+        if "modified__gte" in params:
+            items = [doc for doc in items if doc["modified"] >= params["modified__gte"]]
+        if "tags__id__all" in params:
+            tags = {int(i) for i in params["tags__id__all"].split(",")}
+            items = [doc for doc in items if tags <= set(doc["tags"])]
+        for field in ("correspondent", "document_type"):
+            if f"{field}__id__in" in params:
+                ids = {int(i) for i in params[f"{field}__id__in"].split(",")}
+                items = [doc for doc in items if doc[field] in ids]
+        for field in ("created", "added"):
+            if f"{field}__date__gte" in params:
+                items = [doc for doc in items if doc[field][:10] >= params[f"{field}__date__gte"]]
+            if f"{field}__date__lte" in params:
+                items = [doc for doc in items if doc[field][:10] <= params[f"{field}__date__lte"]]
+        if "archive_serial_number" in params:
+            asn = int(params["archive_serial_number"])
+            items = [doc for doc in items if doc["archive_serial_number"] == asn]
+        # Sorting by the last key first keeps earlier keys decisive (sorts are stable)
+        for field in reversed(params.get("ordering", "").split(",")):
+            if field:
+                key = field.lstrip("-")
+                items = sorted(items, key=lambda doc: doc[key] or 0, reverse=field.startswith("-"))
+
+        body = _paginate(request, items)
+        if ranked is not None:
+            scores = dict(ranked)
+            start = (int(params.get("page", 1)) - 1) * int(params.get("page_size", 25))
+            body["results"] = [
+                {
+                    **doc,
+                    "__search_hit__": {
+                        "score": scores[doc["id"]],
+                        "rank": start + rank,
+                        "highlights": _highlights(doc["content"], terms),
+                        "note_highlights": "",
+                    },
+                }
+                for rank, doc in enumerate(body["results"])
+            ]
+        body["results"] = [_project(doc, request) for doc in body["results"]]
+        body["all"] = [doc["id"] for doc in items]
+        return JSONResponse(body)
+
+    async def document(request: Request) -> JSONResponse:
+        await delay()
+        doc = corpus.documents.get(request.path_params["document_id"])
+        if doc is None:
+            return JSONResponse({"detail": "No Document matches the given query."}, 404)
+        return JSONResponse(_project(doc, request))
+
+    def metadata_list(kind: str):
+        async def endpoint(request: Request) -> JSONResponse:
+            await delay()
+            return JSONResponse(_paginate(request, corpus.metadata[kind]))
+
+        return endpoint
+
+    async def autocomplete(request: Request) -> JSONResponse:
+        await delay()
+        term = request.query_params.get("term", "").lower()
+        limit = int(request.query_params.get("limit", 10))
+        matches = [w for w in corpus.document_frequency if w.startswith(term)]
+        matches.sort(key=lambda w: -corpus.document_frequency[w])
+        return JSONResponse(matches[:limit])
+
+    routes = [
+        Route("/api/documents/", documents),
+        Route("/api/documents/{document_id:int}/", document),
+        Route("/api/search/autocomplete/", autocomplete),
+    ]
+    routes += [Route(f"/api/{kind}/", metadata_list(kind)) for kind in METADATA_COUNTS]
+    return Starlette(routes=routes)
+
+
+def add_corpus_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options shared by the stub and the benchmark runner."""
+    parser.add_argument("--documents", type=int, default=1000, help="Corpus size")
+    parser.add_argument(
+        "--content-length", type=int, default=5000, help="Characters of text per document"
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per response")
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Maximum random seconds added per response"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the generated corpus")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Mock Paperless-NGX server for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_corpus_arguments(parser)
+    args = parser.parse_args()
+
+    corpus = Corpus(args.documents, args.content_length, args.seed)
+    app = create_app(corpus, latency=args.latency, jitter=args.jitter)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,310 @@
+"""Benchmark every MCP tool over stdio and Streamable HTTP against a mock Paperless-NGX.
+
+Starts ``mock_paperless.py`` and the MCP server as subprocesses, calls each
+tool ``--iterations`` times with ``--concurrency`` calls in flight, and
+reports p50/p95/p99 latency, throughput and the server's peak RSS. Results
+are written as JSON; pass an earlier result file with ``--compare`` to print
+the change per tool.
+
+    uv run python benchmarks/run.py --documents 2000 --latency 0.02
+    uv run python benchmarks/run.py --compare benchmarks/results/<earlier>.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+from mock_paperless import add_corpus_arguments, build_vocabulary
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCHMARK_DIR.parent
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_http(url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Process for {url} exited with code {process.returncode}")
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Timed out waiting for {url}")
+
+
+def _stop(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def tool_scenarios(args: argparse.Namespace) -> dict[str, Callable[[random.Random], dict]]:
+    """Argument generators per tool, drawing document IDs and words from the corpus."""
+    vocabulary = build_vocabulary(args.seed)[:500]
+
+    def doc_id(rng: random.Random) -> int:
+        return rng.randint(1, args.documents)
+
+    return {
+        "search_documents": lambda rng: {"query": rng.choice(vocabulary), "page_size": 25},
+        "get_document": lambda rng: {"document_id": doc_id(rng)},
+        "get_document_content": lambda rng: {"document_id": doc_id(rng), "length": 2000},
+        "get_documents": lambda rng: {"document_ids": [doc_id(rng) for _ in range(10)]},
+        "get_similar_documents": lambda rng: {"document_id": doc_id(rng), "page_size": 25},
+        "similarity_graph": lambda rng: {
+            "document_ids": [doc_id(rng) for _ in range(3)],
+            "depth": 2,
+        },
+        "export_documents": lambda rng: {"correspondent": rng.randint(1, 20)},
+        "document_stats": lambda rng: {
+            "group_by": "correspondent",
+            "tags": [rng.randint(1, 50)],
+        },
+        "list_tags": lambda rng: {},
+        "autocomplete_search": lambda rng: {"term": rng.choice(vocabulary)[:3], "limit": 10},
+        "mirror_status": lambda rng: {},
+        "server_stats": lambda rng: {},
+        "http_cache": lambda rng: {},
+    }
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    """Compute latency percentiles (in milliseconds) and throughput for one tool."""
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "calls": len(latencies),
+        "errors": errors,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+    }
+
+
+def is_error_result(content: list[Any]) -> bool:
+    """Whether a tool returned one of its JSON error objects (in any output format)."""
+    text = getattr(content[0], "text", "") if content else ""
+    try:
+        value = json.loads(text)
+    except ValueError:
+        # NDJSON export chunks
+        return False
+    return isinstance(value, dict) and "error" in value
+
+
+async def bench_tool(
+    client: Client, tool: str, make_args: Callable, args: argparse.Namespace
+) -> dict[str, Any]:
+    """Call one tool repeatedly with a fixed number of calls in flight."""
+    rng = random.Random(f"{args.seed}-{tool}")
+    calls = [make_args(rng) for _ in range(args.warmup + args.iterations)]
+    for call_args in calls[: args.warmup]:
+        await client.call_tool(tool, call_args, raise_on_error=False)
+
+    pending = iter(calls[args.warmup :])
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for call_args in pending:
+            started = time.perf_counter()
+            result = await client.call_tool(tool, call_args, raise_on_error=False)
+            latencies.append(time.perf_counter() - started)
+            if result.is_error or is_error_result(result.content):
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+async def bench_transport(client: Client, args: argparse.Namespace) -> dict[str, Any]:
+    """Benchmark the selected tools over one connected client."""
+    results: dict[str, Any] = {"tools": {}}
+    async with client:
+        for tool, make_args in tool_scenarios(args).items():
+            if args.tools and tool not in args.tools:
+                continue
+            results["tools"][tool] = await bench_tool(client, tool, make_args, args)
+            print(f"  {tool:<24} {_format_row(results['tools'][tool])}", file=sys.stderr)
+        stats = json.loads((await client.call_tool("server_stats", {})).content[0].text)
+    results["peak_rss_bytes"] = (stats.get("process") or {}).get("peak_rss_bytes")
+    results["server_stats"] = stats
+    return results
+
+
+def _format_row(row: dict[str, Any]) -> str:
+    return (
+        f"p50 {row['p50_ms']:>9.2f} ms  p95 {row['p95_ms']:>9.2f} ms  "
+        f"p99 {row['p99_ms']:>9.2f} ms  {row['throughput_rps']:>8.1f} calls/s  "
+        f"errors {row['errors']}"
+    )
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the mock server, benchmark each transport and collect the results."""
+    mock_port = _free_port()
+    mock = subprocess.Popen(
+        [
+            sys.executable,
+            str(BENCHMARK_DIR / "mock_paperless.py"),
+            f"--port={mock_port}",
+            f"--documents={args.documents}",
+            f"--content-length={args.content_length}",
+            f"--latency={args.latency}",
+            f"--jitter={args.jitter}",
+            f"--seed={args.seed}",
+        ]
+    )
+    env = {
+        **os.environ,
+        # Benchmark the checked-out sources, not a previously installed copy
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(PROJECT_ROOT / "src"), os.environ.get("PYTHONPATH")])
+        ),
+        "PAPERLESS_API_URL": f"http://127.0.0.1:{mock_port}",
+        "PAPERLESS_API_TOKEN": "benchmark",
+        "PAPERLESS_MIRROR": "false",
+        "PAPERLESS_OTEL": "false",
+    }
+    main_py = str(PROJECT_ROOT / "main.py")
+    results: dict[str, Any] = {}
+    try:
+        _wait_for_http(f"http://127.0.0.1:{mock_port}/api/tags/", mock)
+        for transport in args.transports:
+            print(f"{transport}:", file=sys.stderr)
+            if transport == "stdio":
+                client = Client(
+                    StdioTransport(
+                        sys.executable,
+                        [main_py],
+                        env=env,
+                        cwd=str(PROJECT_ROOT),
+                        log_file=Path(os.devnull),
+                    )
+                )
+                results[transport] = asyncio.run(bench_transport(client, args))
+                continue
+            port = _free_port()
+            server = subprocess.Popen(
+                [sys.executable, main_py, f"--port={port}"],
+                env=env,
+                cwd=PROJECT_ROOT,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                _wait_for_http(f"http://127.0.0.1:{port}/mcp", server)
+                client = Client(f"http://127.0.0.1:{port}/mcp")
+                results[transport] = asyncio.run(bench_transport(client, args))
+            finally:
+                _stop(server)
+    finally:
+        _stop(mock)
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """Print the relative change of p50/p95 latency and throughput per tool."""
+    meta = baseline["meta"]
+    print(f"\nCompared with {meta.get('git_commit')} ({meta['timestamp']}):")
+    for transport, result in current["results"].items():
+        base_tools = baseline["results"].get(transport, {}).get("tools", {})
+        print(f"{transport}:")
+        for tool, row in result["tools"].items():
+            base = base_tools.get(tool)
+            if base is None:
+                continue
+            changes = "  ".join(
+                f"{key} {(row[key] - base[key]) / base[key] * 100:+6.1f}%" if base[key] else ""
+                for key in ("p50_ms", "p95_ms", "throughput_rps")
+            )
+            print(f"  {tool:<24} {changes}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_corpus_arguments(parser)
+    parser.add_argument(
+        "--transports",
+        default="stdio,http",
+        type=lambda value: value.split(","),
+        help="Comma-separated transports to benchmark (stdio, http)",
+    )
+    parser.add_argument(
+        "--tools",
+        type=lambda value: value.split(","),
+        help="Comma-separated tools to benchmark (default: all)",
+    )
+    parser.add_argument("--iterations", type=int, default=200, help="Measured calls per tool")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured calls per tool")
+    parser.add_argument("--concurrency", type=int, default=8, help="Calls in flight per tool")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/)")
+    parser.add_argument("--compare", type=Path, help="Earlier result file to compare against")
+    args = parser.parse_args()
+
+    started = datetime.now(UTC)
+    report = {
+        "meta": {
+            "timestamp": started.isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "options": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        },
+        "results": run(args),
+    }
+
+    output = args.output or (
+        BENCHMARK_DIR
+        / "results"
+        / f"{started:%Y%m%d-%H%M%S}-{report['meta']['git_commit'] or 'unknown'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}", file=sys.stderr)
+    if args.compare:
+        compare(report, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Measure stdio cold start: import overhead and time to the first tools/list response.
+
+Clients such as VS Code and Claude Desktop spawn ``main.py`` per session, so
+startup time is paid on every session. This script measures, over ``--runs``
+fresh processes:
+
+- the import time of ``fastmcp`` (the floor the server cannot go below),
+- the import time of ``paperless_ngx_mcp.server`` on top of ``fastmcp``,
+- the time from spawning ``main.py`` until its ``tools/list`` response.
+
+It exits with status 1 if the median import overhead exceeds ``--budget-ms``
+or if a module that should only be loaded on first use is imported at
+startup, so it can guard against startup regressions in CI.
+
+    uv run python benchmarks/startup.py
+    uv run python benchmarks/startup.py --runs 20 --budget-ms 60
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules the server only needs once a tool is called (or a feature is enabled)
+DEFERRED_MODULES = ("prometheus_client", "sqlite3", "paperless_ngx_mcp.tools")
+
+_MEASURE_IMPORT = """
+import sys, time
+for module in sys.argv[1:-1]:
+    __import__(module)
+started = time.perf_counter()
+__import__(sys.argv[-1])
+print(time.perf_counter() - started)
+"""
+
+
+def _env() -> dict[str, str]:
+    return {
+        **os.environ,
+        # Measure the checked-out sources, not a previously installed copy
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(PROJECT_ROOT / "src"), os.environ.get("PYTHONPATH")])
+        ),
+        # Nothing may be requested from Paperless-NGX before the first tool call
+        "PAPERLESS_API_URL": "http://127.0.0.1:9",
+        "PAPERLESS_API_TOKEN": "startup-benchmark",
+    }
+
+
+def import_seconds(module: str, preloaded: tuple[str, ...] = ()) -> float:
+    """Import time of ``module`` in a fresh interpreter, after importing ``preloaded``."""
+    output = subprocess.run(
+        [sys.executable, "-c", _MEASURE_IMPORT, *preloaded, module],
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def loaded_deferred_modules() -> list[str]:
+    """Deferred modules that are imported by merely importing the server."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, paperless_ngx_mcp.server; print(json.dumps(sorted(sys.modules)))",
+        ],
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    modules = set(json.loads(output.strip().splitlines()[-1]))
+    return [name for name in DEFERRED_MODULES if name in modules]
+
+
+def _request(process: subprocess.Popen, message: dict) -> dict | None:
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+    if "id" not in message:
+        return None
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Server exited with code {process.wait()}")
+        response = json.loads(line)
+        if response.get("id") == message["id"]:
+            return response
+
+
+def first_tools_list_seconds() -> tuple[float, int]:
+    """Time from spawning the stdio server to its tools/list response, and the tool count."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, str(PROJECT_ROOT / "main.py")],
+        env=_env(),
+        cwd=PROJECT_ROOT,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        _request(
+            process,
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2025-06-18",
+                    "capabilities": {},
+                    "clientInfo": {"name": "startup-benchmark", "version": "0"},
+                },
+            },
+        )
+        _request(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        response = _request(process, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        elapsed = time.perf_counter() - started
+    finally:
+        process.stdin.close()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return elapsed, len(response["result"]["tools"])
+
+
+def _row(name: str, samples: list[float]) -> str:
+    ms = [s * 1000 for s in samples]
+    return (
+        f"{name:<28} median {statistics.median(ms):>8.1f} ms  "
+        f"min {min(ms):>8.1f} ms  max {max(ms):>8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Fresh processes per measurement")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=75.0,
+        help="Maximum median import time of the server on top of fastmcp",
+    )
+    args = parser.parse_args()
+
+    fastmcp_import = [import_seconds("fastmcp") for _ in range(args.runs)]
+    server_import = [
+        import_seconds("paperless_ngx_mcp.server", preloaded=("fastmcp",)) for _ in range(args.runs)
+    ]
+    tools_list = [first_tools_list_seconds() for _ in range(args.runs)]
+
+    print(_row("import fastmcp", fastmcp_import))
+    print(_row("import server (overhead)", server_import))
+    print(_row("spawn to tools/list", [elapsed for elapsed, _ in tools_list]))
+    print(f"{tools_list[0][1]} tools listed")
+
+    failed = False
+    overhead_ms = statistics.median(server_import) * 1000
+    if overhead_ms > args.budget_ms:
+        print(f"Import overhead {overhead_ms:.1f} ms exceeds the budget of {args.budget_ms} ms")
+        failed = True
+    loaded = loaded_deferred_modules()
+    if loaded:
+        print(f"Imported at startup but should be deferred: {', '.join(loaded)}")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
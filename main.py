@@ -1,8 +1,9 @@
 """Entry point for Paperless-NGX MCP Server."""
 
 import argparse
+import sys
 
-from paperless_ngx_mcp.server import main
+from paperless_ngx_mcp.server import main, rebuild_mirror
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Paperless-NGX MCP Server")
@@ -17,7 +18,15 @@ if __name__ == "__main__":
         default="127.0.0.1",
         help="Host to bind to (default: 127.0.0.1). Use 0.0.0.0 for Docker access.",
     )
+    parser.add_argument(
+        "--rebuild-mirror",
+        action="store_true",
+        help="Rebuild the local document mirror (PAPERLESS_MIRROR) from scratch and exit.",
+    )
 
     args = parser.parse_args()
-    main(port=args.port, host=args.host)
-
+    if args.rebuild_mirror:
+        count = rebuild_mirror()
+        print(f"Mirror rebuilt with {count} documents.", file=sys.stderr)
+    else:
+        main(port=args.port, host=args.host)
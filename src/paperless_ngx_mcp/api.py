@@ -1,75 +1,488 @@
 """Paperless-NGX API client."""
 
+import asyncio
+import json
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
-from .config import get_config
+from .coalesce import Singleflight, request_key
+from .config import Config, get_config
+from .http_cache import HttpCache, cache_key, get_http_cache
+from .metrics import endpoint_label, observe_upstream, start_span
+from .resilience import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    RetryPolicy,
+    is_overload,
+    is_retryable,
+    is_server_failure,
+)
 
 
-class PaperlessAPI:
-    """HTTP client for Paperless-NGX API."""
+def _client_options(config: Config) -> dict[str, Any]:
+    """Build the keyword arguments of the HTTP client."""
+    return {
+        "base_url": config.api_url,
+        "headers": config.auth_header,
+        "timeout": config.timeout,
+        "limits": httpx.Limits(
+            max_connections=config.http_max_connections,
+            max_keepalive_connections=config.http_max_keepalive_connections,
+            keepalive_expiry=config.http_keepalive_expiry,
+        ),
+        "http2": config.http2,
+    }
 
-    def __init__(self):
+
+def _http2_missing_error() -> Exception:
+    return Exception(
+        "PAPERLESS_HTTP2 is enabled but HTTP/2 support is not installed. "
+        "Install it with: uv pip install 'httpx[http2]'"
+    )
+
+
+def create_async_client(config: Config) -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client for the Paperless-NGX API.
+
+    Args:
+        config: Configuration with API URL, credentials and pool settings
+
+    Returns:
+        httpx.AsyncClient with keep-alive connection pooling
+
+    Raises:
+        Exception: If HTTP/2 is enabled but the h2 package is not installed
+    """
+    try:
+        return httpx.AsyncClient(**_client_options(config))
+    except ImportError as e:
+        raise _http2_missing_error() from e
+
+
+def endpoint_timeout(config: Config, path: str, params: dict[str, Any] | None) -> float:
+    """
+    Choose the timeout for a request.
+
+    Full-text and similarity searches get ``search_timeout``, autocomplete
+    gets the short ``autocomplete_timeout`` and everything else ``timeout``.
+
+    Args:
+        config: Configuration with timeout settings
+        path: API path of the request
+        params: Query parameters of the request
+
+    Returns:
+        Timeout in seconds
+    """
+    if path == "/api/search/autocomplete/":
+        return config.autocomplete_timeout
+    if path == "/api/documents/" and params and ("query" in params or "more_like_id" in params):
+        return config.search_timeout
+    return config.timeout
+
+
+def _api_error(
+    error: httpx.HTTPError,
+    api_url: str,
+    not_found_message: str | None = None,
+    timeout: float = 30.0,
+) -> Exception:
+    """
+    Translate an httpx error into a user-facing exception.
+
+    Args:
+        error: Error raised by httpx
+        api_url: Configured Paperless-NGX URL, used in connection errors
+        not_found_message: Message to use for 404 responses, if the endpoint
+            addresses a single resource
+        timeout: Timeout that applied to the request, used in timeout errors
+
+    Returns:
+        Exception with a readable message (to be raised ``from error``)
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        if status_code == 404 and not_found_message:
+            return Exception(not_found_message)
+        if status_code == 401:
+            return Exception(
+                f"Authentication failed. Check your PAPERLESS_API_TOKEN. Status: {status_code}"
+            )
+        return Exception(f"API request failed: {status_code} - {error.response.text}")
+    if isinstance(error, httpx.ConnectError):
+        return Exception(
+            f"Cannot connect to Paperless-NGX at {api_url}. Make sure the server is running."
+        )
+    if isinstance(error, httpx.TimeoutException):
+        return Exception(f"Request to Paperless-NGX timed out after {timeout:g}s.")
+    return Exception(f"API request failed: {error}")
+
+
+def _projection_params(fields: Sequence[str] | None, truncate_content: bool) -> dict[str, Any]:
+    """
+    Build query parameters that reduce the size of document list responses.
+
+    Args:
+        fields: Document fields to return; all fields if None
+        truncate_content: Whether Paperless-NGX should truncate ``content``
+
+    Returns:
+        Query parameters understood by the documents endpoint
+    """
+    params: dict[str, Any] = {}
+    if fields:
+        params["fields"] = ",".join(fields)
+    if truncate_content:
+        params["truncate_content"] = "true"
+    return params
+
+
+# Fields accepted by DocumentFilters.ordering (optionally prefixed with "-")
+ORDERING_FIELDS = (
+    "created",
+    "added",
+    "modified",
+    "title",
+    "archive_serial_number",
+    "correspondent__name",
+    "document_type__name",
+    "id",
+)
+
+
+@dataclass(slots=True)
+class DocumentFilters:
+    """
+    Structured filters on indexed document fields, combined with AND.
+
+    They map onto Paperless-NGX database filters, so a search using only
+    filters (no ``query``) never touches the full-text index.
+    """
+
+    # Documents must have all of these tags
+    tags: Sequence[int] = ()
+    # Documents must have one of these correspondents / document types
+    correspondents: Sequence[int] = ()
+    document_types: Sequence[int] = ()
+    # Inclusive ISO dates (YYYY-MM-DD)
+    created_from: str | None = None
+    created_to: str | None = None
+    added_from: str | None = None
+    added_to: str | None = None
+    archive_serial_number: int | None = None
+    # One of ORDERING_FIELDS, "-" prefix for descending order
+    ordering: str | None = None
+
+    def to_params(self) -> dict[str, Any]:
+        """
+        Build the query parameters for the documents endpoint.
+
+        Raises:
+            Exception: If ``ordering`` is not a supported field
+        """
+        params: dict[str, Any] = {}
+        if self.tags:
+            params["tags__id__all"] = ",".join(str(i) for i in self.tags)
+        if self.correspondents:
+            params["correspondent__id__in"] = ",".join(str(i) for i in self.correspondents)
+        if self.document_types:
+            params["document_type__id__in"] = ",".join(str(i) for i in self.document_types)
+        for name, value in (
+            ("created__date__gte", self.created_from),
+            ("created__date__lte", self.created_to),
+            ("added__date__gte", self.added_from),
+            ("added__date__lte", self.added_to),
+            ("archive_serial_number", self.archive_serial_number),
+        ):
+            if value is not None:
+                params[name] = value
+        if self.ordering:
+            if self.ordering.removeprefix("-") not in ORDERING_FIELDS:
+                raise Exception(
+                    f"Unsupported ordering {self.ordering!r}. "
+                    f"Use one of: {', '.join(ORDERING_FIELDS)} (prefix with '-' to reverse)."
+                )
+            params["ordering"] = self.ordering
+        return params
+
+
+def _search_params(
+    query: str,
+    page: int,
+    page_size: int,
+    fields: Sequence[str] | None,
+    truncate_content: bool,
+    filters: DocumentFilters | None,
+) -> dict[str, Any]:
+    """
+    Build the query parameters of a document search.
+
+    An empty ``query`` is left out, so Paperless-NGX lists documents through
+    its database filters instead of running a full-text search.
+    """
+    params: dict[str, Any] = {"page": page, "page_size": page_size}
+    if query:
+        params["query"] = query
+    if filters is not None:
+        params.update(filters.to_params())
+    params.update(_projection_params(fields, truncate_content))
+    return params
+
+
+class AsyncPaperlessAPI:
+    """Async HTTP client for Paperless-NGX API.
+
+    Built on ``httpx.AsyncClient`` so that many concurrent tool calls can
+    share one event loop. Every request goes
+    through the same resilience layer: an adaptive (AIMD) concurrency limit,
+    a circuit breaker that fails fast while Paperless-NGX is unhealthy,
+    jittered retries of transient failures and per-endpoint timeouts.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        singleflight: Singleflight | None = None,
+        breaker: CircuitBreaker | None = None,
+        retry: RetryPolicy | None = None,
+        http_cache: HttpCache | None = None,
+    ):
+        """
+        Create an async API wrapper.
+
+        Args:
+            client: Shared async HTTP client to use. If omitted, a private
+                client is created and closed together with this instance.
+            limiter: Concurrency limiter for outstanding requests. If omitted,
+                a private one is created from the configuration.
+            singleflight: Coalescer shared with other wrappers, so identical
+                concurrent GETs result in one upstream request. If omitted,
+                requests are not coalesced.
+            breaker: Circuit breaker shared with other wrappers. If omitted,
+                requests are always sent.
+            retry: Retry policy for transient failures. If omitted, a private
+                one is created from the configuration.
+            http_cache: Persistent response cache. If omitted, every request
+                is sent to Paperless-NGX.
+        """
         self.config = get_config()
-        self.client = httpx.Client(
-            base_url=self.config.api_url,
-            headers=self.config.auth_header,
-            timeout=30.0,
+        self._owns_client = client is None
+        self.client = client if client is not None else create_async_client(self.config)
+        self.limiter = limiter or _create_limiter(self.config)
+        self.singleflight = singleflight
+        self.breaker = breaker
+        self.retry = retry or RetryPolicy(self.config.retries, self.config.retry_backoff)
+        self.http_cache = http_cache
+
+    async def _fetch_json(
+        self, path: str, params: dict[str, Any] | None, use_http_cache: bool = True
+    ) -> Any:
+        """
+        Send a GET request, answering it from the persistent cache if possible.
+
+        A fresh cached response is returned without contacting Paperless-NGX.
+        A stale one is revalidated with its ``ETag``/``Last-Modified``
+        validators if it has any, and reused if Paperless-NGX answers 304.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker rejects the request
+            httpx.HTTPError: If the request fails after all retries
+        """
+        cache = self.http_cache if use_http_cache else None
+        if cache is None:
+            return (await self._request(path, params)).json()
+
+        key = cache_key(self.config, path, params)
+        cached = await asyncio.to_thread(cache.get, key)
+        if cached is not None and cache.is_fresh(cached):
+            cache.hits += 1
+            return json.loads(cached.body)
+        headers = cached.conditional_headers() if cached is not None else None
+        response = await self._request(path, params, headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            cache.revalidations += 1
+            await asyncio.to_thread(cache.refresh, key)
+            return json.loads(cached.body)
+        cache.misses += 1
+        data = response.json()
+        await asyncio.to_thread(
+            cache.put,
+            key,
+            path,
+            response.content,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
         )
+        return data
 
-    def search_documents(
-        self, query: str = "", page: int = 1, page_size: int = 25
+    async def _request(
+        self, path: str, params: dict[str, Any] | None, headers: dict[str, str] | None = None
+    ) -> httpx.Response:
+        """
+        Send a GET request through the resilience layer.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker rejects the request
+            httpx.HTTPError: If the request fails after all retries
+        """
+        timeout = endpoint_timeout(self.config, path, params)
+        attempt = 0
+        while True:
+            if self.breaker is not None:
+                self.breaker.before_call()
+            await self.limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = await self._send(path, params, timeout, attempt, headers)
+            except httpx.HTTPError as e:
+                self.limiter.release(time.monotonic() - started, overloaded=is_overload(e))
+                if self.breaker is not None:
+                    if is_server_failure(e):
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                if attempt >= self.retry.max_retries or not is_retryable(e):
+                    raise
+                attempt += 1
+                self.retry.retries += 1
+                await asyncio.sleep(self.retry.delay(attempt, e))
+                continue
+            except BaseException:
+                self.limiter.release(time.monotonic() - started)
+                raise
+            self.limiter.release(time.monotonic() - started)
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return response
+
+    async def _send(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        timeout: float,
+        attempt: int,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """
+        Send a single GET attempt, recording its latency, size and status.
+
+        A 304 response (to a conditional request) is returned, not raised.
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        endpoint = endpoint_label(path)
+        started = time.monotonic()
+        status: int | str = "cancelled"
+        size = 0
+        attributes = {"http.request.method": "GET", "url.path": path, "paperless.attempt": attempt}
+        with start_span(f"GET {endpoint}", attributes) as span:
+            try:
+                response = await self.client.get(
+                    path, params=params, headers=headers, timeout=timeout
+                )
+                status = response.status_code
+                size = len(response.content)
+                if span is not None:
+                    span.set_attribute("http.response.status_code", status)
+                if status != httpx.codes.NOT_MODIFIED:
+                    response.raise_for_status()
+                return response
+            except httpx.HTTPError as e:
+                if not isinstance(e, httpx.HTTPStatusError):
+                    status = type(e).__name__
+                raise
+            finally:
+                observe_upstream(endpoint, status, time.monotonic() - started, size)
+
+    async def _get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        not_found_message: str | None = None,
+        use_http_cache: bool = True,
+    ) -> Any:
+        """
+        Issue a GET request and return the decoded JSON body.
+
+        Identical requests already in flight are joined instead of repeated
+        when a singleflight coalescer is configured. The returned body may
+        then be shared with other callers and must not be modified. Requests
+        that bypass the persistent cache only join each other, so they never
+        receive a body it answered.
+
+        Args:
+            path: API path
+            params: Query parameters
+            not_found_message: Error message used for a 404 response
+            use_http_cache: Whether the persistent cache (if configured) may
+                answer the request; freshness checks opt out
+
+        Raises:
+            Exception: If the API request fails
+        """
+        try:
+            if self.singleflight is None:
+                return await self._fetch_json(path, params, use_http_cache)
+            key = request_key("GET", path, params)
+            return await self.singleflight.do(
+                key if use_http_cache else (key, "no-cache"),
+                lambda: self._fetch_json(path, params, use_http_cache),
+            )
+        except httpx.HTTPError as e:
+            timeout = endpoint_timeout(self.config, path, params)
+            raise _api_error(e, self.config.api_url, not_found_message, timeout) from e
+
+    async def search_documents(
+        self,
+        query: str = "",
+        page: int = 1,
+        page_size: int = 25,
+        fields: Sequence[str] | None = None,
+        truncate_content: bool = False,
+        filters: DocumentFilters | None = None,
     ) -> dict[str, Any]:
         """
         Search Paperless-NGX documents.
 
         Args:
-            query: Search query string
+            query: Full-text search query; empty to list documents by ``filters`` only
             page: Page number (1-indexed)
             page_size: Number of results per page
+            fields: Only return these document fields (server-side projection)
+            truncate_content: Ask Paperless-NGX to shorten ``content`` to a preview
+            filters: Structured filters on tags, correspondents, dates etc.
 
         Returns:
             API response with documents and pagination info
 
         Raises:
-            httpx.HTTPError: If API request fails
+            Exception: If API request fails
         """
-        params = {
-            "query": query,
-            "page": page,
-            "page_size": page_size,
-        }
+        params = _search_params(query, page, page_size, fields, truncate_content, filters)
+        return await self._get("/api/documents/", params=params)
 
-        try:
-            response = self.client.get("/api/documents/", params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise Exception(
-                    f"Authentication failed. Check your PAPERLESS_API_TOKEN. "
-                    f"Status: {e.response.status_code}"
-                ) from e
-            raise Exception(
-                f"API request failed: {e.response.status_code} - {e.response.text}"
-            ) from e
-        except httpx.ConnectError as e:
-            raise Exception(
-                f"Cannot connect to Paperless-NGX at {self.config.api_url}. "
-                f"Make sure the server is running."
-            ) from e
-        except httpx.TimeoutException as e:
-            raise Exception(
-                "Request to Paperless-NGX timed out after 30s."
-            ) from e
-
-    def get_document(self, document_id: int) -> dict[str, Any]:
+    async def get_document(
+        self,
+        document_id: int,
+        fields: Sequence[str] | None = None,
+        use_http_cache: bool = True,
+    ) -> dict[str, Any]:
         """
         Get a single document by ID.
 
         Args:
             document_id: Document ID to retrieve
+            fields: Only return these document fields (server-side projection)
+            use_http_cache: Whether the persistent cache (if configured) may
+                answer the request. Pass False once the document is known to
+                have changed; its stored responses are then evicted too.
 
         Returns:
             API response with complete document details
@@ -77,35 +490,100 @@ class PaperlessAPI:
         Raises:
             Exception: If document not found or API request fails
         """
-        try:
-            response = self.client.get(f"/api/documents/{document_id}/")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise Exception(
-                    f"Document with ID {document_id} not found."
-                ) from e
-            if e.response.status_code == 401:
-                raise Exception(
-                    f"Authentication failed. Check your PAPERLESS_API_TOKEN. "
-                    f"Status: {e.response.status_code}"
-                ) from e
-            raise Exception(
-                f"API request failed: {e.response.status_code} - {e.response.text}"
-            ) from e
-        except httpx.ConnectError as e:
-            raise Exception(
-                f"Cannot connect to Paperless-NGX at {self.config.api_url}. "
-                f"Make sure the server is running."
-            ) from e
-        except httpx.TimeoutException as e:
-            raise Exception(
-                "Request to Paperless-NGX timed out after 30s."
-            ) from e
-
-    def get_similar_documents(
-        self, document_id: int, page: int = 1, page_size: int = 25
+        path = f"/api/documents/{document_id}/"
+        if not use_http_cache and self.http_cache is not None:
+            await asyncio.to_thread(self.http_cache.invalidate_paths, [path])
+        return await self._get(
+            path,
+            params=_projection_params(fields, truncate_content=False) or None,
+            not_found_message=f"Document with ID {document_id} not found.",
+            use_http_cache=use_http_cache,
+        )
+
+    async def list_documents(self, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Get one page of the documents endpoint with arbitrary query parameters.
+
+        Args:
+            params: Filter, ordering, projection and pagination parameters
+
+        Returns:
+            API response with documents and pagination info
+
+        Raises:
+            Exception: If API request fails
+        """
+        return await self._get("/api/documents/", params=params)
+
+    async def get_documents(
+        self,
+        document_ids: Sequence[int],
+        fields: Sequence[str] | None = None,
+        truncate_content: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Get many documents by ID using the ``id__in`` filter.
+
+        IDs are requested in chunks of up to 100 per request, and chunks are
+        fetched concurrently. Documents that do not exist (or are not visible
+        to the API token) are simply absent from the result.
+
+        Args:
+            document_ids: Document IDs to retrieve
+            fields: Only return these document fields (server-side projection)
+            truncate_content: Ask Paperless-NGX to shorten ``content`` to a preview
+
+        Returns:
+            Document details for every ID that was found, in no particular order
+
+        Raises:
+            Exception: If API request fails
+        """
+        unique_ids = list(dict.fromkeys(document_ids))
+        chunks = [unique_ids[i : i + 100] for i in range(0, len(unique_ids), 100)]
+        projection = _projection_params(fields, truncate_content)
+        pages = await asyncio.gather(
+            *(
+                self.list_all(
+                    "/api/documents/",
+                    params={"id__in": ",".join(str(i) for i in chunk), **projection},
+                    page_size=len(chunk),
+                )
+                for chunk in chunks
+            )
+        )
+        return [doc for page in pages for doc in page]
+
+    async def get_document_modified(self, document_id: int) -> str | None:
+        """
+        Get only the ``modified`` timestamp of a document.
+
+        Used to revalidate cached documents without downloading their content.
+
+        Args:
+            document_id: Document ID to check
+
+        Returns:
+            ISO timestamp of the last modification, or None if not reported
+
+        Raises:
+            Exception: If document not found or API request fails
+        """
+        response = await self._get(
+            f"/api/documents/{document_id}/",
+            params={"fields": "id,modified"},
+            not_found_message=f"Document with ID {document_id} not found.",
+            use_http_cache=False,
+        )
+        return response.get("modified")
+
+    async def get_similar_documents(
+        self,
+        document_id: int,
+        page: int = 1,
+        page_size: int = 25,
+        fields: Sequence[str] | None = None,
+        truncate_content: bool = False,
     ) -> dict[str, Any]:
         """
         Find documents similar to a given document.
@@ -114,6 +592,8 @@ class PaperlessAPI:
             document_id: Reference document ID
             page: Page number (1-indexed)
             page_size: Number of results per page
+            fields: Only return these document fields (server-side projection)
+            truncate_content: Ask Paperless-NGX to shorten ``content`` to a preview
 
         Returns:
             API response with similar documents and pagination info
@@ -125,69 +605,70 @@ class PaperlessAPI:
             "more_like_id": document_id,
             "page": page,
             "page_size": page_size,
+            **_projection_params(fields, truncate_content),
         }
+        return await self._get(
+            "/api/documents/",
+            params=params,
+            not_found_message=f"Reference document with ID {document_id} not found.",
+        )
 
-        try:
-            response = self.client.get("/api/documents/", params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise Exception(
-                    f"Reference document with ID {document_id} not found."
-                ) from e
-            if e.response.status_code == 401:
-                raise Exception(
-                    f"Authentication failed. Check your PAPERLESS_API_TOKEN. "
-                    f"Status: {e.response.status_code}"
-                ) from e
-            raise Exception(
-                f"API request failed: {e.response.status_code} - {e.response.text}"
-            ) from e
-        except httpx.ConnectError as e:
-            raise Exception(
-                f"Cannot connect to Paperless-NGX at {self.config.api_url}. "
-                f"Make sure the server is running."
-            ) from e
-        except httpx.TimeoutException as e:
-            raise Exception(
-                "Request to Paperless-NGX timed out after 30s."
-            ) from e
-
-    def list_tags(self) -> dict[str, Any]:
-        """
-        Get all tags from Paperless-NGX.
+    async def list_all(
+        self, path: str, params: dict[str, Any] | None = None, page_size: int = 100
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch every page of a paginated list endpoint.
+
+        The first page reveals the total ``count``; the remaining pages are
+        then requested concurrently, at most ``pagination_concurrency`` at a
+        time.
+
+        Args:
+            path: API path of the list endpoint (e.g. "/api/tags/")
+            params: Additional query parameters (filters)
+            page_size: Number of results requested per page
 
         Returns:
-            API response with all tags
+            All results of the endpoint, in API order
 
         Raises:
-            httpx.HTTPError: If API request fails
+            Exception: If any API request fails
         """
-        try:
-            response = self.client.get("/api/tags/")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise Exception(
-                    f"Authentication failed. Check your PAPERLESS_API_TOKEN. "
-                    f"Status: {e.response.status_code}"
-                ) from e
-            raise Exception(
-                f"API request failed: {e.response.status_code} - {e.response.text}"
-            ) from e
-        except httpx.ConnectError as e:
-            raise Exception(
-                f"Cannot connect to Paperless-NGX at {self.config.api_url}. "
-                f"Make sure the server is running."
-            ) from e
-        except httpx.TimeoutException as e:
-            raise Exception(
-                "Request to Paperless-NGX timed out after 30s."
-            ) from e
-
-    def autocomplete_search(self, term: str, limit: int = 10) -> list[str]:
+        params = params or {}
+        first = await self._get(path, params={**params, "page": 1, "page_size": page_size})
+        results: list[dict[str, Any]] = list(first.get("results", []))
+        if not first.get("next"):
+            return results
+
+        page_count = -(-first.get("count", 0) // page_size)
+        semaphore = asyncio.Semaphore(self.config.pagination_concurrency)
+
+        async def fetch_page(page: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                response = await self._get(
+                    path, params={**params, "page": page, "page_size": page_size}
+                )
+            return response.get("results", [])
+
+        pages = await asyncio.gather(*(fetch_page(page) for page in range(2, page_count + 1)))
+        for page_results in pages:
+            results.extend(page_results)
+        return results
+
+    async def list_tags(self) -> dict[str, Any]:
+        """
+        Get all tags from Paperless-NGX, across all result pages.
+
+        Returns:
+            API response shape with ``count`` and all tags in ``results``
+
+        Raises:
+            Exception: If API request fails
+        """
+        results = await self.list_all("/api/tags/")
+        return {"count": len(results), "next": None, "previous": None, "results": results}
+
+    async def autocomplete_search(self, term: str, limit: int = 10) -> list[str]:
         """
         Get search term autocomplete suggestions.
 
@@ -199,42 +680,121 @@ class PaperlessAPI:
             List of suggested search terms
 
         Raises:
-            httpx.HTTPError: If API request fails
+            Exception: If API request fails
         """
         params = {
             "term": term,
             "limit": limit,
         }
+        return await self._get("/api/search/autocomplete/", params=params)
 
-        try:
-            response = self.client.get("/api/search/autocomplete/", params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise Exception(
-                    f"Authentication failed. Check your PAPERLESS_API_TOKEN. "
-                    f"Status: {e.response.status_code}"
-                ) from e
-            raise Exception(
-                f"API request failed: {e.response.status_code} - {e.response.text}"
-            ) from e
-        except httpx.ConnectError as e:
-            raise Exception(
-                f"Cannot connect to Paperless-NGX at {self.config.api_url}. "
-                f"Make sure the server is running."
-            ) from e
-        except httpx.TimeoutException as e:
-            raise Exception(
-                "Request to Paperless-NGX timed out after 30s."
-            ) from e
-
-    def close(self):
-        """Close the HTTP client."""
-        self.client.close()
-
-    def __enter__(self):
+    async def aclose(self):
+        """Close the HTTP client, unless it is shared with other instances."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+# Process-wide pooled clients, opened and closed by the server lifespan
+_shared_async_client: httpx.AsyncClient | None = None
+_shared_limiter: AdaptiveLimiter | None = None
+_shared_singleflight: Singleflight | None = None
+_shared_breaker: CircuitBreaker | None = None
+_shared_retry: RetryPolicy | None = None
+
+
+def _create_limiter(config: Config) -> AdaptiveLimiter:
+    return AdaptiveLimiter(
+        max_limit=config.max_concurrent_requests,
+        min_limit=config.min_concurrent_requests,
+        latency_target=config.latency_target,
+    )
+
+
+def open_shared_async_client() -> httpx.AsyncClient:
+    """Open the process-wide pooled async HTTP client if it is not open yet."""
+    global _shared_async_client, _shared_limiter, _shared_singleflight
+    global _shared_breaker, _shared_retry
+    if _shared_async_client is None or _shared_async_client.is_closed:
+        config = get_config()
+        _shared_async_client = create_async_client(config)
+        _shared_limiter = _create_limiter(config)
+        if config.coalesce_requests and _shared_singleflight is None:
+            _shared_singleflight = Singleflight()
+        if config.circuit_breaker_enabled and _shared_breaker is None:
+            _shared_breaker = CircuitBreaker(
+                failure_threshold=config.circuit_failure_threshold,
+                reset_timeout=config.circuit_reset_timeout,
+            )
+        if _shared_retry is None:
+            _shared_retry = RetryPolicy(config.retries, config.retry_backoff)
+    return _shared_async_client
+
+
+async def close_shared_async_client() -> None:
+    """Close the process-wide pooled async HTTP client and its connections."""
+    global _shared_async_client, _shared_limiter
+    if _shared_async_client is not None:
+        await _shared_async_client.aclose()
+        _shared_async_client = None
+        _shared_limiter = None
+
+
+def get_async_api(coalesce: bool = True, http_cache: bool = True) -> AsyncPaperlessAPI:
+    """
+    Get an async API wrapper bound to the process-wide pooled async client.
+
+    All wrappers share one concurrency limiter, so the total number of
+    outstanding Paperless-NGX requests stays bounded across sessions, and one
+    request coalescer, so identical concurrent requests are sent only once.
+
+    Args:
+        coalesce: Whether to join identical in-flight requests. Background
+            work that may be cancelled (e.g. prefetching) opts out, so that
+            cancelling it really cancels its requests.
+        http_cache: Whether the persistent HTTP cache (if enabled) may answer
+            requests. Work that must see the current state of Paperless-NGX
+            (e.g. mirror syncs) opts out.
+    """
+    client = open_shared_async_client()
+    return AsyncPaperlessAPI(
+        client=client,
+        limiter=_shared_limiter,
+        singleflight=_shared_singleflight if coalesce else None,
+        breaker=_shared_breaker,
+        retry=_shared_retry,
+        http_cache=get_http_cache() if http_cache else None,
+    )
+
+
+def upstream_busy() -> bool:
+    """
+    Whether Paperless-NGX has no spare capacity for optional requests.
+
+    True while the circuit breaker is not closed or at least half of the
+    adaptive concurrency limit is in use.
+    """
+    if _shared_breaker is not None and _shared_breaker.state != "closed":
+        return True
+    return _shared_limiter is not None and _shared_limiter.in_flight * 2 >= _shared_limiter.limit
+
+
+def get_coalescing_stats() -> dict[str, Any] | None:
+    """Return request coalescing counters, or None if coalescing is disabled."""
+    if _shared_singleflight is None:
+        return None
+    return _shared_singleflight.stats()
+
+
+def get_resilience_stats() -> dict[str, Any]:
+    """Return concurrency limit, circuit breaker and retry counters."""
+    return {
+        "concurrency": _shared_limiter.stats() if _shared_limiter is not None else None,
+        "circuit_breaker": _shared_breaker.stats() if _shared_breaker is not None else None,
+        "retries": _shared_retry.retries if _shared_retry is not None else 0,
+    }
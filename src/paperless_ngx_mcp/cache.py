@@ -0,0 +1,420 @@
+"""In-process caches for Paperless-NGX responses."""
+
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from .config import get_config
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached value with its bookkeeping data."""
+
+    value: Any
+    size: int
+    stored_at: float
+    version: Any = None
+
+
+@dataclass(slots=True)
+class ResultSnapshot:
+    """The ordered document IDs of a search result, frozen at one point in time."""
+
+    ids: array
+    query: str
+    # Whether the IDs are in full-text relevance order, so a position is a rank
+    ranked: bool = False
+
+    @property
+    def size(self) -> int:
+        """Approximate memory footprint in bytes."""
+        return self.ids.itemsize * len(self.ids) + len(self.query) + 128
+
+
+class LRUCache:
+    """
+    Bounded LRU cache with a time-to-live.
+
+    Entries are evicted least-recently-used first once either ``max_entries``
+    or ``max_bytes`` is exceeded. Expired entries are not returned by ``get``
+    but stay available through ``peek`` until evicted, so callers can
+    revalidate them cheaply against their ``version`` (e.g. the document's
+    ``modified`` timestamp) instead of refetching them.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        """
+        Create a cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum total size of all entries in bytes
+            ttl: Seconds an entry is served without revalidation
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[Any, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        return time.monotonic() - entry.stored_at < self.ttl
+
+    def get(self, key: Any) -> Any | None:
+        """
+        Return a fresh cached value, or None on a miss or expired entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if present and within its TTL, otherwise None
+        """
+        entry = self._entries.get(key)
+        if entry is None or not self._is_fresh(entry):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def peek(self, key: Any) -> CacheEntry | None:
+        """Return the entry for a key even if it has expired, without counting it."""
+        return self._entries.get(key)
+
+    def set(self, key: Any, value: Any, version: Any = None, size: int | None = None) -> None:
+        """
+        Store a value, evicting least-recently-used entries as needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            version: Opaque version tag used for revalidation
+            size: Size in bytes; estimated from the value if omitted
+        """
+        if size is None:
+            size = _estimate_size(value)
+        self.invalidate(key)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        self._entries[key] = CacheEntry(value, size, time.monotonic(), version)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def touch(self, key: Any) -> None:
+        """Mark an entry as revalidated, restarting its TTL."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.stored_at = time.monotonic()
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+
+    def invalidate(self, key: Any) -> None:
+        """Remove a single entry if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters and current usage."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+@dataclass(slots=True)
+class _TrieNode:
+    """A prefix in the autocomplete trie, with the suggestions stored for it (if any)."""
+
+    children: dict[str, "_TrieNode"] = field(default_factory=dict)
+    suggestions: list[str] | None = None
+    limit: int = 0
+    stored_at: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        """Whether the suggestions are all indexed terms with this prefix."""
+        return self.suggestions is not None and len(self.suggestions) < self.limit
+
+
+class AutocompleteCache:
+    """
+    Autocomplete suggestions stored in a prefix trie, expired after a TTL.
+
+    Clients ask for suggestions of ever longer prefixes as a word is typed
+    ("inv", "invo", "invoi"). A repeated term is answered from its stored
+    suggestions. Once a prefix returned fewer suggestions than its limit,
+    they are all indexed terms with that prefix, so the suggestions of any
+    longer one-word term are found by filtering them, as Paperless-NGX would:
+    matching terms in the stored order, with the term itself first.
+
+    Terms are compared in lower case, as Paperless-NGX does.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        """
+        Create a cache.
+
+        Args:
+            max_entries: Maximum number of terms stored; least recently used are evicted
+            ttl: Seconds suggestions are used before asking Paperless-NGX again
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._root = _TrieNode()
+        self._entries: OrderedDict[str, _TrieNode] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.refinements = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_fresh(self, node: _TrieNode) -> bool:
+        return node.suggestions is not None and time.monotonic() - node.stored_at < self.ttl
+
+    def get(self, term: str, limit: int) -> list[str] | None:
+        """
+        Return the suggestions for a term from the cache, or None on a miss.
+
+        Args:
+            term: Partial search term
+            limit: Maximum number of suggestions
+
+        Returns:
+            Suggestions, from the term's own entry or filtered from those of
+            a shorter prefix, or None if neither is available
+        """
+        key = term.lower()
+        node = self._entries.get(key)
+        if node is not None and self._is_fresh(node) and (node.complete or node.limit >= limit):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return node.suggestions[:limit]
+
+        # Suggestions for several words are not a prefix filter of shorter terms
+        if key and not any(c.isspace() for c in key):
+            prefix = self._complete_prefix(key)
+            if prefix is not None:
+                suggestions = [s for s in prefix.suggestions if s.startswith(key)]
+                if key in suggestions:
+                    suggestions.remove(key)
+                    suggestions.insert(0, key)
+                self.hits += 1
+                self.refinements += 1
+                return suggestions[:limit]
+
+        self.misses += 1
+        return None
+
+    def _complete_prefix(self, key: str) -> _TrieNode | None:
+        """Return the longest proper prefix of ``key`` with fresh, complete suggestions."""
+        best = None
+        node = self._root
+        for char in key[:-1]:
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.complete and self._is_fresh(node):
+                best = node
+        return best
+
+    def set(self, term: str, limit: int, suggestions: list[str]) -> None:
+        """
+        Store the suggestions Paperless-NGX returned for a term.
+
+        Args:
+            term: Partial search term
+            limit: Limit the suggestions were requested with
+            suggestions: Suggestions, best first
+        """
+        if self.max_entries <= 0:
+            return
+        key = term.lower()
+        self._remove(key)
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        node.suggestions = list(suggestions)
+        node.limit = limit
+        node.stored_at = time.monotonic()
+        self._entries[key] = node
+        self._bytes += _suggestions_size(key, node.suggestions)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Drop a term's suggestions and prune trie nodes left empty."""
+        node = self._entries.pop(key, None)
+        if node is None:
+            return
+        self._bytes -= _suggestions_size(key, node.suggestions)
+        node.suggestions = None
+        path = [self._root]
+        for char in key:
+            path.append(path[-1].children[char])
+        for depth in range(len(key), 0, -1):
+            node = path[depth]
+            if node.children or node.suggestions is not None:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+
+    def clear(self) -> None:
+        """Remove all suggestions (counters are kept)."""
+        self._root = _TrieNode()
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters and current usage."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "refinements": self.refinements,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def _suggestions_size(key: str, suggestions: list[str]) -> int:
+    """Approximate the size of a term's suggestions in bytes."""
+    return len(key) + sum(len(s) for s in suggestions)
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory footprint of a cached value in bytes."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, bytes):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+# Global cache of formatted single-document results
+document_cache: LRUCache | None = None
+
+
+def get_document_cache() -> LRUCache | None:
+    """Get or create the document cache, or None if it is disabled."""
+    global document_cache
+    config = get_config()
+    if not config.document_cache_enabled:
+        return None
+    if document_cache is None:
+        document_cache = LRUCache(
+            max_entries=config.document_cache_max_entries,
+            max_bytes=config.document_cache_max_bytes,
+            ttl=config.document_cache_ttl,
+        )
+    return document_cache
+
+
+# Global cache of raw document content, keyed by document ID
+content_cache: LRUCache | None = None
+
+
+def get_content_cache() -> LRUCache | None:
+    """Get or create the document content cache, or None if caching is disabled."""
+    global content_cache
+    config = get_config()
+    if not config.document_cache_enabled:
+        return None
+    if content_cache is None:
+        content_cache = LRUCache(
+            max_entries=config.document_cache_max_entries,
+            max_bytes=config.content_cache_max_bytes,
+            ttl=config.document_cache_ttl,
+        )
+    return content_cache
+
+
+# Global cache of complete list results, keyed by endpoint
+list_cache: LRUCache | None = None
+
+
+def get_list_cache() -> LRUCache | None:
+    """Get or create the list result cache, or None if it is disabled."""
+    global list_cache
+    config = get_config()
+    if config.list_cache_ttl <= 0:
+        return None
+    if list_cache is None:
+        list_cache = LRUCache(max_entries=64, max_bytes=16 * 1024 * 1024, ttl=config.list_cache_ttl)
+    return list_cache
+
+
+# Global store of search result snapshots, keyed by snapshot ID
+snapshot_cache: LRUCache | None = None
+
+
+def get_snapshot_cache() -> LRUCache | None:
+    """Get or create the result snapshot store, or None if snapshots are disabled."""
+    global snapshot_cache
+    config = get_config()
+    if config.snapshot_ttl <= 0:
+        return None
+    if snapshot_cache is None:
+        snapshot_cache = LRUCache(
+            max_entries=config.snapshot_max_entries,
+            max_bytes=config.snapshot_max_bytes,
+            ttl=config.snapshot_ttl,
+        )
+    return snapshot_cache
+
+
+# Global cache of autocomplete suggestions, keyed by term prefix
+autocomplete_cache: AutocompleteCache | None = None
+
+
+def get_autocomplete_cache() -> AutocompleteCache | None:
+    """Get or create the autocomplete cache, or None if it is disabled."""
+    global autocomplete_cache
+    config = get_config()
+    if config.autocomplete_cache_ttl <= 0:
+        return None
+    if autocomplete_cache is None:
+        autocomplete_cache = AutocompleteCache(
+            max_entries=config.autocomplete_cache_max_entries,
+            ttl=config.autocomplete_cache_ttl,
+        )
+    return autocomplete_cache
@@ -0,0 +1,62 @@
+"""Coalescing of identical in-flight requests (singleflight)."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class Singleflight:
+    """
+    Share one execution among concurrent calls with the same key.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task instead of starting their own. The
+    task is shielded, so a cancelled caller does not cancel the work for the
+    others. All callers receive the same result object, which must therefore
+    be treated as read-only.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``fn`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the work (e.g. method, path and parameters)
+            fn: Coroutine function performing the work
+
+        Returns:
+            The result of ``fn``, shared between coalesced callers
+
+        Raises:
+            Exception: Whatever ``fn`` raised, re-raised in every caller
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, Any]:
+        """Return how many requests were executed and how many were coalesced."""
+        total = self.executed + self.coalesced
+        return {
+            "in_flight": len(self._inflight),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalesced_ratio": round(self.coalesced / total, 4) if total else 0.0,
+        }
+
+
+def request_key(method: str, path: str, params: dict[str, Any] | None) -> Hashable:
+    """Build a singleflight key from a request's method, path and parameters."""
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return (method, path, items)
@@ -5,9 +5,41 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Load .env file from project root
+# .env file in the project root, loaded when the configuration is first needed
 env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+
+# Encodings of tool results (see models.encode)
+OUTPUT_FORMATS = ("pretty", "compact", "columnar")
+
+
+def _get_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to a default."""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError as e:
+        raise ValueError(f"{name} must be an integer, got {value!r}.") from e
+
+
+def _get_float(name: str, default: float) -> float:
+    """Read a float environment variable, falling back to a default."""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except ValueError as e:
+        raise ValueError(f"{name} must be a number, got {value!r}.") from e
+
+
+def _get_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable (1/true/yes/on), falling back to a default."""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
 
 
 class Config:
@@ -23,6 +55,116 @@ class Config:
                 "Set it to your Paperless-NGX API token."
             )
 
+        # HTTP connection pool shared by all tool calls
+        self.http_max_connections = _get_int("PAPERLESS_HTTP_MAX_CONNECTIONS", 20)
+        self.http_max_keepalive_connections = _get_int(
+            "PAPERLESS_HTTP_MAX_KEEPALIVE_CONNECTIONS", 10
+        )
+        self.http_keepalive_expiry = _get_float("PAPERLESS_HTTP_KEEPALIVE_EXPIRY", 30.0)
+        self.http2 = _get_bool("PAPERLESS_HTTP2", False)
+
+        # Per-endpoint request timeouts in seconds
+        self.timeout = _get_float("PAPERLESS_TIMEOUT", 15.0)
+        self.search_timeout = _get_float("PAPERLESS_SEARCH_TIMEOUT", 30.0)
+        self.autocomplete_timeout = _get_float("PAPERLESS_AUTOCOMPLETE_TIMEOUT", 5.0)
+
+        # Retries of transient failures (connection errors, 429/502/503/504)
+        self.retries = _get_int("PAPERLESS_RETRIES", 2)
+        self.retry_backoff = _get_float("PAPERLESS_RETRY_BACKOFF", 0.25)
+
+        # Fail fast after repeated server failures
+        self.circuit_breaker_enabled = _get_bool("PAPERLESS_CIRCUIT_BREAKER", True)
+        self.circuit_failure_threshold = _get_int("PAPERLESS_CIRCUIT_FAILURE_THRESHOLD", 5)
+        self.circuit_reset_timeout = _get_float("PAPERLESS_CIRCUIT_RESET_TIMEOUT", 30.0)
+
+        # Adaptive (AIMD) bound on requests in flight towards Paperless-NGX
+        self.max_concurrent_requests = _get_int("PAPERLESS_MAX_CONCURRENT_REQUESTS", 10)
+        self.min_concurrent_requests = _get_int("PAPERLESS_MIN_CONCURRENT_REQUESTS", 1)
+        self.latency_target = _get_float("PAPERLESS_LATENCY_TARGET", 5.0)
+        # Share one upstream request between identical concurrent requests
+        self.coalesce_requests = _get_bool("PAPERLESS_COALESCE_REQUESTS", True)
+        # Pages fetched in parallel when reading a complete list endpoint
+        self.pagination_concurrency = _get_int("PAPERLESS_PAGINATION_CONCURRENCY", 4)
+
+        # In-memory cache of get_document results
+        self.document_cache_enabled = _get_bool("PAPERLESS_DOCUMENT_CACHE", True)
+        self.document_cache_max_entries = _get_int("PAPERLESS_DOCUMENT_CACHE_MAX_ENTRIES", 256)
+        self.document_cache_max_bytes = _get_int(
+            "PAPERLESS_DOCUMENT_CACHE_MAX_BYTES", 64 * 1024 * 1024
+        )
+        self.document_cache_ttl = _get_float("PAPERLESS_DOCUMENT_CACHE_TTL", 300.0)
+        # Raw text buffers served in windows by get_document_content
+        self.content_cache_max_bytes = _get_int(
+            "PAPERLESS_CONTENT_CACHE_MAX_BYTES", 128 * 1024 * 1024
+        )
+
+        # Tag/correspondent/document type name resolution
+        self.metadata_cache_enabled = _get_bool("PAPERLESS_METADATA_CACHE", True)
+        self.metadata_refresh_interval = _get_float("PAPERLESS_METADATA_REFRESH_INTERVAL", 300.0)
+
+        # Cache for complete list results (e.g. list_tags); 0 disables it
+        self.list_cache_ttl = _get_float("PAPERLESS_LIST_CACHE_TTL", 60.0)
+
+        # Autocomplete suggestions, refined locally for longer prefixes; TTL 0 disables it
+        self.autocomplete_cache_ttl = _get_float("PAPERLESS_AUTOCOMPLETE_CACHE_TTL", 300.0)
+        self.autocomplete_cache_max_entries = _get_int(
+            "PAPERLESS_AUTOCOMPLETE_CACHE_MAX_ENTRIES", 1024
+        )
+
+        # Persistent on-disk cache of GET responses, shared across restarts
+        self.http_cache_enabled = _get_bool("PAPERLESS_HTTP_CACHE", False)
+        self.http_cache_dir = os.getenv(
+            "PAPERLESS_HTTP_CACHE_DIR", str(Path.home() / ".cache" / "paperless-ngx-mcp")
+        )
+        self.http_cache_max_bytes = _get_int("PAPERLESS_HTTP_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+        self.http_cache_ttl = _get_float("PAPERLESS_HTTP_CACHE_TTL", 300.0)
+
+        # Background polling for changed documents and metadata, evicting stale cache entries
+        self.watcher_enabled = _get_bool("PAPERLESS_WATCHER", False)
+        self.watcher_interval = _get_float("PAPERLESS_WATCHER_INTERVAL", 30.0)
+
+        # Frozen search result ID lists for consistent pagination; TTL 0 disables them
+        self.snapshot_ttl = _get_float("PAPERLESS_SNAPSHOT_TTL", 600.0)
+        self.snapshot_max_entries = _get_int("PAPERLESS_SNAPSHOT_MAX_ENTRIES", 128)
+        self.snapshot_max_bytes = _get_int("PAPERLESS_SNAPSHOT_MAX_BYTES", 16 * 1024 * 1024)
+
+        # Most groups document_stats counts with one request each
+        self.stats_max_buckets = _get_int("PAPERLESS_STATS_MAX_BUCKETS", 200)
+
+        # Most similarity searches similarity_graph makes per call
+        self.similarity_max_requests = _get_int("PAPERLESS_SIMILARITY_MAX_REQUESTS", 50)
+
+        # Bulk exports spooled to NDJSON files (default: a private dir in the system temp dir)
+        self.export_dir = os.getenv("PAPERLESS_EXPORT_DIR") or None
+        self.export_ttl = _get_float("PAPERLESS_EXPORT_TTL", 3600.0)
+        self.export_max_exports = _get_int("PAPERLESS_EXPORT_MAX_EXPORTS", 16)
+        self.export_max_documents = _get_int("PAPERLESS_EXPORT_MAX_DOCUMENTS", 10000)
+
+        # Speculative prefetching of the next search/similar-documents page
+        self.prefetch_enabled = _get_bool("PAPERLESS_PREFETCH", False)
+        self.prefetch_max_in_flight = _get_int("PAPERLESS_PREFETCH_MAX_IN_FLIGHT", 2)
+        self.prefetch_ttl = _get_float("PAPERLESS_PREFETCH_TTL", 30.0)
+
+        # Local SQLite/FTS5 mirror used to answer searches without Paperless-NGX
+        self.mirror_enabled = _get_bool("PAPERLESS_MIRROR", False)
+        self.mirror_path = os.getenv(
+            "PAPERLESS_MIRROR_PATH", str(Path.home() / ".cache" / "paperless-ngx-mcp" / "mirror.db")
+        )
+        self.mirror_sync_interval = _get_float("PAPERLESS_MIRROR_SYNC_INTERVAL", 300.0)
+        self.mirror_autocomplete = _get_bool("PAPERLESS_MIRROR_AUTOCOMPLETE", False)
+
+        # Encoding of tool results: indented, compact or compact with tabular lists
+        self.output_format = os.getenv("PAPERLESS_OUTPUT_FORMAT", "pretty").strip().lower()
+        if self.output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"PAPERLESS_OUTPUT_FORMAT must be one of {', '.join(OUTPUT_FORMATS)}, "
+                f"got {self.output_format!r}."
+            )
+
+        # Prometheus metrics (needs prometheus-client) and OpenTelemetry spans
+        self.metrics_enabled = _get_bool("PAPERLESS_METRICS", True)
+        self.otel_enabled = _get_bool("PAPERLESS_OTEL", False)
+
     @property
     def auth_header(self) -> dict[str, str]:
         """Return the authorization header for API requests."""
@@ -34,8 +176,9 @@ config: Config | None = None
 
 
 def get_config() -> Config:
-    """Get or create the global config instance."""
+    """Get or create the global config instance, loading the .env file on first use."""
     global config
     if config is None:
+        load_dotenv(dotenv_path=env_path)
         config = Config()
     return config
@@ -0,0 +1,240 @@
+"""Spooled NDJSON exports of large document sets, read back in chunks."""
+
+import json
+import os
+import secrets
+import shutil
+import stat
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .config import get_config
+
+# Records per chunk of export_documents results
+DEFAULT_EXPORT_CHUNK = 50
+MAX_EXPORT_CHUNK = 500
+
+# URI template of export chunks served as MCP resources
+EXPORT_RESOURCE_TEMPLATE = "paperless://exports/{export_id}/chunks/{chunk}"
+
+# Export files are never opened through a symlink (where the platform allows)
+_O_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+
+@dataclass(slots=True)
+class Export:
+    """An NDJSON export file and the byte offsets of its chunks."""
+
+    export_id: str
+    path: Path
+    chunk_size: int
+    count: int = 0
+    size: int = 0
+    complete: bool = False
+    # Monotonic time the export was finished
+    finished_at: float = 0.0
+    chunk_offsets: list[int] = field(default_factory=list)
+
+    @property
+    def chunk_count(self) -> int:
+        """Number of chunks written so far."""
+        return len(self.chunk_offsets)
+
+
+class ExportStore:
+    """
+    Export files on disk, expired after a TTL.
+
+    Records are appended to a file as they arrive, so memory use does not
+    grow with the size of the export. Each chunk of ``chunk_size`` records
+    starts at a remembered byte offset and can be read back without scanning
+    the file.
+
+    Exports hold document text, so the directory must be owned by the
+    server's user and accessible to it only. Files are created with mode 0600
+    and never opened through a symlink. Chunks can be read once an export is
+    finished; the TTL and the ``max_exports`` limit apply to finished exports
+    only, so an export is never deleted while it is being written.
+    """
+
+    def __init__(self, directory: Path, ttl: float, max_exports: int, temporary: bool = False):
+        """
+        Create an export store.
+
+        Args:
+            directory: Directory for export files (created if missing)
+            ttl: Seconds a finished export is kept
+            max_exports: Maximum number of exports kept; the oldest finished
+                exports are removed first
+            temporary: Whether the directory is deleted by ``close``
+
+        Raises:
+            ValueError: If the directory is not a directory owned by the
+                server's user with mode 0700
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_exports = max_exports
+        self.temporary = temporary
+        self._exports: dict[str, Export] = {}
+        self._check_directory()
+
+    def _check_directory(self) -> None:
+        """Create the directory if missing and make sure no other user can access it."""
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(self.directory)
+        if (
+            not stat.S_ISDIR(st.st_mode)
+            or (hasattr(os, "getuid") and st.st_uid != os.getuid())
+            or stat.S_IMODE(st.st_mode) != 0o700
+        ):
+            raise ValueError(
+                f"Export directory {self.directory} must be a directory (not a symlink) "
+                f"owned by the server's user with mode 0700."
+            )
+
+    def create(self, chunk_size: int) -> Export:
+        """
+        Start a new, empty export.
+
+        Raises:
+            Exception: If ``max_exports`` exports are still being written
+        """
+        self.expire()
+        finished = sorted(
+            (export for export in self._exports.values() if export.complete),
+            key=lambda export: export.finished_at,
+        )
+        excess = len(self._exports) + 1 - self.max_exports
+        if excess > len(finished):
+            raise Exception(
+                f"{len(self._exports) - len(finished)} exports are still being written. "
+                f"Try again once one has finished."
+            )
+        for export in finished[: max(0, excess)]:
+            self.remove(export.export_id)
+        self._check_directory()
+        export_id = secrets.token_urlsafe(9)
+        export = Export(
+            export_id=export_id,
+            path=self.directory / f"{export_id}.ndjson",
+            chunk_size=chunk_size,
+        )
+        os.close(os.open(export.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_NOFOLLOW, 0o600))
+        self._exports[export_id] = export
+        return export
+
+    def finish(self, export: Export) -> None:
+        """Mark an export as completely written; its TTL starts now."""
+        export.complete = True
+        export.finished_at = time.monotonic()
+
+    def append(self, export: Export, records: list[dict[str, Any]]) -> None:
+        """Append records to an export, one compact JSON object per line."""
+        fd = os.open(export.path, os.O_WRONLY | os.O_APPEND | _O_NOFOLLOW)
+        with os.fdopen(fd, "ab") as f:
+            for record in records:
+                if export.count % export.chunk_size == 0:
+                    export.chunk_offsets.append(export.size)
+                line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+                data = line.encode("utf-8")
+                f.write(data)
+                export.size += len(data)
+                export.count += 1
+
+    def get(self, export_id: str) -> Export | None:
+        """Return an export that has not expired, or None."""
+        self.expire()
+        return self._exports.get(export_id)
+
+    def read_chunk(self, export_id: str, chunk: int) -> str:
+        """
+        Read one chunk of an export.
+
+        Args:
+            export_id: ID returned when the export was created
+            chunk: Chunk number (0-based)
+
+        Returns:
+            NDJSON text with up to ``chunk_size`` records
+
+        Raises:
+            Exception: If the export is unknown, expired or not finished, or the
+                chunk does not exist
+        """
+        export = self.get(export_id)
+        if export is None:
+            raise Exception(f"Export {export_id!r} is unknown or has expired.")
+        if not export.complete:
+            raise Exception(f"Export {export_id!r} is still being written.")
+        if not 0 <= chunk < export.chunk_count:
+            raise Exception(
+                f"Export {export_id!r} has chunks 0 to {export.chunk_count - 1}, not {chunk}."
+            )
+        start = export.chunk_offsets[chunk]
+        end = export.chunk_offsets[chunk + 1] if chunk + 1 < export.chunk_count else export.size
+        with os.fdopen(os.open(export.path, os.O_RDONLY | _O_NOFOLLOW), "rb") as f:
+            f.seek(start)
+            return f.read(end - start).decode("utf-8")
+
+    def remove(self, export_id: str) -> None:
+        """Delete an export and its file."""
+        export = self._exports.pop(export_id, None)
+        if export is not None:
+            export.path.unlink(missing_ok=True)
+
+    def expire(self) -> None:
+        """Delete finished exports older than the TTL."""
+        now = time.monotonic()
+        for export_id, export in list(self._exports.items()):
+            if export.complete and now - export.finished_at >= self.ttl:
+                self.remove(export_id)
+
+    def close(self) -> None:
+        """Delete all exports, and the directory if it is temporary."""
+        for export_id in list(self._exports):
+            self.remove(export_id)
+        if self.temporary:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+
+# Global export store instance
+export_store: ExportStore | None = None
+
+
+def get_export_store() -> ExportStore:
+    """
+    Get or create the export store.
+
+    Without PAPERLESS_EXPORT_DIR, a private directory with an unpredictable
+    name is created in the system temp dir, once per process.
+
+    Raises:
+        ValueError: If PAPERLESS_EXPORT_DIR is accessible to other users
+    """
+    global export_store
+    if export_store is None:
+        config = get_config()
+        if config.export_dir:
+            directory, temporary = Path(config.export_dir), False
+        else:
+            directory = Path(tempfile.mkdtemp(prefix="paperless-ngx-mcp-exports-"))
+            temporary = True
+        export_store = ExportStore(
+            directory=directory,
+            ttl=config.export_ttl,
+            max_exports=config.export_max_exports,
+            temporary=temporary,
+        )
+    return export_store
+
+
+def close_export_store() -> None:
+    """Delete all exports (and a temporary export directory) if the store was created."""
+    global export_store
+    if export_store is not None:
+        export_store.close()
+        export_store = None
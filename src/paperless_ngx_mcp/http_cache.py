@@ -0,0 +1,202 @@
+"""Persistent on-disk cache of Paperless-NGX GET responses."""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import Config, get_config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A stored response body with its validators."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers asking Paperless-NGX to answer 304 if the response is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def cache_key(config: Config, path: str, params: dict[str, Any] | None) -> str:
+    """
+    Build the cache key of a GET request.
+
+    The key is a hash over the server URL, the API token, the path and the
+    parameters, so users sharing a cache directory never see each other's
+    documents.
+    """
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    material = json.dumps([config.api_url, config.api_token, path, items])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    """
+    SQLite store of GET response bodies that survives server restarts.
+
+    Responses younger than ``ttl`` are served without contacting
+    Paperless-NGX. Older responses are revalidated with ``If-None-Match`` /
+    ``If-Modified-Since`` when Paperless-NGX sent an ``ETag`` or
+    ``Last-Modified`` header, and refetched otherwise. Once the stored bodies
+    exceed ``max_bytes``, the least recently used are deleted.
+
+    The database may be shared by several server processes (e.g. one per
+    editor session). Counters are per process.
+    """
+
+    def __init__(self, path: Path, max_bytes: int, ttl: float):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Maximum total size of stored response bodies
+            ttl: Seconds a response is served without revalidation
+        """
+        # Imported here so the server starts without loading SQLite when the cache is off
+        import sqlite3
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Whether a response may be served without asking Paperless-NGX."""
+        return time.time() - entry.stored_at < self.ttl
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the stored response for a key (fresh or not), or None."""
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return CachedResponse(*row)
+
+    def put(
+        self, key: str, path: str, body: bytes, etag: str | None, last_modified: str | None
+    ) -> None:
+        """Store a response, deleting least recently used ones beyond ``max_bytes``."""
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, path, body, etag, last_modified, len(body), now, now),
+            )
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            rows = self._db.execute(
+                "SELECT key, size FROM responses WHERE key != ? ORDER BY accessed_at", (key,)
+            )
+            evicted = []
+            for evicted_key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                evicted.append((evicted_key,))
+                total -= size
+            self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+            self.evictions += len(evicted)
+
+    def refresh(self, key: str) -> None:
+        """Mark a response as revalidated (Paperless-NGX answered 304), restarting its TTL."""
+        with self._lock, self._db:
+            self._db.execute("UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key))
+
+    def invalidate_paths(self, paths: list[str]) -> int:
+        """
+        Delete the stored responses of the given API paths (with any parameters).
+
+        Returns:
+            Number of deleted responses
+        """
+        with self._lock, self._db:
+            return self._db.executemany(
+                "DELETE FROM responses WHERE path = ?", [(path,) for path in paths]
+            ).rowcount
+
+    def clear(self) -> int:
+        """Delete all stored responses and return how many there were."""
+        with self._lock, self._db:
+            return self._db.execute("DELETE FROM responses").rowcount
+
+    def stats(self) -> dict[str, Any]:
+        """Return usage and this process's counters."""
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.revalidations + self.misses
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "hit_ratio": round((self.hits + self.revalidations) / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Global HTTP cache instance
+http_cache: HttpCache | None = None
+
+
+def get_http_cache() -> HttpCache | None:
+    """Get or open the persistent HTTP cache, or None if it is disabled."""
+    global http_cache
+    config = get_config()
+    if not config.http_cache_enabled:
+        return None
+    if http_cache is None:
+        http_cache = HttpCache(
+            path=Path(config.http_cache_dir).expanduser() / "http-cache.db",
+            max_bytes=config.http_cache_max_bytes,
+            ttl=config.http_cache_ttl,
+        )
+    return http_cache
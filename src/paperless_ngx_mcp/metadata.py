@@ -0,0 +1,227 @@
+"""Cached Paperless-NGX metadata used to resolve IDs to names."""
+
+import asyncio
+import sys
+import time
+from typing import Any
+
+from .api import get_async_api
+from .config import get_config
+
+# Metadata kinds and the list endpoints they are loaded from
+METADATA_ENDPOINTS = {
+    "tags": "/api/tags/",
+    "correspondents": "/api/correspondents/",
+    "document_types": "/api/document_types/",
+    "storage_paths": "/api/storage_paths/",
+    "custom_fields": "/api/custom_fields/",
+}
+
+# Least seconds between reloads caused by names that are not in the maps
+UNKNOWN_NAME_REFRESH_INTERVAL = 30.0
+
+
+class MetadataCache:
+    """
+    ID to name maps for tags, correspondents, document types, storage paths
+    and custom fields.
+
+    The maps are loaded once on first use and then refreshed periodically by
+    a background task, so formatters can resolve names without extra requests.
+    The complete lists are kept too, e.g. for their ``document_count``.
+    Each kind is loaded independently: an endpoint the API token may not read
+    leaves only that kind unresolved.
+    """
+
+    def __init__(self, refresh_interval: float):
+        """
+        Create an empty metadata cache.
+
+        Args:
+            refresh_interval: Seconds between background refreshes
+        """
+        self.refresh_interval = refresh_interval
+        self.names: dict[str, dict[int, str]] = {kind: {} for kind in METADATA_ENDPOINTS}
+        # Case-folded name to ID, per kind
+        self.ids: dict[str, dict[str, int]] = {kind: {} for kind in METADATA_ENDPOINTS}
+        # List endpoint results, per kind loaded so far
+        self.lists: dict[str, list[dict[str, Any]]] = {}
+        self.loaded_at: float | None = None
+        # Monotonic time of the last reload for an unknown name
+        self.unknown_name_refresh_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the maps have been loaded at least once."""
+        return self.loaded_at is not None
+
+    async def refresh(self) -> None:
+        """
+        Reload all metadata kinds concurrently from Paperless-NGX.
+
+        Raises:
+            Exception: If no kind could be loaded; the maps are left unchanged
+        """
+        async with get_async_api() as api:
+            results = await asyncio.gather(
+                *(api.list_all(path) for path in METADATA_ENDPOINTS.values()),
+                return_exceptions=True,
+            )
+
+        lists = {}
+        for kind, result in zip(METADATA_ENDPOINTS, results, strict=True):
+            if isinstance(result, BaseException):
+                print(f"Could not load {kind} metadata: {result}", file=sys.stderr)
+                continue
+            lists[kind] = result
+        if not lists:
+            raise Exception("No metadata kind could be loaded.")
+        self.update(lists)
+
+    async def refresh_for_unknown_name(self) -> bool:
+        """
+        Reload the maps because a name was not found in them.
+
+        The name may belong to an item created since the last reload, but it
+        may also be a typo, so reloads for unknown names happen at most once
+        per UNKNOWN_NAME_REFRESH_INTERVAL seconds. Concurrent callers share
+        one reload.
+
+        Returns:
+            True if the maps were reloaded
+
+        Raises:
+            Exception: If the reload fails
+        """
+        async with self._lock:
+            now = time.monotonic()
+            last = self.unknown_name_refresh_at
+            if last is not None and now - last < UNKNOWN_NAME_REFRESH_INTERVAL:
+                return False
+            self.unknown_name_refresh_at = now
+            await self.refresh()
+            return True
+
+    def update(self, lists: dict[str, list[dict[str, Any]]]) -> None:
+        """
+        Replace the maps of some metadata kinds with freshly loaded lists.
+
+        Args:
+            lists: Complete list endpoint results per metadata kind
+        """
+        names = dict(self.names)
+        for kind, items in lists.items():
+            names[kind] = {item["id"]: item.get("name") for item in items}
+        self.names = names
+        self.lists = {**self.lists, **lists}
+        self.ids = {
+            kind: {name.casefold(): id_ for id_, name in kind_names.items() if name}
+            for kind, kind_names in names.items()
+        }
+        self.loaded_at = time.monotonic()
+
+    async def ensure_loaded(self) -> bool:
+        """
+        Load the maps if they have not been loaded yet.
+
+        Concurrent callers share a single load. Failures are reported on stderr
+        and leave the maps empty, so names fall back to raw IDs, and the next
+        call tries again.
+
+        Returns:
+            True if the maps are loaded
+        """
+        if self.loaded:
+            return True
+        async with self._lock:
+            if not self.loaded:
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    print(f"Could not load metadata: {e}", file=sys.stderr)
+        return self.loaded
+
+    def resolve(self, kind: str, value: Any) -> Any:
+        """
+        Resolve a metadata ID to its name.
+
+        Args:
+            kind: Metadata kind (key of METADATA_ENDPOINTS)
+            value: ID to resolve
+
+        Returns:
+            The name, or the unchanged value if it is unknown
+        """
+        if value is None:
+            return None
+        return self.names[kind].get(value, value)
+
+    def lookup_id(self, kind: str, value: int | str) -> int | None:
+        """
+        Resolve a metadata name (case-insensitive) or ID to an ID.
+
+        Names take precedence over numeric strings, so a tag called "2024" is
+        found by its name. Integers are returned unchanged.
+
+        Args:
+            kind: Metadata kind (key of METADATA_ENDPOINTS)
+            value: Name, ID, or ID given as a string
+
+        Returns:
+            The ID, or None if the value is neither a known name nor numeric
+        """
+        if isinstance(value, int):
+            return value
+        id_ = self.ids[kind].get(value.strip().casefold())
+        if id_ is None and value.strip().isdigit():
+            id_ = int(value)
+        return id_
+
+    async def _refresh_loop(self) -> None:
+        await self.ensure_loaded()
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"Metadata refresh failed: {e}", file=sys.stderr)
+
+    def start(self) -> None:
+        """Start the background refresh task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global metadata cache instance
+metadata_cache: MetadataCache | None = None
+
+
+def get_metadata_cache() -> MetadataCache | None:
+    """Get or create the metadata cache, or None if it is disabled."""
+    global metadata_cache
+    config = get_config()
+    if not config.metadata_cache_enabled:
+        return None
+    if metadata_cache is None:
+        metadata_cache = MetadataCache(refresh_interval=config.metadata_refresh_interval)
+    return metadata_cache
+
+
+async def get_metadata() -> MetadataCache | None:
+    """Get the metadata cache, loading it on first use. None if disabled."""
+    cache = get_metadata_cache()
+    if cache is not None:
+        await cache.ensure_loaded()
+    return cache
@@ -0,0 +1,374 @@
+"""Prometheus metrics and OpenTelemetry spans for tool calls and upstream requests.
+
+Both integrations are optional: without ``prometheus-client`` (or with
+PAPERLESS_METRICS=false) all recording functions are no-ops, and spans are
+only created when PAPERLESS_OTEL is enabled and ``opentelemetry-api`` is
+installed. Both libraries are imported on first use, not at server start.
+"""
+
+import re
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from fastmcp.server.middleware import Middleware
+
+from .cache import (
+    get_autocomplete_cache,
+    get_content_cache,
+    get_document_cache,
+    get_list_cache,
+    get_snapshot_cache,
+)
+from .config import get_config
+from .http_cache import get_http_cache
+from .prefetch import get_prefetcher
+
+# Response size buckets in bytes (256 B to 16 MiB)
+SIZE_BUCKETS = tuple(256 * 4**i for i in range(9))
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/)")
+
+
+def endpoint_label(path: str) -> str:
+    """
+    Normalize an API path for use as a metric label or span name.
+
+    Numeric IDs are replaced by ``{id}``, so all single-document requests
+    share one label (e.g. ``/api/documents/{id}/``).
+    """
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+class _StatsCollector:
+    """Expose cache, coalescing and resilience counters at scrape time."""
+
+    def collect(self) -> Iterator[Any]:
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+        # Imported here: api.py records its requests through this module
+        from .api import get_coalescing_stats, get_resilience_stats
+        from .watcher import get_watcher
+
+        cache_gauges = {
+            name: GaugeMetricFamily(
+                f"paperless_mcp_cache_{name}", f"Current cache {name}", labels=["cache"]
+            )
+            for name in ("entries", "bytes")
+        }
+        cache_counters = {
+            name: CounterMetricFamily(
+                f"paperless_mcp_cache_{name}", f"Cache {name}", labels=["cache"]
+            )
+            for name in ("hits", "misses", "revalidations", "evictions")
+        }
+        caches = {
+            "document": get_document_cache(),
+            "content": get_content_cache(),
+            "list": get_list_cache(),
+            "snapshot": get_snapshot_cache(),
+            "http": get_http_cache(),
+            "autocomplete": get_autocomplete_cache(),
+        }
+        for cache_name, cache in caches.items():
+            if cache is None:
+                continue
+            stats = cache.stats()
+            for name, family in (cache_gauges | cache_counters).items():
+                if name in stats:
+                    family.add_metric([cache_name], stats[name])
+        yield from cache_gauges.values()
+        yield from cache_counters.values()
+
+        coalescing = get_coalescing_stats()
+        if coalescing is not None:
+            requests = CounterMetricFamily(
+                "paperless_mcp_singleflight_requests",
+                "Upstream GETs by whether they were executed or joined an identical request",
+                labels=["outcome"],
+            )
+            requests.add_metric(["executed"], coalescing["executed"])
+            requests.add_metric(["coalesced"], coalescing["coalesced"])
+            yield requests
+
+        prefetcher = get_prefetcher()
+        if prefetcher is not None:
+            prefetches = CounterMetricFamily(
+                "paperless_mcp_prefetches",
+                "Speculative page prefetches by outcome",
+                labels=["outcome"],
+            )
+            stats = prefetcher.stats()
+            for outcome in ("scheduled", "hits", "joined", "skipped", "cancelled"):
+                prefetches.add_metric([outcome], stats[outcome])
+            yield prefetches
+
+        watcher = get_watcher()
+        if watcher is not None:
+            stats = watcher.stats()
+            yield CounterMetricFamily(
+                "paperless_mcp_watcher_polls", "Change watcher polls", stats["polls"]
+            )
+            changes = CounterMetricFamily(
+                "paperless_mcp_watcher_changes",
+                "Changes detected by the change watcher",
+                labels=["kind"],
+            )
+            changes.add_metric(["changed_document"], stats["changed_documents"])
+            changes.add_metric(["deleted_document"], stats["deleted_documents"])
+            changes.add_metric(["metadata"], stats["metadata_changes"])
+            yield changes
+
+        upstream = get_resilience_stats()
+        concurrency = upstream["concurrency"]
+        if concurrency is not None:
+            for name in ("limit", "in_flight", "waiting"):
+                yield GaugeMetricFamily(
+                    f"paperless_mcp_upstream_concurrency_{name}",
+                    f"Adaptive concurrency limiter {name.replace('_', ' ')}",
+                    value=concurrency[name],
+                )
+        breaker = upstream["circuit_breaker"]
+        if breaker is not None:
+            state = GaugeMetricFamily(
+                "paperless_mcp_circuit_breaker_state",
+                "1 for the current circuit breaker state",
+                labels=["state"],
+            )
+            for name in ("closed", "open", "half_open"):
+                state.add_metric([name], 1 if breaker["state"] == name else 0)
+            yield state
+            yield CounterMetricFamily(
+                "paperless_mcp_circuit_breaker_trips", "Times the circuit opened", breaker["trips"]
+            )
+            yield CounterMetricFamily(
+                "paperless_mcp_circuit_breaker_rejected",
+                "Requests rejected while the circuit was open",
+                breaker["rejected"],
+            )
+        yield CounterMetricFamily(
+            "paperless_mcp_upstream_retries", "Retried upstream requests", upstream["retries"]
+        )
+
+
+class Metrics:
+    """Prometheus metrics of this server process, kept in a private registry."""
+
+    def __init__(self):
+        from prometheus_client import (
+            CollectorRegistry,
+            Counter,
+            Histogram,
+            PlatformCollector,
+            ProcessCollector,
+        )
+
+        self.registry = CollectorRegistry()
+        self.tool_duration = Histogram(
+            "paperless_mcp_tool_duration_seconds",
+            "Duration of MCP tool calls",
+            ["tool"],
+            registry=self.registry,
+        )
+        self.tool_errors = Counter(
+            "paperless_mcp_tool_errors",
+            "MCP tool calls that failed or returned an error",
+            ["tool"],
+            registry=self.registry,
+        )
+        self.upstream_duration = Histogram(
+            "paperless_mcp_upstream_duration_seconds",
+            "Duration of Paperless-NGX requests (each retry attempt counts separately)",
+            ["endpoint"],
+            registry=self.registry,
+        )
+        self.upstream_size = Histogram(
+            "paperless_mcp_upstream_response_bytes",
+            "Body size of Paperless-NGX responses",
+            ["endpoint"],
+            buckets=SIZE_BUCKETS,
+            registry=self.registry,
+        )
+        self.upstream_responses = Counter(
+            "paperless_mcp_upstream_responses",
+            "Paperless-NGX responses by status code (or error type if none was received)",
+            ["endpoint", "status"],
+            registry=self.registry,
+        )
+        self.registry.register(_StatsCollector())
+        ProcessCollector(registry=self.registry)
+        PlatformCollector(registry=self.registry)
+
+    def render(self) -> tuple[bytes, str]:
+        """Return the metrics in the Prometheus text format and its content type."""
+        from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+        return generate_latest(self.registry), CONTENT_TYPE_LATEST
+
+
+# Global metrics instance
+metrics: Metrics | None = None
+
+# Set once importing prometheus-client failed
+_prometheus_missing = False
+
+
+def get_metrics() -> Metrics | None:
+    """Get or create the metrics, or None if disabled or prometheus-client is missing."""
+    global metrics, _prometheus_missing
+    if metrics is not None:
+        return metrics
+    if _prometheus_missing or not get_config().metrics_enabled:
+        return None
+    try:
+        metrics = Metrics()
+    except ImportError:
+        _prometheus_missing = True
+    return metrics
+
+
+def _get_trace() -> Any:
+    """Return the ``opentelemetry.trace`` module, or None if tracing is off or unavailable."""
+    if not get_config().otel_enabled:
+        return None
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+    return trace
+
+
+def observe_upstream(endpoint: str, status: int | str, seconds: float, size: int) -> None:
+    """
+    Record one upstream request attempt.
+
+    Args:
+        endpoint: Normalized API path (see ``endpoint_label``)
+        status: HTTP status code, or the error type if no response arrived
+        seconds: Time until the response (or error) in seconds
+        size: Response body size in bytes
+    """
+    m = get_metrics()
+    if m is None:
+        return
+    m.upstream_duration.labels(endpoint).observe(seconds)
+    m.upstream_responses.labels(endpoint, str(status)).inc()
+    if size:
+        m.upstream_size.labels(endpoint).observe(size)
+
+
+# Tracer provider created by configure_tracing, shut down with the server
+_tracer_provider: Any = None
+
+
+def configure_tracing() -> None:
+    """
+    Set up OTLP span export if PAPERLESS_OTEL is enabled.
+
+    If the application already configured a global tracer provider, it is
+    used as is. Otherwise a provider exporting over OTLP/HTTP is installed
+    when ``opentelemetry-sdk`` and the OTLP exporter are available; the
+    exporter reads the standard ``OTEL_EXPORTER_OTLP_*`` variables.
+    """
+    global _tracer_provider
+    trace = _get_trace()
+    if trace is None or _tracer_provider is not None:
+        return
+    if not isinstance(trace.get_tracer_provider(), trace.ProxyTracerProvider):
+        return
+    try:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        print(
+            "PAPERLESS_OTEL is enabled but the OpenTelemetry SDK is not installed. "
+            "Install it with: uv pip install -e '.[otel]'",
+            file=sys.stderr,
+        )
+        return
+    provider = TracerProvider(resource=Resource.create({"service.name": "paperless-ngx-mcp"}))
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+    _tracer_provider = provider
+
+
+def shutdown_tracing() -> None:
+    """Flush and stop the tracer provider created by ``configure_tracing``."""
+    global _tracer_provider
+    if _tracer_provider is not None:
+        _tracer_provider.shutdown()
+        _tracer_provider = None
+
+
+@contextmanager
+def start_span(name: str, attributes: dict[str, Any] | None = None) -> Iterator[Any]:
+    """
+    Run a block inside an OpenTelemetry span if tracing is enabled.
+
+    The span becomes the current span, so upstream requests made inside a
+    tool call are recorded as its children. Exceptions are recorded on the
+    span and re-raised.
+
+    Yields:
+        The span, or None if tracing is disabled
+    """
+    trace = _get_trace()
+    if trace is None:
+        yield None
+        return
+    tracer = trace.get_tracer("paperless_ngx_mcp")
+    with tracer.start_as_current_span(name, attributes=attributes) as span:
+        yield span
+
+
+class _ToolCall:
+    """Outcome of the tool call in progress, recorded while its result is encoded."""
+
+    __slots__ = ("failed",)
+
+    def __init__(self):
+        self.failed = False
+
+
+# Set by InstrumentationMiddleware for the duration of a tool call. The object
+# is shared with context copies (e.g. worker threads running sync tools).
+_current_call: ContextVar[_ToolCall | None] = ContextVar("paperless_mcp_tool_call", default=None)
+
+
+def mark_tool_error() -> None:
+    """Record that the tool call in progress returns an error object."""
+    call = _current_call.get()
+    if call is not None:
+        call.failed = True
+
+
+class InstrumentationMiddleware(Middleware):
+    """Time every tool call, count its errors and wrap it in a span."""
+
+    async def on_call_tool(self, context, call_next):
+        tool = context.message.name
+        m = get_metrics()
+        started = time.monotonic()
+        failed = True
+        call = _ToolCall()
+        token = _current_call.set(call)
+        with start_span(f"tool {tool}", {"mcp.tool.name": tool}) as span:
+            try:
+                result = await call_next(context)
+                failed = call.failed
+                if span is not None and failed:
+                    from opentelemetry.trace import Status, StatusCode
+
+                    span.set_status(Status(StatusCode.ERROR))
+                return result
+            finally:
+                _current_call.reset(token)
+                if m is not None:
+                    m.tool_duration.labels(tool).observe(time.monotonic() - started)
+                    if failed:
+                        m.tool_errors.labels(tool).inc()
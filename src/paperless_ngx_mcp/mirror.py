@@ -0,0 +1,556 @@
+"""Local SQLite/FTS5 mirror of Paperless-NGX documents for offline search."""
+
+import asyncio
+import hashlib
+import html
+import json
+import re
+import sys
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from .api import get_async_api
+from .config import get_config
+from .metadata import MetadataCache, get_metadata
+
+# Document fields copied into the mirror
+MIRROR_FIELDS = (
+    "id",
+    "title",
+    "content",
+    "correspondent",
+    "document_type",
+    "tags",
+    "created_date",
+    "original_file_name",
+    "modified",
+)
+
+# Documents requested per sync batch
+SYNC_PAGE_SIZE = 100
+
+# Metadata kinds whose names are indexed with each document, as Paperless-NGX
+# matches plain queries against correspondent, document type and tag names too
+NAME_KINDS = ("correspondents", "document_types", "tags")
+
+# Bumped when the schema changes; older mirrors are dropped and synced again
+SCHEMA_VERSION = 2
+
+# Characters of content returned per search hit (matches Paperless-NGX's
+# truncate_content length, so the formatter builds the same preview)
+PREVIEW_LENGTH = 550
+
+# Queries made only of words, whitespace and simple punctuation can be
+# answered by FTS5. Anything else (field:value, boolean operators, ranges,
+# wildcards) uses Paperless-NGX's own query parser.
+_SIMPLE_QUERY = re.compile(r"^[\w\s.,'\-]*$")
+_TERM = re.compile(r"\w+")
+_OPERATORS = {"AND", "OR", "NOT"}
+
+_DROP_SCHEMA = """
+DROP TRIGGER IF EXISTS documents_ai;
+DROP TRIGGER IF EXISTS documents_ad;
+DROP TRIGGER IF EXISTS documents_au;
+DROP TABLE IF EXISTS documents_vocab;
+DROP TABLE IF EXISTS documents_fts;
+DROP TABLE IF EXISTS documents;
+DROP TABLE IF EXISTS sync_state;
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    content TEXT NOT NULL DEFAULT '',
+    correspondent INTEGER,
+    document_type INTEGER,
+    tags TEXT NOT NULL DEFAULT '[]',
+    created_date TEXT,
+    original_file_name TEXT,
+    modified TEXT,
+    names TEXT NOT NULL DEFAULT ''
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, content, names,
+    content='documents', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_vocab USING fts5vocab(documents_fts, row);
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts(rowid, title, content, names)
+    VALUES (new.id, new.title, new.content, new.names);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, title, content, names)
+    VALUES ('delete', old.id, old.title, old.content, old.names);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, title, content, names)
+    VALUES ('delete', old.id, old.title, old.content, old.names);
+    INSERT INTO documents_fts(rowid, title, content, names)
+    VALUES (new.id, new.title, new.content, new.names);
+END;
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Matches in FTS5 snippets are delimited by these characters, which do not
+# occur in OCR text, and then turned into Paperless-NGX style highlights
+_MATCH_START = "\x02"
+_MATCH_END = "\x03"
+
+# Tokens per snippet (about as long as a Paperless-NGX highlight)
+SNIPPET_TOKENS = 32
+
+_RESULT_COLUMNS = (
+    "d.id, d.title, substr(d.content, 1, ?), d.correspondent, d.document_type, "
+    "d.tags, d.created_date, d.original_file_name"
+)
+
+
+def to_fts_query(query: str) -> str | None:
+    """
+    Translate a plain search query into an FTS5 MATCH expression.
+
+    Args:
+        query: Search query as typed by the user
+
+    Returns:
+        FTS5 expression requiring all terms, "" for an empty query, or None if
+        the query uses syntax only Paperless-NGX can evaluate
+    """
+    if not _SIMPLE_QUERY.match(query):
+        return None
+    terms = _TERM.findall(query)
+    if any(term in _OPERATORS for term in terms):
+        return None
+    return " ".join(f'"{term}"' for term in terms)
+
+
+def _sync_key(doc: dict[str, Any]) -> tuple[datetime, int]:
+    """
+    Position of a document in sync order: its ``modified`` time, then its ID.
+
+    Timestamps are compared as datetimes, since the same instant may be
+    written with different UTC offsets (e.g. across a DST change).
+    """
+    modified = doc.get("modified")
+    if not modified:
+        return datetime.min.replace(tzinfo=UTC), doc["id"]
+    parsed = datetime.fromisoformat(modified)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed, doc["id"]
+
+
+def _names(
+    metadata: MetadataCache | None, correspondent: Any, document_type: Any, tags: list[int]
+) -> str:
+    """Join the correspondent, document type and tag names of a document for indexing."""
+    if metadata is None:
+        return ""
+    ids = {"correspondents": [correspondent], "document_types": [document_type], "tags": tags}
+    return " ".join(
+        metadata.names[kind][item_id]
+        for kind in NAME_KINDS
+        for item_id in ids[kind]
+        if item_id in metadata.names[kind] and metadata.names[kind][item_id]
+    )
+
+
+def _names_version(metadata: MetadataCache | None) -> str:
+    """Identify the indexed names, so a rename can be detected."""
+    if metadata is None:
+        return ""
+    material = json.dumps([sorted(metadata.names[kind].items()) for kind in NAME_KINDS])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _highlights(snippet: str) -> str:
+    """Turn an FTS5 snippet into Paperless-NGX style HTML highlights ("" without a match)."""
+    if _MATCH_START not in snippet:
+        return ""
+    return (
+        html.escape(snippet)
+        .replace(_MATCH_START, '<span class="match">')
+        .replace(_MATCH_END, "</span>")
+    )
+
+
+class DocumentMirror:
+    """
+    Incrementally synchronized local copy of the document index.
+
+    A background task pulls documents modified since the last sync
+    (``modified__gt``) into SQLite, where an FTS5 index answers plain-text
+    searches without contacting Paperless-NGX. Deleted documents are detected
+    from the ``all`` ID list of the documents endpoint.
+
+    Syncs use keyset pagination over ``(modified, id)``: each batch asks for
+    documents modified at or after the last one stored and skips those up to
+    it. Documents changing during a sync move behind the cursor instead of
+    shifting pages, so none are skipped.
+
+    Correspondent, document type and tag names are indexed with each
+    document and reindexed when a name changes, so plain queries match
+    them as in Paperless-NGX. Notes and custom fields are not indexed.
+    """
+
+    def __init__(self, path: Path, sync_interval: float):
+        """
+        Open (or create) the mirror database.
+
+        Args:
+            path: SQLite database file
+            sync_interval: Seconds between incremental syncs
+        """
+        self.path = path
+        self.sync_interval = sync_interval
+        # Imported here so the server starts without loading SQLite when mirror mode is off
+        import sqlite3
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._db.executescript(_DROP_SCHEMA)
+        self._db.executescript(_SCHEMA)
+        self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._db_lock = threading.Lock()
+        self._sync_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self.syncing = False
+        self.last_error: str | None = None
+        self.last_sync: float | None = None
+        last_sync = self._get_state("last_sync")
+        if last_sync is not None:
+            self.last_sync = float(last_sync)
+
+    # -- database helpers (run in a worker thread) --------------------------
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._db_lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def _get_state(self, key: str) -> str | None:
+        rows = self._execute("SELECT value FROM sync_state WHERE key = ?", (key,))
+        return rows[0][0] if rows else None
+
+    def _set_state(self, **values: Any) -> None:
+        with self._db_lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO sync_state(key, value) VALUES (?, ?)",
+                [(key, None if value is None else str(value)) for key, value in values.items()],
+            )
+
+    def _upsert(self, documents: list[dict[str, Any]], metadata: MetadataCache | None) -> None:
+        rows = [
+            (
+                doc["id"],
+                doc.get("title") or "",
+                doc.get("content") or "",
+                doc.get("correspondent"),
+                doc.get("document_type"),
+                json.dumps(doc.get("tags", [])),
+                doc.get("created_date"),
+                doc.get("original_file_name"),
+                doc.get("modified"),
+                _names(
+                    metadata,
+                    doc.get("correspondent"),
+                    doc.get("document_type"),
+                    doc.get("tags", []),
+                ),
+            )
+            for doc in documents
+        ]
+        with self._db_lock, self._db:
+            self._db.executemany(
+                "INSERT INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET title=excluded.title, "
+                "content=excluded.content, correspondent=excluded.correspondent, "
+                "document_type=excluded.document_type, tags=excluded.tags, "
+                "created_date=excluded.created_date, "
+                "original_file_name=excluded.original_file_name, modified=excluded.modified, "
+                "names=excluded.names",
+                rows,
+            )
+
+    def _reindex_names(self, metadata: MetadataCache | None) -> None:
+        with self._db_lock, self._db:
+            rows = self._db.execute(
+                "SELECT id, correspondent, document_type, tags, names FROM documents"
+            ).fetchall()
+            changed = []
+            for doc_id, correspondent, document_type, tags, names in rows:
+                new_names = _names(metadata, correspondent, document_type, json.loads(tags))
+                if new_names != names:
+                    changed.append((new_names, doc_id))
+            self._db.executemany("UPDATE documents SET names = ? WHERE id = ?", changed)
+
+    def _delete_missing(self, existing_ids: set[int]) -> int:
+        with self._db_lock, self._db:
+            local_ids = {row[0] for row in self._db.execute("SELECT id FROM documents")}
+            removed = [(doc_id,) for doc_id in local_ids - existing_ids]
+            self._db.executemany("DELETE FROM documents WHERE id = ?", removed)
+        return len(removed)
+
+    def _clear(self) -> None:
+        with self._db_lock, self._db:
+            self._db.execute("DELETE FROM documents")
+            self._db.execute("DELETE FROM sync_state")
+            self._db.execute("INSERT INTO documents_fts(documents_fts) VALUES ('rebuild')")
+
+    def _search(self, fts_query: str, page: int, page_size: int) -> dict[str, Any]:
+        offset = (page - 1) * page_size
+        if fts_query:
+            count = self._execute(
+                "SELECT count(*) FROM documents_fts WHERE documents_fts MATCH ?", (fts_query,)
+            )[0][0]
+            rows = self._execute(
+                f"SELECT {_RESULT_COLUMNS}, "
+                f"snippet(documents_fts, 1, ?, ?, '...', {SNIPPET_TOKENS}), "
+                "bm25(documents_fts, 10.0, 1.0, 5.0) AS score FROM documents_fts f "
+                "JOIN documents d ON d.id = f.rowid WHERE documents_fts MATCH ? "
+                "ORDER BY score LIMIT ? OFFSET ?",
+                (PREVIEW_LENGTH, _MATCH_START, _MATCH_END, fts_query, page_size, offset),
+            )
+        else:
+            count = self._execute("SELECT count(*) FROM documents")[0][0]
+            rows = self._execute(
+                f"SELECT {_RESULT_COLUMNS} FROM documents d "
+                "ORDER BY d.created_date DESC, d.id DESC LIMIT ? OFFSET ?",
+                (PREVIEW_LENGTH, page_size, offset),
+            )
+        results = [
+            {
+                "id": row[0],
+                "title": row[1],
+                "content": row[2],
+                "correspondent": row[3],
+                "document_type": row[4],
+                "tags": json.loads(row[5]),
+                "created_date": row[6],
+                "original_file_name": row[7],
+            }
+            for row in rows
+        ]
+        if fts_query:
+            for rank, (result, row) in enumerate(zip(results, rows, strict=True)):
+                # Shaped like Paperless-NGX's hits; bm25() is lower for better matches
+                result["__search_hit__"] = {
+                    "score": -row[9],
+                    "rank": offset + rank,
+                    "highlights": _highlights(row[8]),
+                    "note_highlights": "",
+                }
+        return {
+            "count": count,
+            "next": f"?page={page + 1}" if offset + len(results) < count else None,
+            "previous": f"?page={page - 1}" if page > 1 else None,
+            "results": results,
+        }
+
+    def _autocomplete(self, term: str, limit: int) -> list[str]:
+        prefix = term.lower()
+        rows = self._execute(
+            "SELECT term FROM documents_vocab WHERE term >= ? AND term < ? "
+            "ORDER BY doc DESC, term LIMIT ?",
+            (prefix, prefix + "\U0010ffff", limit),
+        )
+        return [row[0] for row in rows]
+
+    # -- public API -----------------------------------------------------------
+
+    @property
+    def ready(self) -> bool:
+        """Whether at least one full sync has completed."""
+        return self.last_sync is not None
+
+    async def search(self, query: str, page: int = 1, page_size: int = 25) -> dict[str, Any] | None:
+        """
+        Search the mirror.
+
+        Args:
+            query: Search query string
+            page: Page number (1-indexed)
+            page_size: Number of results per page
+
+        Returns:
+            Response shaped like the Paperless-NGX documents endpoint, or None
+            if the mirror is not ready or cannot evaluate the query
+        """
+        fts_query = to_fts_query(query)
+        if fts_query is None or not self.ready:
+            return None
+        return await asyncio.to_thread(self._search, fts_query, page, page_size)
+
+    async def autocomplete(self, term: str, limit: int = 10) -> list[str] | None:
+        """
+        Suggest indexed terms starting with ``term``, most frequent first.
+
+        Returns:
+            Suggestions, or None if the mirror is not ready
+        """
+        if not self.ready:
+            return None
+        return await asyncio.to_thread(self._autocomplete, term, limit)
+
+    async def sync(self) -> int:
+        """
+        Pull documents changed since the last sync and drop deleted ones.
+
+        Returns:
+            Number of documents added or updated
+
+        Raises:
+            Exception: If the Paperless-NGX API request fails
+        """
+        async with self._sync_lock:
+            self.syncing = True
+            try:
+                updated = await self._sync()
+                self.last_error = None
+                return updated
+            except Exception as e:
+                self.last_error = str(e)
+                raise
+            finally:
+                self.syncing = False
+
+    async def _sync(self) -> int:
+        watermark = await asyncio.to_thread(self._get_state, "watermark")
+        watermark_id = int(await asyncio.to_thread(self._get_state, "watermark_id") or 0)
+        metadata = await get_metadata()
+        names_version = _names_version(metadata)
+        if names_version != await asyncio.to_thread(self._get_state, "names_version"):
+            await asyncio.to_thread(self._reindex_names, metadata)
+            await asyncio.to_thread(self._set_state, names_version=names_version)
+
+        updated = 0
+        # Page within documents sharing the watermark's modified time, when
+        # more of them (e.g. from a bulk edit) than fit in a batch were seen
+        page = 1
+        async with get_async_api(http_cache=False) as api:
+            # Batches are written one at a time so memory stays flat on a first sync
+            while True:
+                params: dict[str, Any] = {
+                    "ordering": "modified,id",
+                    "fields": ",".join(MIRROR_FIELDS),
+                    "page": page,
+                    "page_size": SYNC_PAGE_SIZE,
+                }
+                if watermark:
+                    params["modified__gte"] = watermark
+                response = await api.list_documents(params)
+                results = response.get("results", [])
+                cursor = _sync_key({"id": watermark_id, "modified": watermark})
+                documents = [doc for doc in results if _sync_key(doc) > cursor]
+                if documents:
+                    await asyncio.to_thread(self._upsert, documents, metadata)
+                    updated += len(documents)
+                    last = max(documents, key=_sync_key)
+                    watermark, watermark_id = last.get("modified") or watermark, last["id"]
+                    await asyncio.to_thread(
+                        self._set_state, watermark=watermark, watermark_id=watermark_id
+                    )
+                    page = 1
+                elif response.get("next"):
+                    page += 1
+                if not response.get("next"):
+                    break
+
+            ids = await api.list_documents({"page_size": 1, "fields": "id"})
+
+        if "all" in ids:
+            await asyncio.to_thread(self._delete_missing, set(ids["all"]))
+        last_sync = time.time()
+        await asyncio.to_thread(self._set_state, last_sync=last_sync)
+        self.last_sync = last_sync
+        return updated
+
+    async def rebuild(self) -> int:
+        """
+        Discard the mirror and resynchronize every document.
+
+        Returns:
+            Number of documents mirrored
+        """
+        async with self._sync_lock:
+            await asyncio.to_thread(self._clear)
+            self.last_sync = None
+        return await self.sync()
+
+    async def status(self) -> dict[str, Any]:
+        """Return sync status, including how far the mirror lags behind."""
+
+        def read() -> dict[str, Any]:
+            last_sync = self.last_sync
+            return {
+                "path": str(self.path),
+                "documents": self._execute("SELECT count(*) FROM documents")[0][0],
+                "ready": last_sync is not None,
+                "syncing": self.syncing,
+                "last_sync": (
+                    time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(last_sync))
+                    if last_sync
+                    else None
+                ),
+                "lag_seconds": round(time.time() - last_sync, 1) if last_sync else None,
+                "newest_modified": self._get_state("watermark"),
+                "sync_interval_seconds": self.sync_interval,
+                "last_error": self.last_error,
+            }
+
+        return await asyncio.to_thread(read)
+
+    async def _sync_loop(self) -> None:
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                print(f"Mirror sync failed: {e}", file=sys.stderr)
+            await asyncio.sleep(self.sync_interval)
+
+    def start(self) -> None:
+        """Start the background sync task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._sync_loop())
+
+    async def stop(self) -> None:
+        """Stop the background sync task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._db_lock:
+            self._db.close()
+
+
+# Global mirror instance
+document_mirror: DocumentMirror | None = None
+
+
+def get_mirror() -> DocumentMirror | None:
+    """Get or open the document mirror, or None if mirror mode is disabled."""
+    global document_mirror
+    config = get_config()
+    if not config.mirror_enabled:
+        return None
+    if document_mirror is None:
+        document_mirror = DocumentMirror(
+            path=Path(config.mirror_path).expanduser(),
+            sync_interval=config.mirror_sync_interval,
+        )
+    return document_mirror
@@ -0,0 +1,276 @@
+"""Typed tool responses and their JSON encoding.
+
+Tool results are built from slotted dataclasses and encoded by ``encode``
+according to PAPERLESS_OUTPUT_FORMAT:
+
+- ``pretty``: indented JSON (the default)
+- ``compact``: JSON without whitespace and with non-ASCII text kept as is
+- ``columnar``: compact JSON in which lists of documents, tags, buckets or
+  graph nodes are sent as ``{"columns": [...], "rows": [[...], ...]}``, so
+  field names appear once per list instead of once per item
+"""
+
+import json
+from dataclasses import dataclass, fields
+from functools import cache
+from typing import Any
+
+from .config import get_config
+from .metadata import MetadataCache
+from .metrics import mark_tool_error
+from .snippets import preview
+
+
+def resolve_name(metadata: MetadataCache | None, kind: str, value: Any) -> Any:
+    """Resolve a metadata ID to its name, or return it unchanged without metadata."""
+    if metadata is None:
+        return value
+    return metadata.resolve(kind, value)
+
+
+@dataclass(slots=True)
+class DocumentSummary:
+    """
+    A document in a result list, with a content preview.
+
+    For full-text search results, the preview shows the passages matching
+    the query, and ``score`` and ``rank`` (1 for the best match) are set.
+    """
+
+    id: int
+    title: str | None
+    content_preview: str
+    correspondent: int | str | None
+    document_type: int | str | None
+    tags: list[int | str]
+    created_date: str | None
+    original_file_name: str | None
+    score: float | None
+    rank: int | None
+
+    @classmethod
+    def from_api(
+        cls, doc: dict[str, Any], metadata: MetadataCache | None = None, query: str = ""
+    ) -> "DocumentSummary":
+        """
+        Build a summary from a Paperless-NGX document, resolving IDs to names.
+
+        Args:
+            doc: Document, with ``__search_hit__`` for full-text search results
+            metadata: Metadata used to resolve IDs to names (IDs are kept if omitted)
+            query: Search query, used to find the matching passage when
+                Paperless-NGX sent no highlights
+        """
+        hit = doc.get("__search_hit__") or {}
+        score = hit.get("score")
+        rank = hit.get("rank")
+        return cls(
+            id=doc.get("id"),
+            title=doc.get("title"),
+            content_preview=preview(doc.get("content") or "", query, hit.get("highlights") or ""),
+            correspondent=resolve_name(metadata, "correspondents", doc.get("correspondent")),
+            document_type=resolve_name(metadata, "document_types", doc.get("document_type")),
+            tags=[resolve_name(metadata, "tags", tag) for tag in doc.get("tags", [])],
+            created_date=doc.get("created_date"),
+            original_file_name=doc.get("original_file_name"),
+            score=round(score, 4) if score is not None else None,
+            rank=rank + 1 if rank is not None else None,
+        )
+
+
+@dataclass(slots=True)
+class Document:
+    """Complete details of a single document."""
+
+    id: int
+    title: str | None
+    content: str
+    correspondent: int | str | None
+    document_type: int | str | None
+    storage_path: int | str | None
+    tags: list[int | str]
+    created_date: str | None
+    modified_date: str | None
+    added_date: str | None
+    archive_serial_number: int | None
+    original_file_name: str | None
+    custom_fields: list[dict[str, Any]]
+    notes: list[dict[str, Any]]
+
+    @classmethod
+    def from_api(cls, doc: dict[str, Any], metadata: MetadataCache | None = None) -> "Document":
+        """Build a document from a Paperless-NGX document, resolving IDs to names."""
+        return cls(
+            id=doc.get("id"),
+            title=doc.get("title"),
+            content=doc.get("content", ""),
+            correspondent=resolve_name(metadata, "correspondents", doc.get("correspondent")),
+            document_type=resolve_name(metadata, "document_types", doc.get("document_type")),
+            storage_path=resolve_name(metadata, "storage_paths", doc.get("storage_path")),
+            tags=[resolve_name(metadata, "tags", tag) for tag in doc.get("tags", [])],
+            created_date=doc.get("created_date"),
+            modified_date=doc.get("modified"),
+            added_date=doc.get("added"),
+            archive_serial_number=doc.get("archive_serial_number"),
+            original_file_name=doc.get("original_file_name"),
+            custom_fields=[
+                {**field, "field": resolve_name(metadata, "custom_fields", field.get("field"))}
+                for field in doc.get("custom_fields", [])
+            ],
+            notes=doc.get("notes", []),
+        )
+
+
+@dataclass(slots=True)
+class Tag:
+    """A tag and the number of documents carrying it."""
+
+    id: int
+    name: str | None
+    color: str | None
+    text_color: str | None
+    document_count: int
+
+    @classmethod
+    def from_api(cls, tag: dict[str, Any]) -> "Tag":
+        """Build a tag from a Paperless-NGX tag."""
+        return cls(
+            id=tag.get("id"),
+            name=tag.get("name"),
+            color=tag.get("color"),
+            text_color=tag.get("text_color"),
+            document_count=tag.get("document_count", 0),
+        )
+
+
+@dataclass(slots=True)
+class Suggestions:
+    """Autocomplete suggestions for a search term."""
+
+    term: str
+    suggestions: list[str]
+    count: int
+
+
+@dataclass(slots=True)
+class Bucket:
+    """Number of documents in one group of a document_stats result."""
+
+    # Tag, correspondent or document type ID, or the year or month ("2024-03")
+    key: int | str
+    # Name of the tag, correspondent or document type (None for periods)
+    name: str | None
+    count: int
+
+
+@dataclass(slots=True)
+class GraphNode:
+    """A document in a similarity_graph result."""
+
+    id: int
+    title: str | None
+    correspondent: int | str | None
+    document_type: int | str | None
+    created_date: str | None
+    # Similarity searches between a seed and this document (0 for seeds)
+    depth: int
+
+    @classmethod
+    def from_api(
+        cls, doc: dict[str, Any], depth: int, metadata: MetadataCache | None = None
+    ) -> "GraphNode":
+        """Build a node from a Paperless-NGX document, resolving IDs to names."""
+        return cls(
+            id=doc.get("id"),
+            title=doc.get("title"),
+            correspondent=resolve_name(metadata, "correspondents", doc.get("correspondent")),
+            document_type=resolve_name(metadata, "document_types", doc.get("document_type")),
+            created_date=doc.get("created_date"),
+            depth=depth,
+        )
+
+
+_MODELS = (DocumentSummary, Document, Tag, Suggestions, Bucket, GraphNode)
+
+# Models sent as tables in the columnar format. Full documents are not:
+# their long content and nested fields gain nothing from it.
+_TABULAR = (DocumentSummary, Tag, Bucket, GraphNode)
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _default(value: Any) -> dict[str, Any]:
+    """Encode a model as an object (``fields`` raises TypeError for anything else)."""
+    return {name: getattr(value, name) for name in _field_names(type(value))}
+
+
+# Encoders are created once: json.dumps builds a new one for every call with options
+_PRETTY = json.JSONEncoder(indent=2, check_circular=False, default=_default)
+_COMPACT = json.JSONEncoder(
+    ensure_ascii=False, check_circular=False, separators=(",", ":"), default=_default
+)
+
+
+def _plain(value: Any) -> Any:
+    """
+    Replace models by objects ahead of indented encoding.
+
+    The indenting encoder is written in Python and calls ``default`` slowly,
+    so models (directly, in a dict or in a list of models) are converted
+    first. Models in other places are still handled by ``default``.
+    """
+    if isinstance(value, _MODELS):
+        return _default(value)
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list) and value and isinstance(value[0], _MODELS):
+        return [_default(item) if isinstance(item, _MODELS) else item for item in value]
+    return value
+
+
+def _table(value: Any) -> Any:
+    """Turn a list of tabular models of one type into columns and rows."""
+    if not isinstance(value, list) or not value or not isinstance(value[0], _TABULAR):
+        return value
+    cls = type(value[0])
+    if any(type(item) is not cls for item in value):
+        return value
+    names = _field_names(cls)
+    return {
+        "columns": list(names),
+        "rows": [[getattr(item, name) for name in names] for item in value],
+    }
+
+
+def _output_format() -> str:
+    try:
+        return get_config().output_format
+    except ValueError:
+        # The configuration error itself is what is being encoded
+        return "pretty"
+
+
+def encode(value: Any) -> str:
+    """
+    Encode a tool result in the configured output format.
+
+    An object with an ``error`` key is the tool's error result and counts
+    the tool call as failed in the metrics.
+
+    Args:
+        value: Result object; models may appear anywhere inside it
+
+    Returns:
+        JSON string
+    """
+    if isinstance(value, dict) and "error" in value:
+        mark_tool_error()
+    output_format = _output_format()
+    if output_format == "pretty":
+        return _PRETTY.encode(_plain(value))
+    if output_format == "columnar" and isinstance(value, dict):
+        value = {key: _table(item) for key, item in value.items()}
+    return _COMPACT.encode(value)
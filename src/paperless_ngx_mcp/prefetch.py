@@ -0,0 +1,170 @@
+"""Speculative prefetching of the next result page."""
+
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from .cache import LRUCache
+from .config import get_config
+
+
+class Prefetcher:
+    """
+    Fetch likely follow-up requests in the background.
+
+    After a result page is served, the next page is requested in a background
+    task and kept for a short time, so the follow-up call is answered
+    immediately. A follow-up that arrives while the prefetch is still running
+    joins it instead of sending a second request.
+
+    Prefetching is bounded by a budget of concurrent prefetches and is
+    skipped while Paperless-NGX is busy. When no page has been requested for
+    ``ttl`` seconds the session is considered idle: running prefetches are
+    cancelled and unused pages are dropped.
+    """
+
+    def __init__(self, max_in_flight: int, ttl: float):
+        """
+        Create a prefetcher.
+
+        Args:
+            max_in_flight: Maximum number of prefetches running at once
+            ttl: Seconds a prefetched page is kept, and idle time after which
+                running prefetches are cancelled
+        """
+        self.max_in_flight = max_in_flight
+        self.ttl = ttl
+        self.pages = LRUCache(max_entries=32, max_bytes=16 * 1024 * 1024, ttl=ttl)
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self._idle_handle: asyncio.TimerHandle | None = None
+        self.scheduled = 0
+        self.hits = 0
+        self.joined = 0
+        self.skipped = 0
+        self.cancelled = 0
+
+    def _touch(self) -> None:
+        """Record activity and restart the idle timer."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+        self._idle_handle = asyncio.get_running_loop().call_later(self.ttl, self._on_idle)
+
+    def _on_idle(self) -> None:
+        self._idle_handle = None
+        self.discard()
+
+    def discard(self) -> None:
+        """Cancel running prefetches and drop prefetched pages (e.g. after documents changed)."""
+        self.cancelled += len(self._tasks)
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        self.pages.clear()
+
+    async def take(self, key: Hashable) -> Any | None:
+        """
+        Return a prefetched result, waiting for it if it is still being fetched.
+
+        Args:
+            key: Identity of the request
+
+        Returns:
+            The prefetched result, or None if the request was not prefetched
+            (or its prefetch failed)
+        """
+        self._touch()
+        result = self.pages.get(key)
+        if result is not None:
+            self.pages.invalidate(key)
+            self.hits += 1
+            return result
+        task = self._tasks.get(key)
+        if task is None:
+            return None
+        self.joined += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Only the prefetch was cancelled (idle); the caller fetches the page itself
+            if task.cancelled() and not asyncio.current_task().cancelling():
+                return None
+            raise
+
+    def schedule(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]], upstream_busy: bool = False
+    ) -> bool:
+        """
+        Start prefetching a request in the background, if the budget allows.
+
+        Args:
+            key: Identity of the request
+            fn: Coroutine function performing the request
+            upstream_busy: Whether Paperless-NGX is already loaded, in which
+                case nothing is prefetched
+
+        Returns:
+            True if a prefetch was started
+        """
+        self._touch()
+        if key in self._tasks or key in self.pages:
+            return False
+        if upstream_busy or len(self._tasks) >= self.max_in_flight:
+            self.skipped += 1
+            return False
+        task = asyncio.create_task(self._run(key, fn))
+        self._tasks[key] = task
+        self.scheduled += 1
+        return True
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any | None:
+        try:
+            result = await fn()
+        except Exception as e:
+            print(f"Prefetch failed: {e}", file=sys.stderr)
+            return None
+        finally:
+            self._tasks.pop(key, None)
+        self.pages.set(key, result)
+        return result
+
+    async def stop(self) -> None:
+        """Cancel running prefetches and the idle timer."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self.pages.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return prefetch counters."""
+        return {
+            "in_flight": len(self._tasks),
+            "cached_pages": len(self.pages),
+            "scheduled": self.scheduled,
+            "hits": self.hits,
+            "joined": self.joined,
+            "skipped": self.skipped,
+            "cancelled": self.cancelled,
+        }
+
+
+# Global prefetcher instance
+prefetcher: Prefetcher | None = None
+
+
+def get_prefetcher() -> Prefetcher | None:
+    """Get or create the prefetcher, or None if prefetching is disabled."""
+    global prefetcher
+    config = get_config()
+    if not config.prefetch_enabled:
+        return None
+    if prefetcher is None:
+        prefetcher = Prefetcher(
+            max_in_flight=config.prefetch_max_in_flight, ttl=config.prefetch_ttl
+        )
+    return prefetcher
@@ -0,0 +1,235 @@
+"""Retries, circuit breaking and adaptive concurrency for Paperless-NGX requests."""
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any
+
+import httpx
+
+# Status codes worth retrying for idempotent requests
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while Paperless-NGX is considered unhealthy."""
+
+
+def is_retryable(error: httpx.HTTPError) -> bool:
+    """
+    Whether a failed GET should be retried.
+
+    Connection failures and gateway/overload responses are retried. Read
+    timeouts are not: a stalled server would only be loaded further.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(
+        error,
+        httpx.ConnectError | httpx.ConnectTimeout | httpx.ReadError | httpx.RemoteProtocolError,
+    )
+
+
+def is_server_failure(error: httpx.HTTPError) -> bool:
+    """Whether an error indicates an unhealthy server (as opposed to a bad request)."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def is_overload(error: httpx.HTTPError) -> bool:
+    """Whether an error suggests sending fewer concurrent requests."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class RetryPolicy:
+    """Retry settings with exponential backoff and full jitter."""
+
+    def __init__(self, max_retries: int, base_delay: float, max_delay: float = 4.0):
+        """
+        Create a retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying)
+            base_delay: Delay before the first retry, doubled for each further one
+            max_delay: Upper bound on a single delay in seconds
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retries = 0
+
+    def delay(self, attempt: int, error: httpx.HTTPError | None = None) -> float:
+        """
+        Seconds to wait before retry number ``attempt`` (1-based).
+
+        A numeric ``Retry-After`` header on the failed response takes
+        precedence, capped at ``max_delay``.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = error.response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the upstream server keeps failing.
+
+    After ``failure_threshold`` consecutive server failures the circuit opens
+    and requests are rejected immediately for ``reset_timeout`` seconds. Then
+    a single probe request is let through (half-open); its outcome closes the
+    circuit again or re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self.trips = 0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+
+    def before_call(self) -> None:
+        """
+        Check whether a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a probe is already running)
+        """
+        if self.state == "closed":
+            return
+        remaining = self.opened_at + self.reset_timeout - time.monotonic()
+        if self.state == "open" and remaining <= 0:
+            self.state = "half_open"
+        # A probe that never reported back (e.g. cancelled) is replaced after reset_timeout
+        probe_stale = time.monotonic() - self._probe_started > self.reset_timeout
+        if self.state == "half_open" and (not self._probe_in_flight or probe_stale):
+            self._probe_in_flight = True
+            self._probe_started = time.monotonic()
+            return
+        self.rejected += 1
+        raise CircuitOpenError(
+            f"Paperless-NGX is currently unavailable after {self.consecutive_failures} "
+            f"consecutive failures. Retrying in {max(remaining, 0):.0f}s."
+        )
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy server."""
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a server failure, opening the circuit if the threshold is reached."""
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.trips += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> dict[str, Any]:
+        """Return the breaker state and counters."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for upstream requests.
+
+    The limit grows additively (about +1 per round of successful requests)
+    while responses are fast, and shrinks multiplicatively when a response
+    exceeds the latency target or signals overload. Decreases happen at most
+    once per latency target interval, so a burst of slow responses to
+    requests sent together counts as one congestion signal.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        latency_target: float = 5.0,
+        backoff: float = 0.7,
+    ):
+        """
+        Create a limiter starting at its maximum limit.
+
+        Args:
+            max_limit: Upper bound on concurrent requests
+            min_limit: Lower bound the limit never drops below
+            latency_target: Response time in seconds above which the limit shrinks
+            backoff: Factor applied to the limit on a congestion signal
+        """
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent under the current limit."""
+        while self.in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass a wake-up this waiter may have received on to the next one
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                self._wake()
+                raise
+        self.in_flight += 1
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """
+        Release a slot and adapt the limit to the observed response.
+
+        Args:
+            latency: Response time of the finished request in seconds
+            overloaded: Whether the request failed in a way that suggests overload
+        """
+        self.in_flight -= 1
+        now = time.monotonic()
+        if overloaded or latency > self.latency_target:
+            if now - self._last_decrease >= self.latency_target:
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                self._last_decrease = now
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        free = int(self.limit) - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return the current limit and usage."""
+        return {
+            "limit": int(self.limit),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+        }
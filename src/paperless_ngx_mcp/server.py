@@ -1,48 +1,209 @@
 """MCP Server implementation for Paperless-NGX."""
 
+import asyncio
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
+from fastmcp.server.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
 
-from .tools import (
-    autocomplete_search_tool,
-    get_document_tool,
-    get_similar_documents_tool,
-    list_tags_tool,
-    search_documents_tool,
-)
+from .export import DEFAULT_EXPORT_CHUNK, EXPORT_RESOURCE_TEMPLATE
+from .metrics import InstrumentationMiddleware, configure_tracing, get_metrics, shutdown_tracing
 
-# Create FastMCP server
-mcp = FastMCP("Paperless-NGX MCP Server")
+# Set by main() for Streamable HTTP, where the server is long-lived and
+# startup latency does not matter
+_start_eagerly = False
+
+# Set once start_services() has run
+_started = False
+
+
+def start_services() -> None:
+    """
+    Load the configuration and start the background tasks, once.
+
+    In stdio mode this runs on the first tool call rather than at startup, so
+    clients that spawn a server per session get the tool list without waiting
+    for configuration, the HTTP client's TLS setup or the metadata, mirror
+    and change watcher tasks. If the configuration is invalid, the error is
+    raised to the tool call and the next call tries again.
+    """
+    global _started
+    if _started:
+        return
+    from .config import get_config
+    from .export import get_export_store
+    from .metadata import get_metadata_cache
+    from .mirror import get_mirror
+    from .watcher import get_watcher
+
+    configure_tracing()
+    # A configured export directory other users can access is refused up front
+    if get_config().export_dir:
+        get_export_store()
+    metadata = get_metadata_cache()
+    if metadata is not None:
+        metadata.start()
+    mirror = get_mirror()
+    if mirror is not None:
+        mirror.start()
+    watcher = get_watcher()
+    if watcher is not None:
+        watcher.start()
+    _started = True
+
+
+class StartServicesMiddleware(Middleware):
+    """Run start_services() before the first tool call."""
+
+    async def on_call_tool(self, context, call_next):
+        start_services()
+        return await call_next(context)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Start background tasks (HTTP mode) and stop them with the server."""
+    from .api import close_shared_async_client, open_shared_async_client
+
+    if _start_eagerly:
+        start_services()
+        open_shared_async_client()
+    try:
+        yield
+    finally:
+        if _started:
+            from .export import close_export_store
+            from .metadata import get_metadata_cache
+            from .mirror import get_mirror
+            from .prefetch import get_prefetcher
+            from .watcher import get_watcher
+
+            watcher = get_watcher()
+            if watcher is not None:
+                await watcher.stop()
+            prefetcher = get_prefetcher()
+            if prefetcher is not None:
+                await prefetcher.stop()
+            mirror = get_mirror()
+            if mirror is not None:
+                await mirror.stop()
+            metadata = get_metadata_cache()
+            if metadata is not None:
+                await metadata.stop()
+            close_export_store()
+        await close_shared_async_client()
+        shutdown_tracing()
 
 
-# Register tools
+# Create FastMCP server
+mcp = FastMCP("Paperless-NGX MCP Server", lifespan=lifespan)
+# Added first, so tracing is configured before the instrumentation's span starts
+mcp.add_middleware(StartServicesMiddleware())
+mcp.add_middleware(InstrumentationMiddleware())
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> Response:
+    """Serve Prometheus metrics (Streamable HTTP mode only)."""
+    metrics = get_metrics()
+    if metrics is None:
+        return PlainTextResponse(
+            "Metrics are disabled. Install prometheus-client and set PAPERLESS_METRICS=true.",
+            status_code=404,
+        )
+    body, content_type = metrics.render()
+    return Response(body, media_type=content_type)
+
+
+# Register tools. Their implementations, and with them the API client, caches,
+# mirror and change watcher, are imported on the first call, not at startup.
 @mcp.tool()
-def search_documents(query: str = "", page: int = 1, page_size: int = 25) -> str:
+async def search_documents(
+    query: str = "",
+    page: int = 1,
+    page_size: int = 25,
+    tags: list[int | str] | None = None,
+    correspondent: int | str | None = None,
+    document_type: int | str | None = None,
+    created_from: str | None = None,
+    created_to: str | None = None,
+    added_from: str | None = None,
+    added_to: str | None = None,
+    archive_serial_number: int | None = None,
+    ordering: str | None = None,
+    snapshot: bool = False,
+    snapshot_id: str | None = None,
+) -> str:
     """
     Search Paperless-NGX documents and return results that should be presented to the user in a readable format.
 
     Use this tool to find documents by searching across titles, content, tags, correspondents, and other metadata.
+    Prefer the structured filters over query syntax for tags, correspondents, document types
+    and dates: they are faster and exact. Filters work without a query, e.g. "invoices from
+    ACME in 2024" is document_type="Invoice", correspondent="ACME", created_from="2024-01-01",
+    created_to="2024-12-31".
 
     Args:
-        query: Search query string (searches across title, content, tags, correspondent, etc.)
+        query: Search query string (searches across title, content, tags, correspondent, etc.).
+            Optional when filtering.
         page: Page number for pagination (default: 1)
         page_size: Number of results per page (default: 25, max: 100)
+        tags: Tag names or IDs; only documents having all of these tags are returned
+        correspondent: Correspondent name or ID
+        document_type: Document type name or ID
+        created_from: Earliest document date, YYYY-MM-DD (inclusive)
+        created_to: Latest document date, YYYY-MM-DD (inclusive)
+        added_from: Earliest date added to Paperless-NGX, YYYY-MM-DD (inclusive)
+        added_to: Latest date added to Paperless-NGX, YYYY-MM-DD (inclusive)
+        archive_serial_number: Archive serial number (ASN) of the document
+        ordering: Sort order: created, added, modified, title, archive_serial_number,
+            correspondent__name, document_type__name or id; prefix with "-" for descending
+            (e.g. "-created" for newest first)
+        snapshot: Freeze the complete result list and return a snapshot_id. Use this when you
+            will page through many results: later pages stay consistent and are cheaper.
+        snapshot_id: Return the given page of an earlier snapshot (other search arguments are
+            ignored). Snapshots expire after a while; then run the search again. Snapshot
+            pages give each match's rank but no score.
 
     Returns:
         JSON string containing search results. Parse and present the results to the user in a clear, readable format.
         Include key information like document titles, dates, and relevant content previews.
-        
+
         The JSON structure includes:
         - total_count: Total number of matching documents
         - has_next_page: Whether more results are available
-        - documents: Array with id, title, content_preview, correspondent, tags, created_date, original_file_name
+        - snapshot_id: Snapshot handle (only with snapshot=true or snapshot_id)
+        - documents: Array with id, title, content_preview, correspondent, tags, created_date, original_file_name,
+          score and rank (correspondent, document_type and tags are given by name)
+        For queries, content_preview shows the passages that matched, with matched words
+        marked as **word**, so there is usually no need to fetch a document to see why it matched.
     """
-    return search_documents_tool(query=query, page=page, page_size=page_size)
+    from .tools import search_documents_tool
+
+    return await search_documents_tool(
+        query=query,
+        page=page,
+        page_size=page_size,
+        tags=tags,
+        correspondent=correspondent,
+        document_type=document_type,
+        created_from=created_from,
+        created_to=created_to,
+        added_from=added_from,
+        added_to=added_to,
+        archive_serial_number=archive_serial_number,
+        ordering=ordering,
+        snapshot=snapshot,
+        snapshot_id=snapshot_id,
+    )
 
 
 @mcp.tool()
-def get_document(document_id: int) -> str:
+async def get_document(document_id: int) -> str:
     """
     Get complete details for a single Paperless-NGX document by its ID.
 
@@ -53,24 +214,167 @@ def get_document(document_id: int) -> str:
 
     Returns:
         JSON string with complete document details. Parse and present the information to the user clearly.
-        
+
         The JSON structure includes:
         - id, title, content (full text)
-        - correspondent, document_type, storage_path
-        - tags (array of tag IDs)
+        - correspondent, document_type, storage_path (by name)
+        - tags (array of tag names)
         - created_date, modified_date, added_date
         - archive_serial_number, original_file_name
         - custom_fields, notes
-        
+
         If the document is not found, returns an error message with the document_id.
+
+        For very long documents, prefer get_document_content to read the text in windows.
     """
-    return get_document_tool(document_id=document_id)
+    from .tools import get_document_tool
+
+    return await get_document_tool(document_id=document_id)
 
 
 @mcp.tool()
-def get_similar_documents(
-    document_id: int, page: int = 1, page_size: int = 25
+async def get_document_content(document_id: int, offset: int = 0, length: int = 10000) -> str:
+    """
+    Read the text content of a Paperless-NGX document in windows.
+
+    Use this tool for long documents (e.g. large scanned PDFs) instead of get_document.
+    Start at offset 0 and continue with next_offset until has_more is false.
+
+    Args:
+        document_id: The unique ID of the document
+        offset: Character offset to start reading from (default: 0)
+        length: Number of characters to return (default: 10000, max: 100000)
+
+    Returns:
+        JSON string with a window of the document text.
+
+        The JSON structure includes:
+        - document_id, offset, length (characters returned)
+        - total_length: Length of the full text in characters
+        - has_more: Whether text remains after this window
+        - next_offset: Offset of the next window (null at the end)
+        - content: The text of this window
+    """
+    from .tools import get_document_content_tool
+
+    return await get_document_content_tool(document_id=document_id, offset=offset, length=length)
+
+
+@mcp.tool()
+async def get_documents(document_ids: list[int]) -> str:
+    """
+    Get complete details for several Paperless-NGX documents in one call.
+
+    Use this tool instead of calling get_document repeatedly, e.g. for the documents
+    of a search result page.
+
+    Args:
+        document_ids: IDs of the documents to retrieve (max: 100)
+
+    Returns:
+        JSON string with the details of all requested documents.
+
+        The JSON structure includes:
+        - requested_count: Number of requested IDs
+        - found_count: Number of documents found
+        - documents: Array in request order. Each entry has the same fields as get_document,
+          or id and error if that document was not found.
+    """
+    from .tools import get_documents_tool
+
+    return await get_documents_tool(document_ids=document_ids)
+
+
+@mcp.tool()
+async def export_documents(
+    ctx: Context,
+    query: str = "",
+    tags: list[int | str] | None = None,
+    correspondent: int | str | None = None,
+    document_type: int | str | None = None,
+    created_from: str | None = None,
+    created_to: str | None = None,
+    added_from: str | None = None,
+    added_to: str | None = None,
+    archive_serial_number: int | None = None,
+    ordering: str | None = None,
+    include_content: bool = False,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK,
 ) -> str:
+    """
+    Export all documents matching a search, for processing more results than fit in a page.
+
+    Use this tool instead of paging through search_documents when you need every match (e.g.
+    "summarize all invoices from 2023"). Progress is reported while the export runs. The
+    documents are then read in chunks with read_export_chunk (or the export resource).
+
+    Args:
+        query: Search query string; optional when filtering
+        tags, correspondent, document_type, created_from, created_to, added_from, added_to,
+        archive_serial_number, ordering: Filters, as for search_documents
+        include_content: Include the full document text instead of a content preview
+            (default: false; exports get large quickly)
+        chunk_size: Documents per chunk (default: 50, max: 500)
+
+    Returns:
+        JSON string describing the export.
+
+        The JSON structure includes:
+        - export_id: ID to pass to read_export_chunk
+        - total_count, exported_count: Matching and exported documents
+        - chunk_size, chunk_count: Read chunks 0 to chunk_count - 1
+        - bytes: Size of the export
+        - expires_in_seconds: Time after which the export is deleted
+        - resource_uri_template: URI of each chunk as an MCP resource
+    """
+    from .tools import export_documents_tool
+
+    return await export_documents_tool(
+        query=query,
+        tags=tags,
+        correspondent=correspondent,
+        document_type=document_type,
+        created_from=created_from,
+        created_to=created_to,
+        added_from=added_from,
+        added_to=added_to,
+        archive_serial_number=archive_serial_number,
+        ordering=ordering,
+        include_content=include_content,
+        chunk_size=chunk_size,
+        progress=ctx.report_progress,
+    )
+
+
+@mcp.tool()
+def read_export_chunk(export_id: str, chunk: int = 0) -> str:
+    """
+    Read one chunk of an export created by export_documents.
+
+    Args:
+        export_id: export_id returned by export_documents
+        chunk: Chunk number, from 0 to chunk_count - 1 (default: 0)
+
+    Returns:
+        NDJSON text: one JSON document per line with id, title, content_preview (or content),
+        correspondent, document_type, tags, created_date and original_file_name.
+        Returns a JSON object with an "error" key if the export or chunk does not exist.
+    """
+    from .tools import read_export_chunk_tool
+
+    return read_export_chunk_tool(export_id=export_id, chunk=chunk)
+
+
+@mcp.resource(EXPORT_RESOURCE_TEMPLATE, mime_type="application/x-ndjson")
+def export_chunk(export_id: str, chunk: int) -> str:
+    """One chunk of a document export, one JSON document per line."""
+    from .export import get_export_store
+
+    return get_export_store().read_chunk(export_id, int(chunk))
+
+
+@mcp.tool()
+async def get_similar_documents(document_id: int, page: int = 1, page_size: int = 25) -> str:
     """
     Find documents similar to a given document using Paperless-NGX's similarity algorithm.
 
@@ -83,21 +387,110 @@ def get_similar_documents(
 
     Returns:
         JSON string with similar documents. Format matches search_documents output.
-        
+
         The JSON structure includes:
         - total_count: Total number of similar documents found
         - has_next_page: Whether more results are available
-        - documents: Array with id, title, content_preview, correspondent, tags, created_date, original_file_name
-        
+        - documents: Array with id, title, content_preview, correspondent, tags, created_date, original_file_name,
+          score and rank
+
         If the reference document is not found, returns an error message with the document_id.
     """
-    return get_similar_documents_tool(
-        document_id=document_id, page=page, page_size=page_size
+    from .tools import get_similar_documents_tool
+
+    return await get_similar_documents_tool(document_id=document_id, page=page, page_size=page_size)
+
+
+@mcp.tool()
+async def similarity_graph(document_ids: list[int], depth: int = 1, fan_out: int = 5) -> str:
+    """
+    Map the documents related to one or more documents in a single call.
+
+    Use this tool instead of calling get_similar_documents repeatedly, e.g. to find groups
+    of related documents or everything connected to a few known documents. The similar
+    documents of each seed are looked up, then (for depth > 1) those of the documents found,
+    and so on; lookups run concurrently and each document is looked up only once.
+
+    Args:
+        document_ids: IDs of the seed documents (at most 100)
+        depth: Levels of similarity lookups from the seeds (default: 1, max: 3)
+        fan_out: Most similar documents taken per lookup (default: 5, max: 25)
+
+    Returns:
+        JSON string with the graph.
+
+        The JSON structure includes:
+        - nodes: Array with id, title, correspondent, document_type, created_date and depth
+          (0 for seeds, 1 for their similar documents, ...)
+        - adjacency: Object mapping each looked-up document ID to its similar document IDs,
+          most similar first. Documents at the last level are not looked up.
+        - clusters: Arrays of connected document IDs, largest first
+        - not_found: Seed IDs that do not exist (if any)
+        - failed: Lookups that failed, with id and error (if any)
+        - unexpanded_count: Documents not looked up because the request budget was used up
+          (if any)
+    """
+    from .tools import similarity_graph_tool
+
+    return await similarity_graph_tool(document_ids=document_ids, depth=depth, fan_out=fan_out)
+
+
+@mcp.tool()
+async def document_stats(
+    group_by: str,
+    query: str = "",
+    tags: list[int | str] | None = None,
+    correspondent: int | str | None = None,
+    document_type: int | str | None = None,
+    created_from: str | None = None,
+    created_to: str | None = None,
+    added_from: str | None = None,
+    added_to: str | None = None,
+    archive_serial_number: int | None = None,
+) -> str:
+    """
+    Count matching documents per tag, correspondent, document type, year or month.
+
+    Use this tool for counting questions such as "how many documents per correspondent in
+    2024" or "invoices per month last year" instead of paging through search_documents and
+    counting: no documents are downloaded.
+
+    Args:
+        group_by: "tag", "correspondent", "document_type", "created_year" or "created_month"
+        query: Search query string; optional when filtering
+        tags, correspondent, document_type, created_from, created_to, added_from, added_to,
+        archive_serial_number: Filters, as for search_documents
+
+    Returns:
+        JSON string with the counts.
+
+        The JSON structure includes:
+        - total_count: Number of matching documents
+        - buckets: Array with key (ID, year or "YYYY-MM"), name and count. Tags,
+          correspondents and document types without matches are left out and the rest are
+          sorted by count; periods are listed in order, including empty ones.
+          A document with several tags is counted for each of them.
+        - unassigned_count: Matches without a correspondent/document type (if grouped by one)
+        - uncounted_buckets: Groups left out because there were too many (if any)
+    """
+    from .tools import document_stats_tool
+
+    return await document_stats_tool(
+        group_by=group_by,
+        query=query,
+        tags=tags,
+        correspondent=correspondent,
+        document_type=document_type,
+        created_from=created_from,
+        created_to=created_to,
+        added_from=added_from,
+        added_to=added_to,
+        archive_serial_number=archive_serial_number,
     )
 
 
 @mcp.tool()
-def list_tags() -> str:
+async def list_tags() -> str:
     """
     Get all available tags from Paperless-NGX.
 
@@ -105,7 +498,7 @@ def list_tags() -> str:
 
     Returns:
         JSON string with all tags and their metadata. Present the tags to the user in a clear format.
-        
+
         The JSON structure includes:
         - total_count: Total number of tags
         - tags: Array of tag objects with:
@@ -115,11 +508,13 @@ def list_tags() -> str:
           - text_color: Text color for the tag (black or white)
           - document_count: Number of documents with this tag
     """
-    return list_tags_tool()
+    from .tools import list_tags_tool
+
+    return await list_tags_tool()
 
 
 @mcp.tool()
-def autocomplete_search(term: str, limit: int = 10) -> str:
+async def autocomplete_search(term: str, limit: int = 10) -> str:
     """
     Get search term suggestions based on the Paperless-NGX document index.
 
@@ -132,13 +527,121 @@ def autocomplete_search(term: str, limit: int = 10) -> str:
 
     Returns:
         JSON string with suggested search terms ordered by relevance.
-        
+
         The JSON structure includes:
         - term: The original search term
         - suggestions: Array of suggested complete terms (ordered by relevance)
         - count: Number of suggestions returned
     """
-    return autocomplete_search_tool(term=term, limit=limit)
+    from .tools import autocomplete_search_tool
+
+    return await autocomplete_search_tool(term=term, limit=limit)
+
+
+@mcp.tool()
+async def mirror_status() -> str:
+    """
+    Get the status of the local document mirror used for fast offline search.
+
+    Use this tool to check whether search results may lag behind Paperless-NGX.
+
+    Returns:
+        JSON string with the mirror status.
+
+        The JSON structure includes:
+        - enabled: Whether mirror mode is enabled (other fields only if true)
+        - documents: Number of mirrored documents
+        - ready, syncing: Whether the mirror has synced / is syncing now
+        - last_sync, lag_seconds: Time of the last completed sync and seconds since then
+        - newest_modified: Modification time of the newest mirrored document
+        - last_error: Error of the last failed sync, if any
+    """
+    from .tools import mirror_status_tool
+
+    return await mirror_status_tool()
+
+
+@mcp.tool()
+def server_stats() -> str:
+    """
+    Get cache and request coalescing statistics of the MCP server.
+
+    Use this tool to diagnose performance, e.g. how many document lookups were served from cache.
+
+    Returns:
+        JSON string with statistics.
+
+        The JSON structure includes:
+        - document_cache, content_cache, list_cache, snapshot_cache, http_cache: entries, bytes,
+          hits, misses, revalidations, evictions and hit_ratio (null if disabled)
+        - autocomplete_cache: entries, bytes, hits (of which refinements were filtered from a
+          shorter prefix), misses, evictions and hit_ratio (null if disabled)
+        - request_coalescing: executed and coalesced upstream requests (null if disabled)
+        - prefetch: scheduled, hits, joined, skipped and cancelled page prefetches
+          (null if disabled)
+        - watcher: polls, watermark and changed/deleted documents and metadata changes
+          seen by the change watcher (null if disabled)
+        - upstream: adaptive concurrency limit, circuit breaker state and retry count
+        - process: peak_rss_bytes (peak resident memory of the server process)
+    """
+    from .tools import server_stats_tool
+
+    return server_stats_tool()
+
+
+@mcp.tool()
+def http_cache(clear: bool = False) -> str:
+    """
+    Get statistics of the persistent HTTP cache, or clear it.
+
+    The cache keeps Paperless-NGX responses on disk across server restarts (PAPERLESS_HTTP_CACHE).
+    Clear it if results look outdated, e.g. right after editing documents in Paperless-NGX.
+
+    Args:
+        clear: Delete all cached responses before reporting (default: false)
+
+    Returns:
+        JSON string with cache statistics.
+
+        The JSON structure includes:
+        - enabled: Whether the cache is enabled (other fields only if true)
+        - cleared_entries: Number of deleted responses (only with clear=true)
+        - path, entries, bytes, max_bytes, ttl_seconds: Cache file and usage
+        - hits, revalidations, misses, evictions, hit_ratio: Counters of this server process
+    """
+    from .tools import http_cache_tool
+
+    return http_cache_tool(clear=clear)
+
+
+def rebuild_mirror() -> int:
+    """
+    Discard the local document mirror and resynchronize it from Paperless-NGX.
+
+    Returns:
+        Number of documents mirrored
+
+    Raises:
+        Exception: If mirror mode is disabled or Paperless-NGX is unreachable
+    """
+    from .api import close_shared_async_client, open_shared_async_client
+    from .mirror import get_mirror
+
+    mirror = get_mirror()
+    if mirror is None:
+        raise Exception("Mirror mode is disabled. Set PAPERLESS_MIRROR=true to enable it.")
+
+    async def run() -> int:
+        open_shared_async_client()
+        try:
+            return await mirror.rebuild()
+        finally:
+            await close_shared_async_client()
+
+    try:
+        return asyncio.run(run())
+    finally:
+        mirror.close()
 
 
 def main(port: int | None = None, host: str = "127.0.0.1"):
@@ -150,13 +653,15 @@ def main(port: int | None = None, host: str = "127.0.0.1"):
               If None, use stdio transport (default).
         host: Host to bind to (default: 127.0.0.1). Use 0.0.0.0 for Docker access.
     """
+    global _start_eagerly
     if port:
         # Streamable HTTP mode for OpenWebUI
         print(f"Starting Paperless-NGX MCP server on {host}:{port}...", file=sys.stderr)
+        _start_eagerly = True
         mcp.run(transport="streamable-http", port=port, host=host)
     else:
-        # stdio mode for VS Code and Claude Desktop
-        mcp.run(transport="stdio")
+        # stdio mode for VS Code and Claude Desktop; the banner only delays startup
+        mcp.run(transport="stdio", show_banner=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,120 @@
+"""Query-aware content previews for search results.
+
+Paperless-NGX returns the matching passages of each full-text search hit as
+HTML highlights (``__search_hit__``). They are turned into plain text with
+matches marked as ``**term**``. Without highlights, the preview is a window
+of the (possibly truncated) content around the first occurrence of a query
+term, and the start of the content if no term occurs in it.
+"""
+
+import html
+import re
+from functools import lru_cache
+
+# Characters of content in a preview window
+PREVIEW_LENGTH = 200
+
+# Highlights may hold several passages, so they are allowed to be longer
+MAX_HIGHLIGHT_LENGTH = 2 * PREVIEW_LENGTH
+
+# Characters shown before the first match in a window
+_LEAD = 60
+
+_MATCH = re.compile(r'<span class="match[^"]*">(.*?)</span>', re.DOTALL)
+_TAG = re.compile(r"<[^>]+>")
+# Field prefixes (tag:, correspondent:, ...) do not occur in the content
+_FIELD_PREFIX = re.compile(r"\w+:")
+_TERM = re.compile(r"\w+")
+_OPERATORS = {"AND", "OR", "NOT", "TO"}
+
+
+def _shorten(text: str, length: int) -> str:
+    """Cut text to at most ``length`` characters at a word boundary."""
+    if len(text) <= length:
+        return text
+    cut = text.rfind(" ", 0, length)
+    return text[: cut if cut > 0 else length].rstrip() + "..."
+
+
+def highlight_text(highlights: str) -> str:
+    """
+    Turn Paperless-NGX search highlights into plain text.
+
+    Args:
+        highlights: HTML passages with matches in ``<span class="match ...">``
+
+    Returns:
+        Text with matches marked as ``**term**`` and whitespace collapsed
+    """
+    text = html.unescape(_TAG.sub("", _MATCH.sub(r"**\1**", highlights)))
+    return _shorten(" ".join(text.split()), MAX_HIGHLIGHT_LENGTH)
+
+
+@lru_cache(maxsize=64)
+def term_pattern(query: str) -> re.Pattern | None:
+    """
+    Compile a pattern matching the words of a query at word starts.
+
+    Returns:
+        Case-insensitive pattern, or None if the query has no searchable words
+    """
+    terms = {
+        term.lower()
+        for term in _TERM.findall(_FIELD_PREFIX.sub(" ", query))
+        if term not in _OPERATORS and len(term) > 1
+    }
+    if not terms:
+        return None
+    # Longer terms first, so a term is not cut short by one of its prefixes
+    alternatives = "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternatives})\w*", re.IGNORECASE)
+
+
+def window_text(content: str, query: str) -> str | None:
+    """
+    Cut a window of the content around the first occurrence of a query term.
+
+    Args:
+        content: Document content
+        query: Search query
+
+    Returns:
+        Window with matches marked as ``**term**``, or None if no term occurs
+    """
+    pattern = term_pattern(query)
+    match = pattern.search(content) if pattern is not None else None
+    if match is None:
+        return None
+    start = max(0, match.start() - _LEAD)
+    if start:
+        # Start at a word boundary
+        space = content.find(" ", start, match.start())
+        start = space + 1 if space >= 0 else start
+    window = " ".join(content[start:].split())
+    text = _shorten(window, PREVIEW_LENGTH)
+    text = pattern.sub(lambda m: f"**{m.group(0)}**", text)
+    return ("..." if start else "") + text
+
+
+def preview(content: str, query: str = "", highlights: str = "") -> str:
+    """
+    Build the content preview of a search result.
+
+    Args:
+        content: Document content (Paperless-NGX may have truncated it)
+        query: Search query, used when there are no highlights
+        highlights: ``__search_hit__`` highlights, if any
+
+    Returns:
+        Highlighted passages, a window around the first query term, or the
+        start of the content
+    """
+    if highlights:
+        text = highlight_text(highlights)
+        if text:
+            return text
+    if query:
+        text = window_text(content, query)
+        if text is not None:
+            return text
+    return content[:PREVIEW_LENGTH] + "..." if len(content) > PREVIEW_LENGTH else content
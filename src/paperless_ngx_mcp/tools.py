@@ -1,140 +1,817 @@
 """MCP tools for Paperless-NGX."""
 
+import asyncio
+import calendar
 import json
+import secrets
+import sys
+from array import array
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from datetime import date
 from typing import Any
 
-from .api import PaperlessAPI
+from .api import (
+    AsyncPaperlessAPI,
+    DocumentFilters,
+    get_async_api,
+    get_coalescing_stats,
+    get_resilience_stats,
+    upstream_busy,
+)
+from .cache import (
+    ResultSnapshot,
+    get_autocomplete_cache,
+    get_content_cache,
+    get_document_cache,
+    get_list_cache,
+    get_snapshot_cache,
+)
+from .config import get_config
+from .export import (
+    DEFAULT_EXPORT_CHUNK,
+    EXPORT_RESOURCE_TEMPLATE,
+    MAX_EXPORT_CHUNK,
+    get_export_store,
+)
+from .http_cache import get_http_cache
+from .metadata import METADATA_ENDPOINTS, MetadataCache, get_metadata
+from .mirror import get_mirror
+from .models import (
+    Bucket,
+    Document,
+    DocumentSummary,
+    GraphNode,
+    Suggestions,
+    Tag,
+    encode,
+    resolve_name,
+)
+from .prefetch import get_prefetcher
+from .watcher import get_watcher
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
 
-def format_document_results(api_response: dict[str, Any]) -> str:
+# Document fields used by format_document_results. Search requests ask
+# Paperless-NGX for only these fields, with ``content`` truncated server-side,
+# instead of downloading every document's full OCR text.
+DOCUMENT_RESULT_FIELDS = (
+    "id",
+    "title",
+    "content",
+    "correspondent",
+    "document_type",
+    "tags",
+    "created_date",
+    "original_file_name",
+)
+
+# Upper bound on document IDs accepted by get_documents
+MAX_BATCH_DOCUMENTS = 100
+
+# Window sizes (in characters) for get_document_content
+DEFAULT_CONTENT_WINDOW = 10_000
+MAX_CONTENT_WINDOW = 100_000
+
+# Groupings of document_stats and the metadata kind whose items are the groups
+# (None for calendar periods of the creation date)
+STATS_GROUPS = {
+    "tag": "tags",
+    "correspondent": "correspondents",
+    "document_type": "document_types",
+    "created_year": None,
+    "created_month": None,
+}
+
+# Limits of similarity_graph: similarity searches between a seed and the
+# farthest document, and similar documents taken from each search
+MAX_GRAPH_DEPTH = 3
+MAX_GRAPH_FAN_OUT = 25
+
+# Document fields of similarity_graph nodes (no content is needed)
+GRAPH_NODE_FIELDS = ("id", "title", "correspondent", "document_type", "created_date")
+
+# Called with (done, total) while a long-running tool makes progress
+ProgressCallback = Callable[[float, float | None], Awaitable[None]]
+
+
+def format_document_results(
+    api_response: dict[str, Any],
+    metadata: MetadataCache | None = None,
+    extra: dict[str, Any] | None = None,
+    query: str = "",
+) -> str:
     """
-    Format Paperless-NGX API response into readable JSON string.
+    Format Paperless-NGX API response as a JSON string.
 
     Args:
         api_response: Raw API response from Paperless-NGX
+        metadata: Metadata used to resolve tag, correspondent and document
+            type IDs to names (IDs are kept if omitted)
+        extra: Additional top-level fields for the result
+        query: Search query, used for previews of results without highlights
 
     Returns:
         Formatted JSON string for AI consumption
     """
     results = api_response.get("results", [])
-    count = api_response.get("count", 0)
-    next_page = api_response.get("next")
-    previous_page = api_response.get("previous")
-
-    formatted_docs = []
-    for doc in results:
-        # Truncate content preview to 200 characters
-        content = doc.get("content", "")
-        content_preview = (
-            content[:200] + "..." if len(content) > 200 else content
-        )
-
-        formatted_doc = {
-            "id": doc.get("id"),
-            "title": doc.get("title"),
-            "content_preview": content_preview,
-            "correspondent": doc.get("correspondent"),
-            "document_type": doc.get("document_type"),
-            "tags": doc.get("tags", []),
-            "created_date": doc.get("created_date"),
-            "original_file_name": doc.get("original_file_name"),
-        }
-        formatted_docs.append(formatted_doc)
-
     result = {
-        "total_count": count,
+        "total_count": api_response.get("count", 0),
         "page_size": len(results),
-        "has_next_page": next_page is not None,
-        "has_previous_page": previous_page is not None,
-        "documents": formatted_docs,
+        "has_next_page": api_response.get("next") is not None,
+        "has_previous_page": api_response.get("previous") is not None,
+        **(extra or {}),
+        "documents": [DocumentSummary.from_api(doc, metadata, query) for doc in results],
     }
+    return encode(result)
+
+
+# Singular labels of metadata kinds, used in error messages
+_KIND_LABELS = {
+    "tags": "tag",
+    "correspondents": "correspondent",
+    "document_types": "document type",
+}
+
 
-    return json.dumps(result, indent=2)
+async def _resolve_ids(kind: str, values: list[int | str]) -> list[int]:
+    """
+    Resolve metadata names or IDs to IDs using the metadata cache.
+
+    An unknown name reloads the cache, in case the item was created since the
+    last reload; such reloads are rate-limited by the cache.
+
+    Raises:
+        Exception: If a name cannot be resolved
+    """
+    metadata = await get_metadata()
+    refreshed = False
+    ids = []
+    for value in values:
+        if metadata is not None:
+            id_ = metadata.lookup_id(kind, value)
+            if id_ is None and not refreshed:
+                refreshed = True
+                if await metadata.refresh_for_unknown_name():
+                    id_ = metadata.lookup_id(kind, value)
+        elif isinstance(value, int) or value.strip().isdigit():
+            id_ = int(value)
+        else:
+            raise Exception(
+                f"Cannot resolve {_KIND_LABELS[kind]} name {value!r}: the metadata cache "
+                f"is disabled (PAPERLESS_METADATA_CACHE). Pass the ID instead."
+            )
+        if id_ is None:
+            raise Exception(
+                f"Unknown {_KIND_LABELS[kind]} {value!r}: no {_KIND_LABELS[kind]} has this "
+                f"name (case-insensitive) or ID."
+            )
+        ids.append(id_)
+    return ids
+
+
+def _check_date(name: str, value: str | None) -> str | None:
+    """Validate an ISO date filter, returning it unchanged."""
+    if value is not None:
+        try:
+            date.fromisoformat(value)
+        except ValueError as e:
+            raise Exception(f"{name} must be a date in YYYY-MM-DD format, got {value!r}.") from e
+    return value
+
+
+async def build_document_filters(
+    tags: list[int | str] | None = None,
+    correspondent: int | str | None = None,
+    document_type: int | str | None = None,
+    created_from: str | None = None,
+    created_to: str | None = None,
+    added_from: str | None = None,
+    added_to: str | None = None,
+    archive_serial_number: int | None = None,
+    ordering: str | None = None,
+) -> DocumentFilters | None:
+    """
+    Build structured document filters from tool arguments.
+
+    Tags, correspondents and document types may be given by name or ID;
+    names are resolved through the metadata cache.
+
+    Returns:
+        The filters, or None if no filter argument was given
+
+    Raises:
+        Exception: If a name is unknown or a date is malformed
+    """
+    filters = DocumentFilters(
+        tags=await _resolve_ids("tags", tags or []),
+        correspondents=await _resolve_ids(
+            "correspondents", [correspondent] if correspondent is not None else []
+        ),
+        document_types=await _resolve_ids(
+            "document_types", [document_type] if document_type is not None else []
+        ),
+        created_from=_check_date("created_from", created_from),
+        created_to=_check_date("created_to", created_to),
+        added_from=_check_date("added_from", added_from),
+        added_to=_check_date("added_to", added_to),
+        archive_serial_number=archive_serial_number,
+        ordering=ordering or None,
+    )
+    return filters if filters.to_params() else None
+
+
+async def _fetch_page(
+    key: tuple,
+    page: int,
+    fetch: Callable[[AsyncPaperlessAPI, int], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """
+    Fetch a result page, using and scheduling speculative prefetches.
+
+    If prefetching is enabled, a page fetched earlier in the background is
+    returned without contacting Paperless-NGX, and the page after the
+    returned one is prefetched if there is one.
+
+    Args:
+        key: Identity of the result set (excluding the page number)
+        page: Page number to fetch
+        fetch: Coroutine function requesting a given page from the API
+
+    Returns:
+        API response for the page
+    """
+    prefetcher = get_prefetcher()
+    response = await prefetcher.take((*key, page)) if prefetcher is not None else None
+    if response is None:
+        async with get_async_api() as api:
+            response = await fetch(api, page)
+
+    if prefetcher is not None and response.get("next"):
+
+        async def prefetch() -> dict[str, Any]:
+            async with get_async_api(coalesce=False) as api:
+                return await fetch(api, page + 1)
+
+        prefetcher.schedule((*key, page + 1), prefetch, upstream_busy=upstream_busy())
+    return response
+
+
+def _create_snapshot(api_response: dict[str, Any], query: str) -> dict[str, Any]:
+    """
+    Store the ordered IDs of a search result as a snapshot.
+
+    Args:
+        api_response: Documents endpoint response, including the ``all`` ID list
+        query: Query of the search, kept for reference
+
+    Returns:
+        Result fields announcing the snapshot
+
+    Raises:
+        Exception: If snapshots are disabled or the response lacks the ID list
+    """
+    snapshots = get_snapshot_cache()
+    if snapshots is None:
+        raise Exception("Result snapshots are disabled (PAPERLESS_SNAPSHOT_TTL=0).")
+    if "all" not in api_response:
+        raise Exception("This Paperless-NGX version does not report result IDs for snapshots.")
+    snapshot_id = secrets.token_urlsafe(9)
+    ranked = any("__search_hit__" in doc for doc in api_response.get("results", []))
+    snapshot = ResultSnapshot(ids=array("I", api_response["all"]), query=query, ranked=ranked)
+    snapshots.set(snapshot_id, snapshot, size=snapshot.size)
+    return {"snapshot_id": snapshot_id, "snapshot_expires_in_seconds": snapshots.ttl}
+
+
+async def _snapshot_page(snapshot_id: str, page: int, page_size: int) -> str:
+    """
+    Serve a page of a stored result snapshot.
+
+    Only the documents of the requested page are fetched from Paperless-NGX.
+    Documents deleted since the snapshot was taken are listed separately.
+
+    Paperless-NGX reports relevance scores only for the page a search
+    returns, and documents fetched by ID have none, so snapshot pages give
+    no ``score``. The ``rank`` of a full-text match is its position in the
+    snapshot, the same on every page.
+
+    Raises:
+        Exception: If the snapshot is unknown or has expired
+    """
+    snapshots = get_snapshot_cache()
+    snapshot = snapshots.get(snapshot_id) if snapshots is not None else None
+    if snapshot is None:
+        raise Exception(
+            f"Snapshot {snapshot_id!r} is unknown or has expired. "
+            f"Run the search again with snapshot=true."
+        )
+    start = (page - 1) * page_size
+    page_ids = list(snapshot.ids[start : start + page_size])
+    documents: list[dict[str, Any]] = []
+    if page_ids:
+        async with get_async_api() as api:
+            documents = await api.get_documents(
+                page_ids, fields=DOCUMENT_RESULT_FIELDS, truncate_content=True
+            )
+    by_id = {doc["id"]: doc for doc in documents}
+    response = {
+        "count": len(snapshot.ids),
+        "next": page + 1 if start + page_size < len(snapshot.ids) else None,
+        "previous": page - 1 if page > 1 else None,
+        "results": [
+            {**by_id[doc_id], "__search_hit__": {"rank": start + position}}
+            if snapshot.ranked
+            else by_id[doc_id]
+            for position, doc_id in enumerate(page_ids)
+            if doc_id in by_id
+        ],
+    }
+    extra: dict[str, Any] = {"snapshot_id": snapshot_id, "page": page}
+    deleted = [doc_id for doc_id in page_ids if doc_id not in by_id]
+    if deleted:
+        extra["deleted_since_snapshot"] = deleted
+    return format_document_results(response, await get_metadata(), extra, snapshot.query)
 
 
-def search_documents_tool(query: str = "", page: int = 1, page_size: int = 25) -> str:
+async def search_documents_tool(
+    query: str = "",
+    page: int = 1,
+    page_size: int = 25,
+    tags: list[int | str] | None = None,
+    correspondent: int | str | None = None,
+    document_type: int | str | None = None,
+    created_from: str | None = None,
+    created_to: str | None = None,
+    added_from: str | None = None,
+    added_to: str | None = None,
+    archive_serial_number: int | None = None,
+    ordering: str | None = None,
+    snapshot: bool = False,
+    snapshot_id: str | None = None,
+) -> str:
     """
-    Search Paperless-NGX documents by query string.
+    Search Paperless-NGX documents by query string and structured filters.
+
+    Plain-text queries without filters are answered from the local mirror
+    when mirror mode is enabled and synced; other searches, and any mirror
+    failure, go to Paperless-NGX. Filters map onto Paperless-NGX's database
+    filters, so a search with filters but no query skips the full-text index.
+
+    With ``snapshot`` the ordered IDs of all matches are stored under a
+    snapshot ID. Later pages requested with that ``snapshot_id`` are served
+    from the snapshot without re-running the search, so pages stay consistent
+    even if documents are added in the meantime.
 
     Args:
         query: Search query (searches across title, content, tags, etc.)
         page: Page number (default: 1)
         page_size: Number of results per page (default: 25)
+        tags: Tag names or IDs; documents must have all of them
+        correspondent: Correspondent name or ID
+        document_type: Document type name or ID
+        created_from: Earliest creation date (YYYY-MM-DD, inclusive)
+        created_to: Latest creation date (YYYY-MM-DD, inclusive)
+        added_from: Earliest date added to Paperless-NGX (YYYY-MM-DD, inclusive)
+        added_to: Latest date added to Paperless-NGX (YYYY-MM-DD, inclusive)
+        archive_serial_number: Archive serial number (ASN)
+        ordering: Sort field such as "created" or "-created" (newest first)
+        snapshot: Store the result as a snapshot and return its ``snapshot_id``
+        snapshot_id: Serve ``page`` from this snapshot; the search arguments
+            are then ignored
 
     Returns:
         JSON string with matching documents and pagination info
     """
+    filter_args = {
+        "tags": tags,
+        "correspondent": correspondent,
+        "document_type": document_type,
+        "created_from": created_from,
+        "created_to": created_to,
+        "added_from": added_from,
+        "added_to": added_to,
+        "archive_serial_number": archive_serial_number,
+        "ordering": ordering,
+    }
     try:
-        with PaperlessAPI() as api:
-            response = api.search_documents(
-                query=query, page=page, page_size=page_size
+        if page < 1:
+            raise Exception("page must be at least 1.")
+        if snapshot_id:
+            return await _snapshot_page(snapshot_id, page, page_size)
+
+        filters = await build_document_filters(**filter_args)
+
+        mirror = get_mirror()
+        if mirror is not None and filters is None and not snapshot:
+            try:
+                response = await mirror.search(query=query, page=page, page_size=page_size)
+                if response is not None:
+                    return format_document_results(response, await get_metadata(), query=query)
+            except Exception as e:
+                print(f"Mirror search failed, using Paperless-NGX: {e}", file=sys.stderr)
+
+        def fetch(api: AsyncPaperlessAPI, page: int) -> Awaitable[dict[str, Any]]:
+            return api.search_documents(
+                query=query,
+                page=page,
+                page_size=page_size,
+                fields=DOCUMENT_RESULT_FIELDS,
+                truncate_content=True,
+                filters=filters,
             )
-            return format_document_results(response)
+
+        filter_key = tuple(sorted(filters.to_params().items())) if filters is not None else ()
+        response = await _fetch_page(("search", query, page_size, filter_key), page, fetch)
+        extra = _create_snapshot(response, query) if snapshot else None
+        return format_document_results(response, await get_metadata(), extra, query)
     except Exception as e:
         error_result = {
             "error": str(e),
             "query": query,
             "page": page,
             "page_size": page_size,
+            **{name: value for name, value in filter_args.items() if value is not None},
+            **({"snapshot_id": snapshot_id} if snapshot_id else {}),
         }
-        return json.dumps(error_result, indent=2)
+        return encode(error_result)
 
 
-def format_single_document(api_response: dict[str, Any]) -> str:
+def format_single_document(
+    api_response: dict[str, Any], metadata: MetadataCache | None = None
+) -> str:
     """
-    Format a single document's complete details into readable JSON string.
+    Format a single document's complete details as a JSON string.
 
     Args:
         api_response: Raw API response for a single document
+        metadata: Metadata used to resolve IDs to names (IDs are kept if omitted)
 
     Returns:
         Formatted JSON string with complete document information
     """
-    formatted_doc = {
-        "id": api_response.get("id"),
-        "title": api_response.get("title"),
-        "content": api_response.get("content", ""),
-        "correspondent": api_response.get("correspondent"),
-        "document_type": api_response.get("document_type"),
-        "storage_path": api_response.get("storage_path"),
-        "tags": api_response.get("tags", []),
-        "created_date": api_response.get("created_date"),
-        "modified_date": api_response.get("modified"),
-        "added_date": api_response.get("added"),
-        "archive_serial_number": api_response.get("archive_serial_number"),
-        "original_file_name": api_response.get("original_file_name"),
-        "custom_fields": api_response.get("custom_fields", []),
-        "notes": api_response.get("notes", []),
-    }
+    return encode(Document.from_api(api_response, metadata))
 
-    return json.dumps(formatted_doc, indent=2)
 
-
-def get_document_tool(document_id: int) -> str:
+async def get_document_tool(document_id: int) -> str:
     """
     Get complete details for a single document by ID.
 
+    Results are served from the in-memory document cache when possible.
+
     Args:
         document_id: ID of the document to retrieve
 
     Returns:
         JSON string with complete document details
     """
+    cache = get_document_cache()
+    if cache is not None:
+        cached = cache.get(document_id)
+        if cached is not None:
+            return cached
+
     try:
-        with PaperlessAPI() as api:
-            response = api.get_document(document_id)
-            return format_single_document(response)
+        async with get_async_api() as api:
+            # An expired entry is still served if the document is unchanged
+            stale = cache.peek(document_id) if cache is not None else None
+            changed = stale is not None and stale.version is not None
+            if changed:
+                modified = await api.get_document_modified(document_id)
+                if modified == stale.version:
+                    cache.touch(document_id)
+                    return stale.value
+
+            # A changed document must not be answered by the HTTP cache
+            response = await api.get_document(document_id, use_http_cache=not changed)
+        result = format_single_document(response, await get_metadata())
+        if cache is not None:
+            cache.set(document_id, result, version=response.get("modified"))
+        return result
     except Exception as e:
         error_result = {
             "error": str(e),
             "document_id": document_id,
         }
-        return json.dumps(error_result, indent=2)
+        return encode(error_result)
+
+
+async def get_documents_tool(document_ids: list[int]) -> str:
+    """
+    Get complete details for many documents in one call.
+
+    Cached documents are served from the document cache; the rest are
+    fetched in bulk. IDs that do not exist are reported per item.
+
+    Args:
+        document_ids: IDs of the documents to retrieve (at most 100)
+
+    Returns:
+        JSON string with one entry per requested ID, in request order
+    """
+    if len(document_ids) > MAX_BATCH_DOCUMENTS:
+        error_result = {
+            "error": f"At most {MAX_BATCH_DOCUMENTS} document IDs can be requested at once.",
+            "document_ids": document_ids,
+        }
+        return encode(error_result)
+
+    cache = get_document_cache()
+    documents: dict[int, Document | dict[str, Any]] = {}
+    missing = []
+    for document_id in dict.fromkeys(document_ids):
+        cached = cache.get(document_id) if cache is not None else None
+        if cached is not None:
+            documents[document_id] = json.loads(cached)
+        else:
+            missing.append(document_id)
+
+    try:
+        if missing:
+            async with get_async_api() as api:
+                responses = await api.get_documents(missing)
+            metadata = await get_metadata()
+            for response in responses:
+                document = Document.from_api(response, metadata)
+                documents[response["id"]] = document
+                if cache is not None:
+                    cache.set(response["id"], encode(document), version=response.get("modified"))
+    except Exception as e:
+        error_result = {
+            "error": str(e),
+            "document_ids": document_ids,
+        }
+        return encode(error_result)
+
+    results = [
+        documents.get(document_id)
+        or {"id": document_id, "error": f"Document with ID {document_id} not found."}
+        for document_id in document_ids
+    ]
+    result = {
+        "requested_count": len(document_ids),
+        "found_count": sum(1 for document_id in document_ids if document_id in documents),
+        "documents": results,
+    }
+    return encode(result)
+
+
+async def _get_document_text(document_id: int) -> str:
+    """
+    Get a document's full text, using the content cache when possible.
+
+    Raises:
+        Exception: If document not found or API request fails
+    """
+    cache = get_content_cache()
+    if cache is not None:
+        cached = cache.get(document_id)
+        if cached is not None:
+            return cached
+
+    async with get_async_api() as api:
+        stale = cache.peek(document_id) if cache is not None else None
+        changed = stale is not None and stale.version is not None
+        if changed:
+            modified = await api.get_document_modified(document_id)
+            if modified == stale.version:
+                cache.touch(document_id)
+                return stale.value
+
+        response = await api.get_document(
+            document_id, fields=("id", "content", "modified"), use_http_cache=not changed
+        )
+    content = response.get("content") or ""
+    if cache is not None:
+        cache.set(document_id, content, version=response.get("modified"))
+    return content
+
+
+async def get_document_content_tool(
+    document_id: int, offset: int = 0, length: int = DEFAULT_CONTENT_WINDOW
+) -> str:
+    """
+    Get a window of a document's text content.
+
+    The full text is fetched once and kept in the content cache, so paging
+    through a large document does not re-download it for every window.
+
+    Args:
+        document_id: ID of the document
+        offset: Character offset of the window start (default: 0)
+        length: Number of characters to return (default: 10000, max: 100000)
+
+    Returns:
+        JSON string with the content window and paging information
+    """
+    try:
+        if offset < 0:
+            raise ValueError("offset must not be negative.")
+        if not 0 < length <= MAX_CONTENT_WINDOW:
+            raise ValueError(f"length must be between 1 and {MAX_CONTENT_WINDOW}.")
+
+        content = await _get_document_text(document_id)
+        window = content[offset : offset + length]
+        end = offset + len(window)
+        result = {
+            "document_id": document_id,
+            "offset": offset,
+            "length": len(window),
+            "total_length": len(content),
+            "has_more": end < len(content),
+            "next_offset": end if end < len(content) else None,
+            "content": window,
+        }
+        return encode(result)
+    except Exception as e:
+        error_result = {
+            "error": str(e),
+            "document_id": document_id,
+            "offset": offset,
+            "length": length,
+        }
+        return encode(error_result)
+
+
+def _export_record(
+    doc: dict[str, Any], metadata: MetadataCache | None, include_content: bool
+) -> dict[str, Any]:
+    """Build the exported representation of a document."""
+    return {
+        "id": doc.get("id"),
+        "title": doc.get("title"),
+        "correspondent": resolve_name(metadata, "correspondents", doc.get("correspondent")),
+        "document_type": resolve_name(metadata, "document_types", doc.get("document_type")),
+        "tags": [resolve_name(metadata, "tags", tag) for tag in doc.get("tags", [])],
+        "created_date": doc.get("created_date"),
+        "original_file_name": doc.get("original_file_name"),
+        "content" if include_content else "content_preview": doc.get("content", ""),
+    }
 
 
-def get_similar_documents_tool(
-    document_id: int, page: int = 1, page_size: int = 25
+async def export_documents_tool(
+    query: str = "",
+    tags: list[int | str] | None = None,
+    correspondent: int | str | None = None,
+    document_type: int | str | None = None,
+    created_from: str | None = None,
+    created_to: str | None = None,
+    added_from: str | None = None,
+    added_to: str | None = None,
+    archive_serial_number: int | None = None,
+    ordering: str | None = None,
+    include_content: bool = False,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK,
+    progress: ProgressCallback | None = None,
 ) -> str:
+    """
+    Export every document matching a search to an NDJSON file read in chunks.
+
+    The first page reveals the IDs of all matches (Paperless-NGX's ``all``
+    list). The remaining documents are fetched by ID in batches of 100, at
+    most ``pagination_concurrency`` at a time, and appended to the export as
+    they arrive in result order, so memory use stays flat however many
+    documents match.
+
+    Args:
+        query: Full-text search query; empty to export by filters only
+        tags, correspondent, document_type, created_from, created_to,
+        added_from, added_to, archive_serial_number, ordering: Filters as
+            for search_documents_tool
+        include_content: Export the full text instead of a 550 character preview
+        chunk_size: Records per chunk (default: 50, max: 500)
+        progress: Called with (exported, total) after every batch
+
+    Returns:
+        JSON string describing the export and how to read its chunks
+    """
+    filter_args = {
+        "tags": tags,
+        "correspondent": correspondent,
+        "document_type": document_type,
+        "created_from": created_from,
+        "created_to": created_to,
+        "added_from": added_from,
+        "added_to": added_to,
+        "archive_serial_number": archive_serial_number,
+        "ordering": ordering,
+    }
+    export = None
+    try:
+        if not 1 <= chunk_size <= MAX_EXPORT_CHUNK:
+            raise Exception(f"chunk_size must be between 1 and {MAX_EXPORT_CHUNK}.")
+        store = get_export_store()
+        filters = await build_document_filters(**filter_args)
+        metadata = await get_metadata()
+        max_documents = get_config().export_max_documents
+
+        async with get_async_api() as api:
+            first = await api.search_documents(
+                query=query,
+                page=1,
+                page_size=100,
+                fields=DOCUMENT_RESULT_FIELDS,
+                truncate_content=not include_content,
+                filters=filters,
+            )
+            if "all" not in first:
+                raise Exception("This Paperless-NGX version does not report result IDs.")
+            ids = first["all"]
+            if len(ids) > max_documents:
+                raise Exception(
+                    f"The search matches {len(ids)} documents, but at most {max_documents} "
+                    f"can be exported (PAPERLESS_EXPORT_MAX_DOCUMENTS). Narrow the search."
+                )
+
+            export = store.create(chunk_size)
+            records = [_export_record(d, metadata, include_content) for d in first["results"]]
+            store.append(export, records)
+            if progress is not None:
+                await progress(export.count, len(ids))
+
+            fetched = {doc["id"] for doc in first["results"]}
+            remaining = [doc_id for doc_id in ids if doc_id not in fetched]
+            batches = [remaining[i : i + 100] for i in range(0, len(remaining), 100)]
+            window = max(1, get_config().pagination_concurrency)
+            pending: deque[tuple[list[int], asyncio.Task]] = deque()
+            next_batch = 0
+            try:
+                while pending or next_batch < len(batches):
+                    # Keep up to `window` batches in flight, but write them in result order
+                    while next_batch < len(batches) and len(pending) < window:
+                        batch = batches[next_batch]
+                        task = asyncio.create_task(
+                            api.get_documents(
+                                batch,
+                                fields=DOCUMENT_RESULT_FIELDS,
+                                truncate_content=not include_content,
+                            )
+                        )
+                        pending.append((batch, task))
+                        next_batch += 1
+                    batch, task = pending.popleft()
+                    by_id = {doc["id"]: doc for doc in await task}
+                    records = [
+                        _export_record(by_id[doc_id], metadata, include_content)
+                        for doc_id in batch
+                        if doc_id in by_id
+                    ]
+                    store.append(export, records)
+                    if progress is not None:
+                        await progress(export.count, len(ids))
+            finally:
+                for _, task in pending:
+                    task.cancel()
+
+        store.finish(export)
+        result = {
+            "export_id": export.export_id,
+            "total_count": len(ids),
+            "exported_count": export.count,
+            "chunk_size": chunk_size,
+            "chunk_count": export.chunk_count,
+            "bytes": export.size,
+            "expires_in_seconds": store.ttl,
+            "resource_uri_template": EXPORT_RESOURCE_TEMPLATE.replace(
+                "{export_id}", export.export_id
+            ),
+        }
+        return encode(result)
+    except Exception as e:
+        error_result = {
+            "error": str(e),
+            "query": query,
+            **{name: value for name, value in filter_args.items() if value is not None},
+        }
+        return encode(error_result)
+    finally:
+        # Also runs when the call is cancelled
+        if export is not None and not export.complete:
+            store.remove(export.export_id)
+
+
+def read_export_chunk_tool(export_id: str, chunk: int = 0) -> str:
+    """
+    Read one chunk of an export created by export_documents_tool.
+
+    Args:
+        export_id: ID of the export
+        chunk: Chunk number (0-based)
+
+    Returns:
+        NDJSON text with one document per line, or a JSON error object
+    """
+    try:
+        return get_export_store().read_chunk(export_id, chunk)
+    except Exception as e:
+        error_result = {"error": str(e), "export_id": export_id, "chunk": chunk}
+        return encode(error_result)
+
+
+async def get_similar_documents_tool(document_id: int, page: int = 1, page_size: int = 25) -> str:
     """
     Find documents similar to a given document.
 
@@ -146,12 +823,19 @@ def get_similar_documents_tool(
     Returns:
         JSON string with similar documents and pagination info
     """
+
+    def fetch(api: AsyncPaperlessAPI, page: int) -> Awaitable[dict[str, Any]]:
+        return api.get_similar_documents(
+            document_id=document_id,
+            page=page,
+            page_size=page_size,
+            fields=DOCUMENT_RESULT_FIELDS,
+            truncate_content=True,
+        )
+
     try:
-        with PaperlessAPI() as api:
-            response = api.get_similar_documents(
-                document_id=document_id, page=page, page_size=page_size
-            )
-            return format_document_results(response)
+        response = await _fetch_page(("similar", document_id, page_size), page, fetch)
+        return format_document_results(response, await get_metadata())
     except Exception as e:
         error_result = {
             "error": str(e),
@@ -159,12 +843,367 @@ def get_similar_documents_tool(
             "page": page,
             "page_size": page_size,
         }
-        return json.dumps(error_result, indent=2)
+        return encode(error_result)
+
+
+def _clusters(node_ids: list[int], adjacency: dict[int, list[int]]) -> list[list[int]]:
+    """
+    Split a similarity graph into its connected components.
+
+    Edges are taken as undirected. Components are sorted by size, largest first.
+    """
+    parent = {node_id: node_id for node_id in node_ids}
+
+    def find(node_id: int) -> int:
+        while parent[node_id] != node_id:
+            parent[node_id] = parent[parent[node_id]]
+            node_id = parent[node_id]
+        return node_id
+
+    for node_id, neighbors in adjacency.items():
+        for neighbor in neighbors:
+            parent[find(neighbor)] = find(node_id)
+    components: dict[int, list[int]] = {}
+    for node_id in node_ids:
+        components.setdefault(find(node_id), []).append(node_id)
+    return sorted(
+        (sorted(component) for component in components.values()),
+        key=lambda component: (-len(component), component[0]),
+    )
+
+
+async def similarity_graph_tool(document_ids: list[int], depth: int = 1, fan_out: int = 5) -> str:
+    """
+    Map the neighbourhood of documents by following similar-document links.
+
+    Starting from the seed documents, the ``fan_out`` most similar documents
+    of every document are looked up, level by level, up to ``depth``
+    similarity searches away from a seed. The searches of a level run
+    concurrently, at most ``pagination_concurrency`` at a time, and every
+    document is searched at most once. Once ``similarity_max_requests``
+    searches were made, the remaining documents are left unexpanded. If the
+    seeds' details cannot be fetched, they are mapped by their IDs only.
+
+    Args:
+        document_ids: Seed document IDs (at most 100)
+        depth: Levels of similarity searches (1 to MAX_GRAPH_DEPTH)
+        fan_out: Similar documents taken per search (1 to MAX_GRAPH_FAN_OUT)
+
+    Returns:
+        JSON string with the nodes, the adjacency list and the clusters
+    """
+    try:
+        if not document_ids:
+            raise Exception("At least one document ID is required.")
+        if len(document_ids) > MAX_BATCH_DOCUMENTS:
+            raise Exception(f"At most {MAX_BATCH_DOCUMENTS} seed documents can be given.")
+        if not 1 <= depth <= MAX_GRAPH_DEPTH:
+            raise Exception(f"depth must be between 1 and {MAX_GRAPH_DEPTH}, got {depth}.")
+        if not 1 <= fan_out <= MAX_GRAPH_FAN_OUT:
+            raise Exception(f"fan_out must be between 1 and {MAX_GRAPH_FAN_OUT}, got {fan_out}.")
+        config = get_config()
+        semaphore = asyncio.Semaphore(max(1, config.pagination_concurrency))
+        seeds = list(dict.fromkeys(document_ids))
+        depths = dict.fromkeys(seeds, 0)
+        documents: dict[int, dict[str, Any]] = {}
+        adjacency: dict[int, list[int]] = {}
+        failed = []
+        requests = 0
+        unexpanded = 0
+        seed_error = None
+
+        async with get_async_api() as api:
+
+            async def similar(document_id: int) -> dict[str, Any]:
+                async with semaphore:
+                    return await api.get_similar_documents(
+                        document_id=document_id, page=1, page_size=fan_out, fields=GRAPH_NODE_FIELDS
+                    )
+
+            frontier = seeds
+            for level in range(depth):
+                expand = frontier[: max(0, config.similarity_max_requests - requests)]
+                unexpanded += len(frontier) - len(expand)
+                requests += len(expand)
+                searches = asyncio.gather(
+                    *(similar(document_id) for document_id in expand), return_exceptions=True
+                )
+                if level == 0:
+                    # The seeds' own details are fetched alongside their searches
+                    seed_documents, responses = await asyncio.gather(
+                        api.get_documents(seeds, fields=GRAPH_NODE_FIELDS),
+                        searches,
+                        return_exceptions=True,
+                    )
+                    if isinstance(seed_documents, BaseException):
+                        seed_error = seed_documents
+                    else:
+                        documents.update((doc["id"], doc) for doc in seed_documents)
+                else:
+                    responses = await searches
+                # Fail if no seed could be found or searched
+                if (
+                    level == 0
+                    and not documents
+                    and responses
+                    and all(isinstance(response, BaseException) for response in responses)
+                ):
+                    raise seed_error if seed_error is not None else responses[0]
+
+                frontier = []
+                for document_id, response in zip(expand, responses, strict=True):
+                    if isinstance(response, BaseException):
+                        if document_id in documents or seed_error is not None:
+                            failed.append({"id": document_id, "error": str(response)})
+                        continue
+                    neighbors = adjacency[document_id] = []
+                    for doc in response.get("results", []):
+                        if doc["id"] == document_id:
+                            continue
+                        neighbors.append(doc["id"])
+                        documents.setdefault(doc["id"], doc)
+                        if doc["id"] not in depths:
+                            depths[doc["id"]] = level + 1
+                            frontier.append(doc["id"])
+                # Searched documents without details (e.g. left out by the seed
+                # lookup, or all seeds if it failed) keep only their ID
+                missing = seeds if seed_error is not None and level == 0 else adjacency
+                for document_id in missing:
+                    documents.setdefault(document_id, {"id": document_id})
+
+        metadata = await get_metadata()
+        nodes = [
+            GraphNode.from_api(documents[node_id], node_depth, metadata)
+            for node_id, node_depth in depths.items()
+            if node_id in documents
+        ]
+        node_ids = [node.id for node in nodes]
+        result: dict[str, Any] = {
+            "document_ids": seeds,
+            "depth": depth,
+            "fan_out": fan_out,
+            "node_count": len(nodes),
+            "edge_count": sum(len(neighbors) for neighbors in adjacency.values()),
+            "nodes": nodes,
+            "adjacency": adjacency,
+            "clusters": _clusters(node_ids, adjacency),
+        }
+        not_found = [seed for seed in seeds if seed not in documents]
+        if not_found:
+            result["not_found"] = not_found
+        if seed_error is not None:
+            result["seed_error"] = str(seed_error)
+        if failed:
+            result["failed"] = failed
+        if unexpanded:
+            result["unexpanded_count"] = unexpanded
+        result["similarity_requests"] = requests
+        return encode(result)
+    except Exception as e:
+        error_result = {
+            "error": str(e),
+            "document_ids": document_ids,
+            "depth": depth,
+            "fan_out": fan_out,
+        }
+        return encode(error_result)
+
+
+def _periods(group_by: str, first: date, last: date) -> list[tuple[str, date, date]]:
+    """Split a date range into calendar years or months, as (key, first day, last day)."""
+    if group_by == "created_year":
+        return [
+            (str(year), date(year, 1, 1), date(year, 12, 31))
+            for year in range(first.year, last.year + 1)
+        ]
+    periods = []
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        days = calendar.monthrange(year, month)[1]
+        periods.append((f"{year}-{month:02d}", date(year, month, 1), date(year, month, days)))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return periods
+
+
+def _group_filters(filters: DocumentFilters, kind: str, item_id: int) -> DocumentFilters:
+    """Narrow filters to one tag, correspondent or document type."""
+    if kind == "tags":
+        return replace(filters, tags=(*filters.tags, item_id))
+    return replace(filters, **{kind: (item_id,)})
+
+
+async def document_stats_tool(
+    group_by: str,
+    query: str = "",
+    tags: list[int | str] | None = None,
+    correspondent: int | str | None = None,
+    document_type: int | str | None = None,
+    created_from: str | None = None,
+    created_to: str | None = None,
+    added_from: str | None = None,
+    added_to: str | None = None,
+    archive_serial_number: int | None = None,
+) -> str:
+    """
+    Count the documents matching a search per tag, correspondent, document type or period.
+
+    No documents are downloaded. Each group is counted by a request for a
+    single result with the group's filter added, of which only the total
+    ``count`` is used; at most ``pagination_concurrency`` run at a time.
+
+    For tags, correspondents and document types, the list of the kind is
+    taken from the metadata cache (or read from its endpoint if the cache is
+    disabled or could not load it). Its ``document_count`` already answers a
+    question without query and filters, and otherwise rules out empty groups;
+    it is as current as the last metadata refresh. For periods, the oldest
+    and newest match bound the range to split.
+
+    Args:
+        group_by: One of STATS_GROUPS
+        query: Full-text search query; empty to count by filters only
+        tags, correspondent, document_type, created_from, created_to,
+        added_from, added_to, archive_serial_number: Filters as for
+            search_documents_tool
+
+    Returns:
+        JSON string with the total count and the count per group
+    """
+    filter_args = {
+        "tags": tags,
+        "correspondent": correspondent,
+        "document_type": document_type,
+        "created_from": created_from,
+        "created_to": created_to,
+        "added_from": added_from,
+        "added_to": added_to,
+        "archive_serial_number": archive_serial_number,
+    }
+    try:
+        if group_by not in STATS_GROUPS:
+            raise Exception(f"group_by must be one of {', '.join(STATS_GROUPS)}, got {group_by!r}.")
+        filters = await build_document_filters(**filter_args) or DocumentFilters()
+        config = get_config()
+        semaphore = asyncio.Semaphore(max(1, config.pagination_concurrency))
+        count_requests = 0
+        unassigned = None
+        uncounted = 0
+
+        async with get_async_api() as api:
+
+            async def count(bucket_filters: DocumentFilters) -> dict[str, Any]:
+                nonlocal count_requests
+                async with semaphore:
+                    count_requests += 1
+                    return await api.search_documents(
+                        query=query,
+                        page=1,
+                        page_size=1,
+                        fields=("id", "created_date"),
+                        filters=bucket_filters,
+                    )
+
+            kind = STATS_GROUPS[group_by]
+            if kind is not None:
+                metadata = await get_metadata()
+                items = metadata.lists.get(kind) if metadata is not None else None
+                if items is None:
+                    response, items = await asyncio.gather(
+                        count(filters), api.list_all(METADATA_ENDPOINTS[kind])
+                    )
+                else:
+                    response = await count(filters)
+                total = response.get("count", 0)
+                selected = getattr(filters, kind)
+                if selected and kind != "tags":
+                    items = [item for item in items if item["id"] in selected]
+                if (
+                    not query
+                    and filters == DocumentFilters()
+                    and all("document_count" in item for item in items)
+                ):
+                    counts = [item["document_count"] for item in items]
+                else:
+                    # Groups without any document stay empty under every filter
+                    items = [item for item in items if item.get("document_count") != 0]
+                    items.sort(key=lambda item: -item.get("document_count", 0))
+                    uncounted = max(0, len(items) - config.stats_max_buckets)
+                    items = items[: config.stats_max_buckets]
+                    responses = await asyncio.gather(
+                        *(count(_group_filters(filters, kind, item["id"])) for item in items)
+                    )
+                    counts = [response.get("count", 0) for response in responses]
+                buckets = [
+                    Bucket(key=item["id"], name=item.get("name"), count=n)
+                    for item, n in zip(items, counts, strict=True)
+                    if n
+                ]
+                buckets.sort(key=lambda bucket: (-bucket.count, str(bucket.name)))
+                # Documents have at most one correspondent and document type
+                if kind != "tags" and not uncounted:
+                    unassigned = total - sum(bucket.count for bucket in buckets)
+            else:
+                oldest, newest = await asyncio.gather(
+                    count(replace(filters, ordering="created")),
+                    count(replace(filters, ordering="-created")),
+                )
+                total = oldest.get("count", 0)
+                periods = []
+                if oldest.get("results") and newest.get("results"):
+                    periods = _periods(
+                        group_by,
+                        date.fromisoformat(oldest["results"][0]["created_date"][:10]),
+                        date.fromisoformat(newest["results"][0]["created_date"][:10]),
+                    )
+                if len(periods) > config.stats_max_buckets:
+                    raise Exception(
+                        f"The matches span {len(periods)} periods, but at most "
+                        f"{config.stats_max_buckets} are counted (PAPERLESS_STATS_MAX_BUCKETS). "
+                        f"Narrow created_from/created_to or group by created_year."
+                    )
+                responses = await asyncio.gather(
+                    *(
+                        count(
+                            replace(
+                                filters,
+                                created_from=max(start.isoformat(), filters.created_from or ""),
+                                created_to=min(end.isoformat(), filters.created_to or "9999"),
+                            )
+                        )
+                        for _, start, end in periods
+                    )
+                )
+                buckets = [
+                    Bucket(key=key, name=None, count=response.get("count", 0))
+                    for (key, _, _), response in zip(periods, responses, strict=True)
+                ]
+
+        result: dict[str, Any] = {
+            "group_by": group_by,
+            **({"query": query} if query else {}),
+            **{name: value for name, value in filter_args.items() if value is not None},
+            "total_count": total,
+            "bucket_count": len(buckets),
+            "buckets": buckets,
+        }
+        if unassigned is not None:
+            result["unassigned_count"] = unassigned
+        if uncounted:
+            result["uncounted_buckets"] = uncounted
+        result["count_requests"] = count_requests
+        return encode(result)
+    except Exception as e:
+        error_result = {
+            "error": str(e),
+            "group_by": group_by,
+            "query": query,
+            **{name: value for name, value in filter_args.items() if value is not None},
+        }
+        return encode(error_result)
 
 
 def format_tags(api_response: dict[str, Any]) -> str:
     """
-    Format tags API response into readable JSON string.
+    Format tags API response as a JSON string.
 
     Args:
         api_response: Raw API response with tags
@@ -172,50 +1211,51 @@ def format_tags(api_response: dict[str, Any]) -> str:
     Returns:
         Formatted JSON string with tag information
     """
-    results = api_response.get("results", [])
-    count = api_response.get("count", 0)
-
-    formatted_tags = []
-    for tag in results:
-        formatted_tag = {
-            "id": tag.get("id"),
-            "name": tag.get("name"),
-            "color": tag.get("color"),
-            "text_color": tag.get("text_color"),
-            "document_count": tag.get("document_count", 0),
-        }
-        formatted_tags.append(formatted_tag)
-
     result = {
-        "total_count": count,
-        "tags": formatted_tags,
+        "total_count": api_response.get("count", 0),
+        "tags": [Tag.from_api(tag) for tag in api_response.get("results", [])],
     }
+    return encode(result)
 
-    return json.dumps(result, indent=2)
 
-
-def list_tags_tool() -> str:
+async def list_tags_tool() -> str:
     """
     Get all available tags from Paperless-NGX.
 
+    All result pages are fetched; the formatted result is cached for
+    ``list_cache_ttl`` seconds.
+
     Returns:
         JSON string with all tags and their metadata
     """
+    cache = get_list_cache()
+    if cache is not None:
+        cached = cache.get("tags")
+        if cached is not None:
+            return cached
+
     try:
-        with PaperlessAPI() as api:
-            response = api.list_tags()
-            return format_tags(response)
+        async with get_async_api() as api:
+            response = await api.list_tags()
+        result = format_tags(response)
+        if cache is not None:
+            cache.set("tags", result)
+        return result
     except Exception as e:
         error_result = {
             "error": str(e),
         }
-        return json.dumps(error_result, indent=2)
+        return encode(error_result)
 
 
-def autocomplete_search_tool(term: str, limit: int = 10) -> str:
+async def autocomplete_search_tool(term: str, limit: int = 10) -> str:
     """
     Get search term autocomplete suggestions.
 
+    Suggestions come from the local mirror if enabled for autocomplete, or
+    from the autocomplete cache, which answers repeated terms and longer
+    prefixes of completely known ones without contacting Paperless-NGX.
+
     Args:
         term: Partial search term
         limit: Maximum number of suggestions (default: 10)
@@ -224,18 +1264,99 @@ def autocomplete_search_tool(term: str, limit: int = 10) -> str:
         JSON string with suggested search terms
     """
     try:
-        with PaperlessAPI() as api:
-            suggestions = api.autocomplete_search(term=term, limit=limit)
-            result = {
-                "term": term,
-                "suggestions": suggestions,
-                "count": len(suggestions),
-            }
-            return json.dumps(result, indent=2)
+        suggestions = None
+        mirror = get_mirror()
+        if mirror is not None and get_config().mirror_autocomplete:
+            suggestions = await mirror.autocomplete(term=term, limit=limit)
+        if suggestions is None:
+            cache = get_autocomplete_cache()
+            suggestions = cache.get(term, limit) if cache is not None else None
+            if suggestions is None:
+                async with get_async_api() as api:
+                    suggestions = await api.autocomplete_search(term=term, limit=limit)
+                if cache is not None:
+                    cache.set(term, limit, suggestions)
+        return encode(Suggestions(term=term, suggestions=suggestions, count=len(suggestions)))
     except Exception as e:
         error_result = {
             "error": str(e),
             "term": term,
             "limit": limit,
         }
-        return json.dumps(error_result, indent=2)
+        return encode(error_result)
+
+
+async def mirror_status_tool() -> str:
+    """
+    Get the synchronization status of the local document mirror.
+
+    Returns:
+        JSON string with mirror size, last sync time and lag
+    """
+    mirror = get_mirror()
+    if mirror is None:
+        return encode({"enabled": False})
+    try:
+        return encode({"enabled": True, **await mirror.status()})
+    except Exception as e:
+        return encode({"enabled": True, "error": str(e)})
+
+
+def http_cache_tool(clear: bool = False) -> str:
+    """
+    Get the statistics of the persistent HTTP cache, optionally clearing it.
+
+    Args:
+        clear: Delete all stored responses (of every server process sharing
+            the cache directory) before reporting
+
+    Returns:
+        JSON string with cache usage and counters
+    """
+    try:
+        cache = get_http_cache()
+        if cache is None:
+            return encode({"enabled": False})
+        result: dict[str, Any] = {"enabled": True}
+        if clear:
+            result["cleared_entries"] = cache.clear()
+        result.update(cache.stats())
+        return encode(result)
+    except Exception as e:
+        return encode({"error": str(e), "clear": clear})
+
+
+def server_stats_tool() -> str:
+    """
+    Get cache, request coalescing and resilience statistics of this server process.
+
+    Returns:
+        JSON string with statistics per cache, for request coalescing, for
+        the upstream resilience layer and the process's peak memory use
+    """
+    caches = {
+        "document_cache": get_document_cache(),
+        "content_cache": get_content_cache(),
+        "list_cache": get_list_cache(),
+        "snapshot_cache": get_snapshot_cache(),
+        "http_cache": get_http_cache(),
+        "autocomplete_cache": get_autocomplete_cache(),
+    }
+    result = {name: cache.stats() if cache is not None else None for name, cache in caches.items()}
+    result["request_coalescing"] = get_coalescing_stats()
+    prefetcher = get_prefetcher()
+    result["prefetch"] = prefetcher.stats() if prefetcher is not None else None
+    watcher = get_watcher()
+    result["watcher"] = watcher.stats() if watcher is not None else None
+    result["upstream"] = get_resilience_stats()
+    result["process"] = _process_stats()
+    return encode(result)
+
+
+def _process_stats() -> dict[str, Any] | None:
+    """Return the peak resident memory of this process, or None if unavailable."""
+    if resource is None:
+        return None
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {"peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale}
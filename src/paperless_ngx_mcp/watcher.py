@@ -0,0 +1,222 @@
+"""Background watcher that invalidates cached data when Paperless-NGX changes."""
+
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from typing import Any
+
+from .api import get_async_api
+from .cache import (
+    get_autocomplete_cache,
+    get_content_cache,
+    get_document_cache,
+    get_list_cache,
+)
+from .config import get_config
+from .http_cache import get_http_cache
+from .metadata import METADATA_ENDPOINTS, get_metadata_cache
+from .prefetch import get_prefetcher
+
+DOCUMENTS_PATH = "/api/documents/"
+
+
+def _fingerprint(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ChangeWatcher:
+    """
+    Poll Paperless-NGX for changes and evict exactly the affected cache entries.
+
+    Every ``interval`` seconds the watcher asks for documents modified since
+    the newest modification it has seen (``modified__gt``), compares the IDs
+    of all documents with the previous poll to find deleted ones, and reloads
+    the tag, correspondent, document type, storage path and custom field
+    lists:
+
+    - Changed or deleted documents are evicted from the document and content
+      caches and the persistent HTTP cache. Cached list and search responses,
+      prefetched pages and autocomplete suggestions are dropped, as they may
+      depend on them.
+    - Renamed metadata updates the name maps and drops cached documents,
+      whose results contain the old names.
+    - Any other metadata change (e.g. a tag's document count) drops the
+      cached lists of that kind.
+
+    The first poll only records the current state. The watcher always reads
+    from Paperless-NGX itself, never from the HTTP cache.
+    """
+
+    def __init__(self, interval: float):
+        """
+        Create a watcher.
+
+        Args:
+            interval: Seconds between polls
+        """
+        self.interval = interval
+        self.watermark: str | None = None
+        self.document_ids: set[int] | None = None
+        self.metadata_names: dict[str, str] = {}
+        self.metadata_lists: dict[str, str] = {}
+        self.polls = 0
+        self.changed_documents = 0
+        self.deleted_documents = 0
+        self.metadata_changes = 0
+        self.last_poll: float | None = None
+        self.last_error: str | None = None
+        self._task: asyncio.Task | None = None
+
+    async def poll(self) -> None:
+        """Check Paperless-NGX for changes once and invalidate affected entries."""
+        async with get_async_api(http_cache=False) as api:
+            current = await api.list_documents(
+                {"ordering": "-modified", "fields": "id,modified", "page_size": 1}
+            )
+            changed: list[dict[str, Any]] = []
+            if self.document_ids is not None:
+                params: dict[str, Any] = {"ordering": "modified", "fields": "id,modified"}
+                if self.watermark:
+                    params["modified__gt"] = self.watermark
+                changed = await api.list_all(DOCUMENTS_PATH, params=params)
+            results = await asyncio.gather(
+                *(api.list_all(path) for path in METADATA_ENDPOINTS.values()),
+                return_exceptions=True,
+            )
+
+        ids = set(current.get("all", []))
+        deleted = self.document_ids - ids if self.document_ids is not None else set()
+        if changed:
+            self.watermark = changed[-1]["modified"]
+        elif self.document_ids is None and current.get("results"):
+            self.watermark = current["results"][0]["modified"]
+        first_poll = self.document_ids is None
+        self.document_ids = ids
+        self._invalidate_documents([doc["id"] for doc in changed], deleted)
+
+        lists = {}
+        for kind, result in zip(METADATA_ENDPOINTS, results, strict=True):
+            if isinstance(result, BaseException):
+                print(f"Could not check {kind} for changes: {result}", file=sys.stderr)
+                continue
+            lists[kind] = result
+        self._invalidate_metadata(lists, first_poll)
+
+        self.polls += 1
+        self.last_poll = time.time()
+
+    def _invalidate_documents(self, changed: list[int], deleted: set[int]) -> None:
+        if not changed and not deleted:
+            return
+        self.changed_documents += len(changed)
+        self.deleted_documents += len(deleted)
+        affected = [*changed, *deleted]
+        for cache in (get_document_cache(), get_content_cache()):
+            if cache is not None:
+                for document_id in affected:
+                    cache.invalidate(document_id)
+        http_cache = get_http_cache()
+        if http_cache is not None:
+            paths = [DOCUMENTS_PATH, *(f"{DOCUMENTS_PATH}{doc_id}/" for doc_id in affected)]
+            http_cache.invalidate_paths(paths)
+        # Changed content may add or remove indexed terms
+        autocomplete_cache = get_autocomplete_cache()
+        if autocomplete_cache is not None:
+            autocomplete_cache.clear()
+        prefetcher = get_prefetcher()
+        if prefetcher is not None:
+            prefetcher.discard()
+
+    def _invalidate_metadata(
+        self, lists: dict[str, list[dict[str, Any]]], first_poll: bool
+    ) -> None:
+        renamed = {}
+        changed_kinds = []
+        for kind, items in lists.items():
+            names = _fingerprint(sorted((item["id"], item.get("name")) for item in items))
+            full = _fingerprint(items)
+            if not first_poll and names != self.metadata_names.get(kind):
+                renamed[kind] = items
+            if not first_poll and full != self.metadata_lists.get(kind):
+                changed_kinds.append(kind)
+            self.metadata_names[kind] = names
+            self.metadata_lists[kind] = full
+
+        if changed_kinds:
+            self.metadata_changes += len(changed_kinds)
+            http_cache = get_http_cache()
+            if http_cache is not None:
+                http_cache.invalidate_paths([METADATA_ENDPOINTS[kind] for kind in changed_kinds])
+            # List results are cached under their metadata kind (e.g. "tags")
+            list_cache = get_list_cache()
+            if list_cache is not None:
+                for kind in changed_kinds:
+                    list_cache.invalidate(kind)
+        # Changed kinds include new document counts, not only renames
+        metadata = get_metadata_cache()
+        if metadata is not None and metadata.loaded and (changed_kinds or first_poll):
+            metadata.update(lists if first_poll else {kind: lists[kind] for kind in changed_kinds})
+        if renamed:
+            document_cache = get_document_cache()
+            if document_cache is not None:
+                document_cache.clear()
+            prefetcher = get_prefetcher()
+            if prefetcher is not None:
+                prefetcher.discard()
+
+    async def _watch_loop(self) -> None:
+        while True:
+            try:
+                await self.poll()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Change watcher poll failed: {e}", file=sys.stderr)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the background polling task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch_loop())
+
+    async def stop(self) -> None:
+        """Stop the background polling task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return poll and invalidation counters."""
+        return {
+            "interval_seconds": self.interval,
+            "polls": self.polls,
+            "watermark": self.watermark,
+            "changed_documents": self.changed_documents,
+            "deleted_documents": self.deleted_documents,
+            "metadata_changes": self.metadata_changes,
+            "seconds_since_last_poll": (
+                round(time.time() - self.last_poll, 1) if self.last_poll is not None else None
+            ),
+            "last_error": self.last_error,
+        }
+
+
+# Global watcher instance
+change_watcher: ChangeWatcher | None = None
+
+
+def get_watcher() -> ChangeWatcher | None:
+    """Get or create the change watcher, or None if it is disabled."""
+    global change_watcher
+    config = get_config()
+    if not config.watcher_enabled:
+        return None
+    if change_watcher is None:
+        change_watcher = ChangeWatcher(interval=config.watcher_interval)
+    return change_watcher
@@ -0,0 +1,122 @@
+"""Tests for the in-process caches."""
+
+import pytest
+
+from paperless_ngx_mcp import cache
+from paperless_ngx_mcp.cache import AutocompleteCache, LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
+
+
+def test_lru_evicts_least_recently_used_beyond_max_bytes(clock: FakeClock):
+    lru = LRUCache(max_entries=10, max_bytes=10, ttl=60)
+    lru.set("a", "aaaa")
+    lru.set("b", "bbbb")
+    assert lru.get("a") == "aaaa"  # "b" is now least recently used
+
+    lru.set("c", "cccc")
+
+    assert "b" not in lru
+    assert lru.get("a") == "aaaa"
+    assert lru.get("c") == "cccc"
+    assert lru.stats()["bytes"] == 8
+    assert lru.evictions == 1
+
+
+def test_lru_skips_values_larger_than_max_bytes(clock: FakeClock):
+    lru = LRUCache(max_entries=10, max_bytes=10, ttl=60)
+    lru.set("a", "aaaa")
+    lru.set("big", "x" * 11)
+
+    assert "big" not in lru
+    assert lru.get("a") == "aaaa"
+
+
+def test_lru_replacing_a_value_updates_its_size(clock: FakeClock):
+    lru = LRUCache(max_entries=10, max_bytes=10, ttl=60)
+    lru.set("a", "aaaaaaaa")
+    lru.set("a", "aa")
+    lru.set("b", "bbbbbbbb")
+
+    assert lru.get("a") == "aa"
+    assert lru.stats()["bytes"] == 10
+    assert lru.evictions == 0
+
+
+def test_lru_expired_entries_stay_available_for_revalidation(clock: FakeClock):
+    lru = LRUCache(max_entries=10, max_bytes=100, ttl=60)
+    lru.set("a", "value", version="v1")
+    clock.now += 61
+
+    assert lru.get("a") is None
+    assert lru.peek("a").version == "v1"
+
+    lru.touch("a")
+
+    assert lru.get("a") == "value"
+    assert lru.revalidations == 1
+
+
+def test_autocomplete_refines_a_complete_prefix(clock: FakeClock):
+    autocomplete = AutocompleteCache(max_entries=10, ttl=60)
+    # Fewer suggestions than the limit: these are all terms starting with "in"
+    autocomplete.set("in", 10, ["invoice", "insurance", "invoices", "inv"])
+
+    assert autocomplete.get("inv", 10) == ["inv", "invoice", "invoices"]
+    assert autocomplete.get("INVOICE", 1) == ["invoice"]
+    assert autocomplete.get("ins", 10) == ["insurance"]
+    assert autocomplete.refinements == 3
+
+
+def test_autocomplete_does_not_refine_a_truncated_prefix(clock: FakeClock):
+    autocomplete = AutocompleteCache(max_entries=10, ttl=60)
+    # As many suggestions as the limit: more terms may start with "in"
+    autocomplete.set("in", 2, ["invoice", "insurance"])
+
+    assert autocomplete.get("inv", 2) is None
+    assert autocomplete.get("in", 2) == ["invoice", "insurance"]
+    assert autocomplete.get("in", 5) is None
+
+
+def test_autocomplete_does_not_refine_several_words(clock: FakeClock):
+    autocomplete = AutocompleteCache(max_entries=10, ttl=60)
+    autocomplete.set("tax", 10, ["tax", "taxes"])
+
+    assert autocomplete.get("tax re", 10) is None
+
+
+def test_autocomplete_expires_and_evicts(clock: FakeClock):
+    autocomplete = AutocompleteCache(max_entries=2, ttl=60)
+    autocomplete.set("a", 10, ["apple"])
+    autocomplete.set("b", 10, ["banana"])
+    autocomplete.set("c", 10, ["cherry"])
+
+    assert autocomplete.get("a", 10) is None
+    assert autocomplete.evictions == 1
+
+    clock.now += 61
+
+    assert autocomplete.get("b", 10) is None
+    assert autocomplete.get("bana", 10) is None
+
+
+def test_autocomplete_prunes_removed_terms_from_the_trie(clock: FakeClock):
+    autocomplete = AutocompleteCache(max_entries=1, ttl=60)
+    autocomplete.set("abc", 10, ["abcd"])
+    autocomplete.set("x", 10, ["xylophone"])
+
+    assert autocomplete._root.children.keys() == {"x"}
+    assert autocomplete.stats()["bytes"] == len("x") + len("xylophone")
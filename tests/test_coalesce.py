@@ -0,0 +1,89 @@
+"""Tests for request coalescing."""
+
+import asyncio
+
+import pytest
+
+from paperless_ngx_mcp.coalesce import Singleflight, request_key
+
+
+def test_concurrent_calls_with_the_same_key_share_one_execution():
+    async def scenario():
+        singleflight = Singleflight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"calls": calls}
+
+        results = await asyncio.gather(*(singleflight.do("key", fetch) for _ in range(5)))
+        return singleflight, calls, results
+
+    singleflight, calls, results = asyncio.run(scenario())
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert singleflight.stats()["executed"] == 1
+    assert singleflight.stats()["coalesced"] == 4
+    assert singleflight.stats()["in_flight"] == 0
+
+
+def test_later_calls_execute_again():
+    async def scenario():
+        singleflight = Singleflight()
+
+        async def fetch():
+            return object()
+
+        return await singleflight.do("key", fetch), await singleflight.do("key", fetch)
+
+    first, second = asyncio.run(scenario())
+
+    assert first is not second
+
+
+def test_errors_are_raised_in_every_caller():
+    async def scenario():
+        singleflight = Singleflight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream failed")
+
+        return await asyncio.gather(
+            singleflight.do("key", fail), singleflight.do("key", fail), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+
+    assert [str(result) for result in results] == ["upstream failed"] * 2
+
+
+def test_a_cancelled_caller_does_not_cancel_the_shared_work():
+    async def scenario():
+        singleflight = Singleflight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(singleflight.do("key", fetch))
+        second = asyncio.create_task(singleflight.do("key", fetch))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "done"
+
+
+def test_request_key_ignores_parameter_order():
+    assert request_key("GET", "/api/documents/", {"a": 1, "b": 2}) == request_key(
+        "GET", "/api/documents/", {"b": "2", "a": "1"}
+    )
+    assert request_key("GET", "/api/documents/", {"a": 1}) != request_key(
+        "GET", "/api/tags/", {"a": 1}
+    )
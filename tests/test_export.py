@@ -0,0 +1,111 @@
+"""Tests for spooled exports."""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from paperless_ngx_mcp import config as config_module
+from paperless_ngx_mcp import export as export_module
+from paperless_ngx_mcp.export import ExportStore
+
+
+def test_export_files_are_private(tmp_path: Path):
+    store = ExportStore(tmp_path / "exports", ttl=60, max_exports=4)
+    export = store.create(chunk_size=2)
+
+    assert stat.S_IMODE(store.directory.stat().st_mode) == 0o700
+    assert stat.S_IMODE(export.path.stat().st_mode) == 0o600
+
+
+def test_directory_accessible_to_others_is_refused(tmp_path: Path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+
+    with pytest.raises(ValueError, match="mode 0700"):
+        ExportStore(shared, ttl=60, max_exports=4)
+
+
+def test_symlinked_directory_is_refused(tmp_path: Path):
+    target = tmp_path / "target"
+    target.mkdir(mode=0o700)
+    (tmp_path / "link").symlink_to(target)
+
+    with pytest.raises(ValueError, match="not a symlink"):
+        ExportStore(tmp_path / "link", ttl=60, max_exports=4)
+
+
+def test_export_file_replaced_by_symlink_is_not_followed(tmp_path: Path):
+    store = ExportStore(tmp_path / "exports", ttl=60, max_exports=4)
+    export = store.create(chunk_size=2)
+    victim = tmp_path / "victim"
+    victim.write_text("unchanged")
+    export.path.unlink()
+    export.path.symlink_to(victim)
+
+    with pytest.raises(OSError):
+        store.append(export, [{"id": 1, "content": "secret"}])
+    assert victim.read_text() == "unchanged"
+
+
+def test_default_directory_is_private_and_removed_on_close(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("PAPERLESS_API_TOKEN", "test-token")
+    monkeypatch.delenv("PAPERLESS_EXPORT_DIR", raising=False)
+    monkeypatch.setattr(config_module, "config", None)
+    monkeypatch.setattr(export_module, "export_store", None)
+    monkeypatch.setattr(export_module.tempfile, "tempdir", str(tmp_path))
+
+    store = export_module.get_export_store()
+    store.create(chunk_size=2)
+
+    assert store.directory.parent == tmp_path
+    assert store.directory.name.startswith("paperless-ngx-mcp-exports-")
+    assert stat.S_IMODE(os.lstat(store.directory).st_mode) == 0o700
+    export_module.close_export_store()
+    assert not store.directory.exists()
+
+
+def test_chunks_are_readable_once_finished(tmp_path: Path):
+    store = ExportStore(tmp_path / "exports", ttl=60, max_exports=4)
+    export = store.create(chunk_size=2)
+    store.append(export, [{"id": 1}, {"id": 2}, {"id": 3}])
+
+    with pytest.raises(Exception, match="still being written"):
+        store.read_chunk(export.export_id, 0)
+
+    store.finish(export)
+
+    assert store.read_chunk(export.export_id, 0) == '{"id":1}\n{"id":2}\n'
+    assert store.read_chunk(export.export_id, 1) == '{"id":3}\n'
+    with pytest.raises(Exception, match="chunks 0 to 1"):
+        store.read_chunk(export.export_id, 2)
+
+
+def test_max_exports_only_evicts_finished_exports(tmp_path: Path):
+    store = ExportStore(tmp_path / "exports", ttl=60, max_exports=2)
+    writing = store.create(chunk_size=10)
+    finished = store.create(chunk_size=10)
+    store.finish(finished)
+
+    newer = store.create(chunk_size=10)
+
+    assert store.get(finished.export_id) is None
+    assert not finished.path.exists()
+    assert store.get(writing.export_id) is writing
+    with pytest.raises(Exception, match="still being written"):
+        store.create(chunk_size=10)
+    assert store.get(newer.export_id) is newer
+
+
+def test_ttl_applies_to_finished_exports_only(tmp_path: Path):
+    store = ExportStore(tmp_path / "exports", ttl=0, max_exports=4)
+    writing = store.create(chunk_size=10)
+    finished = store.create(chunk_size=10)
+    store.finish(finished)
+
+    store.expire()
+
+    assert store.get(writing.export_id) is writing
+    assert store.get(finished.export_id) is None
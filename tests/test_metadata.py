@@ -0,0 +1,85 @@
+"""Tests for the metadata cache and name resolution against a fake Paperless-NGX."""
+
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from paperless_ngx_mcp import config as config_module
+from paperless_ngx_mcp import metadata as metadata_module
+from paperless_ngx_mcp import tools
+from paperless_ngx_mcp.api import AsyncPaperlessAPI
+from paperless_ngx_mcp.metadata import UNKNOWN_NAME_REFRESH_INTERVAL, MetadataCache
+
+
+class FakePaperless:
+    """Metadata list endpoints that count their requests."""
+
+    def __init__(self):
+        self.tags = [{"id": 1, "name": "Invoice"}]
+        self.requests: Counter[str] = Counter()
+        self.failing = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests[request.url.path] += 1
+        if self.failing:
+            return httpx.Response(400, json={"detail": "Unavailable"})
+        results = self.tags if request.url.path == "/api/tags/" else []
+        return httpx.Response(200, json={"count": len(results), "next": None, "results": results})
+
+
+@pytest.fixture
+def paperless(monkeypatch) -> FakePaperless:
+    monkeypatch.setenv("PAPERLESS_API_TOKEN", "test-token")
+    monkeypatch.setattr(config_module, "config", None)
+    fake = FakePaperless()
+    client = httpx.AsyncClient(
+        base_url="http://paperless.test", transport=httpx.MockTransport(fake.handler)
+    )
+    monkeypatch.setattr(
+        metadata_module, "get_async_api", lambda **_kwargs: AsyncPaperlessAPI(client=client)
+    )
+    return fake
+
+
+@pytest.fixture
+def metadata(monkeypatch) -> MetadataCache:
+    metadata = MetadataCache(refresh_interval=300)
+
+    async def get_metadata():
+        await metadata.ensure_loaded()
+        return metadata
+
+    monkeypatch.setattr(tools, "get_metadata", get_metadata)
+    return metadata
+
+
+def test_failed_first_load_is_retried(paperless, metadata):
+    paperless.failing = True
+
+    assert not asyncio.run(metadata.ensure_loaded())
+    assert metadata.loaded_at is None
+
+    paperless.failing = False
+
+    assert asyncio.run(metadata.ensure_loaded())
+    assert metadata.lookup_id("tags", "invoice") == 1
+
+
+def test_unknown_names_reload_at_most_once_per_interval(monkeypatch, paperless, metadata):
+    now = 1000.0
+    monkeypatch.setattr(metadata_module.time, "monotonic", lambda: now)
+    asyncio.run(metadata.ensure_loaded())
+
+    for name in ("invoce", "recipt", "invoice2"):
+        with pytest.raises(Exception, match=f"Unknown tag '{name}'"):
+            asyncio.run(tools._resolve_ids("tags", [name]))
+    # One load, then one reload for the first unknown name
+    assert paperless.requests["/api/tags/"] == 2
+
+    paperless.tags.append({"id": 2, "name": "Receipt"})
+    now += UNKNOWN_NAME_REFRESH_INTERVAL
+
+    assert asyncio.run(tools._resolve_ids("tags", ["receipt", "Invoice", 7])) == [2, 1, 7]
+    assert paperless.requests["/api/tags/"] == 3
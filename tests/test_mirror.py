@@ -0,0 +1,168 @@
+"""Tests for the local search mirror against a fake Paperless-NGX."""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import pytest
+
+from paperless_ngx_mcp import config as config_module
+from paperless_ngx_mcp import mirror as mirror_module
+from paperless_ngx_mcp.api import AsyncPaperlessAPI
+from paperless_ngx_mcp.mirror import SYNC_PAGE_SIZE, DocumentMirror, to_fts_query
+
+
+class FakePaperless:
+    """Documents endpoint supporting the parameters the mirror sync uses."""
+
+    def __init__(self):
+        self.documents: dict[int, dict] = {}
+        self.requests = 0
+        # Page number whose request fails once, to interrupt a sync
+        self.fail_page: int | None = None
+
+    def add(self, doc_id: int, modified: str, content: str = "") -> None:
+        self.documents[doc_id] = {
+            "id": doc_id,
+            "title": f"Document {doc_id}",
+            "content": content,
+            "tags": [],
+            "modified": modified,
+        }
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        params = request.url.params
+        page = int(params.get("page", 1))
+        if page == self.fail_page:
+            self.fail_page = None
+            return httpx.Response(400, json={"detail": "Interrupted"})
+        docs = sorted(
+            self.documents.values(),
+            key=lambda doc: (datetime.fromisoformat(doc["modified"]), doc["id"]),
+        )
+        if "modified__gte" in params:
+            since = datetime.fromisoformat(params["modified__gte"])
+            docs = [doc for doc in docs if datetime.fromisoformat(doc["modified"]) >= since]
+        page_size = int(params.get("page_size", 25))
+        start = (page - 1) * page_size
+        return httpx.Response(
+            200,
+            json={
+                "count": len(docs),
+                "next": f"?page={page + 1}" if start + page_size < len(docs) else None,
+                "previous": None,
+                "all": [doc["id"] for doc in docs],
+                "results": docs[start : start + page_size],
+            },
+        )
+
+
+@pytest.fixture
+def paperless(monkeypatch) -> FakePaperless:
+    monkeypatch.setenv("PAPERLESS_API_TOKEN", "test-token")
+    monkeypatch.setenv("PAPERLESS_RETRIES", "0")
+    monkeypatch.setattr(config_module, "config", None)
+    fake = FakePaperless()
+    client = httpx.AsyncClient(
+        base_url="http://paperless.test", transport=httpx.MockTransport(fake.handler)
+    )
+    monkeypatch.setattr(
+        mirror_module, "get_async_api", lambda **_kwargs: AsyncPaperlessAPI(client=client)
+    )
+    monkeypatch.setattr(mirror_module, "get_metadata", _no_metadata)
+    return fake
+
+
+@pytest.fixture
+def mirror(tmp_path: Path):
+    mirror = DocumentMirror(tmp_path / "mirror.db", sync_interval=300)
+    yield mirror
+    mirror.close()
+
+
+def _mirrored_ids(mirror: DocumentMirror) -> set[int]:
+    return {row[0] for row in mirror._execute("SELECT id FROM documents")}
+
+
+def test_sync_pages_through_documents_sharing_a_modified_time(paperless, mirror):
+    count = SYNC_PAGE_SIZE * 2 + 50
+    for doc_id in range(1, count + 1):
+        paperless.add(doc_id, "2024-01-01T00:00:00+00:00")
+
+    assert asyncio.run(mirror.sync()) == count
+    assert _mirrored_ids(mirror) == set(range(1, count + 1))
+
+
+def test_interrupted_sync_resumes_after_the_last_stored_document(paperless, mirror):
+    count = SYNC_PAGE_SIZE * 2 + 50
+    for doc_id in range(1, count + 1):
+        paperless.add(doc_id, "2024-01-01T00:00:00+00:00")
+    paperless.fail_page = 2
+
+    with pytest.raises(Exception, match="Interrupted"):
+        asyncio.run(mirror.sync())
+    assert len(_mirrored_ids(mirror)) == SYNC_PAGE_SIZE
+
+    # Only the remaining documents are stored again
+    assert asyncio.run(mirror.sync()) == count - SYNC_PAGE_SIZE
+    assert _mirrored_ids(mirror) == set(range(1, count + 1))
+
+
+def test_watermark_compares_times_not_strings(paperless, mirror):
+    # 00:30 UTC, written with an offset that sorts after the next document as text
+    paperless.add(1, "2024-03-31T01:30:00+01:00")
+    asyncio.run(mirror.sync())
+
+    paperless.add(2, "2024-03-31T01:10:00+00:00")
+
+    assert asyncio.run(mirror.sync()) == 1
+    assert _mirrored_ids(mirror) == {1, 2}
+
+
+def test_sync_removes_deleted_documents(paperless, mirror):
+    for doc_id in (1, 2, 3):
+        paperless.add(doc_id, f"2024-01-0{doc_id}T00:00:00+00:00")
+    asyncio.run(mirror.sync())
+
+    del paperless.documents[2]
+
+    assert asyncio.run(mirror.sync()) == 0
+    assert _mirrored_ids(mirror) == {1, 3}
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("", ""),
+        ("invoice 2024", '"invoice" "2024"'),
+        ("O'Brien, re-issued.", '"O" "Brien" "re" "issued"'),
+        ("müller straße", '"müller" "straße"'),
+        # FTS5 operators and syntax are left to Paperless-NGX
+        ("invoice AND receipt", None),
+        ("invoice NOT receipt", None),
+        ("tag:invoice", None),
+        ("invoice*", None),
+        ('"exact phrase"', None),
+        ("(invoice)", None),
+        ("invoice^2", None),
+        ("NEAR(a b)", None),
+    ],
+)
+def test_to_fts_query(query, expected):
+    assert to_fts_query(query) == expected
+
+
+def test_search_treats_lowercase_operators_as_terms(paperless, mirror):
+    paperless.add(1, "2024-01-01T00:00:00+00:00", content="salt and pepper")
+    paperless.add(2, "2024-01-02T00:00:00+00:00", content="salt only")
+    asyncio.run(mirror.sync())
+
+    response = asyncio.run(mirror.search("salt and pepper"))
+
+    assert [doc["id"] for doc in response["results"]] == [1]
+
+
+async def _no_metadata():
+    return None
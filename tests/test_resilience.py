@@ -0,0 +1,166 @@
+"""Tests for the circuit breaker and the adaptive concurrency limit."""
+
+import asyncio
+
+import pytest
+
+from paperless_ngx_mcp import resilience
+from paperless_ngx_mcp.resilience import AdaptiveLimiter, CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(resilience.time, "monotonic", fake)
+    return fake
+
+
+def test_breaker_opens_after_consecutive_failures(clock: FakeClock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == "closed"
+
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.trips == 1
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.rejected == 1
+
+
+def test_breaker_success_resets_the_failure_count(clock: FakeClock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == "closed"
+
+
+def test_breaker_lets_one_probe_through_after_the_reset_timeout(clock: FakeClock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now += 10
+
+    breaker.before_call()
+
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_breaker_reopens_when_the_probe_fails(clock: FakeClock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now += 10
+    breaker.before_call()
+
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.trips == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_replaces_a_probe_that_never_reported_back(clock: FakeClock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.now += 10
+    breaker.before_call()  # The probe is cancelled and never reports back
+    clock.now += 11
+
+    breaker.before_call()
+
+    assert breaker.state == "half_open"
+
+
+def test_limiter_grows_additively_while_responses_are_fast(clock: FakeClock):
+    limiter = AdaptiveLimiter(max_limit=10, min_limit=1, latency_target=1.0)
+    limiter.limit = 4.0
+    for _ in range(4):
+        limiter.in_flight += 1
+        limiter.release(latency=0.1)
+
+    # About +1 per round of limit requests
+    assert 4.9 < limiter.limit < 5.0
+
+
+def test_limiter_backs_off_multiplicatively_once_per_interval(clock: FakeClock):
+    limiter = AdaptiveLimiter(max_limit=10, min_limit=2, latency_target=1.0, backoff=0.5)
+    for _ in range(3):
+        limiter.in_flight += 1
+        limiter.release(latency=2.0)
+
+    assert limiter.limit == 5.0
+
+    clock.now += 1.0
+    limiter.in_flight += 1
+    limiter.release(latency=0.1, overloaded=True)
+    clock.now += 1.0
+    limiter.in_flight += 1
+    limiter.release(latency=0.1, overloaded=True)
+
+    assert limiter.limit == 2.0
+
+
+def test_limiter_never_exceeds_its_bounds(clock: FakeClock):
+    limiter = AdaptiveLimiter(max_limit=3, min_limit=1, latency_target=1.0)
+    for _ in range(10):
+        limiter.in_flight += 1
+        limiter.release(latency=0.1)
+
+    assert limiter.limit == 3.0
+
+
+def test_limiter_queues_requests_beyond_the_limit():
+    async def scenario():
+        limiter = AdaptiveLimiter(max_limit=2, latency_target=1.0)
+        await limiter.acquire()
+        await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        queued = limiter.stats()["waiting"]
+
+        limiter.release(latency=0.1)
+        await waiting
+        return queued, limiter.stats()
+
+    queued, stats = asyncio.run(scenario())
+
+    assert queued == 1
+    assert stats["in_flight"] == 2
+    assert stats["waiting"] == 0
+
+
+def test_limiter_passes_a_wake_up_on_when_a_waiter_is_cancelled():
+    async def scenario():
+        limiter = AdaptiveLimiter(max_limit=1, latency_target=1.0)
+        await limiter.acquire()
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        limiter.release(latency=0.1)  # Wakes the first waiter...
+        first.cancel()  # ...which is cancelled before it runs
+        await asyncio.wait_for(second, timeout=1)
+        return limiter.in_flight
+
+    assert asyncio.run(scenario()) == 1
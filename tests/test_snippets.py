@@ -0,0 +1,46 @@
+"""Tests for search result previews."""
+
+from paperless_ngx_mcp.snippets import PREVIEW_LENGTH, preview, term_pattern
+
+
+def test_highlights_become_marked_plain_text():
+    highlights = (
+        'Your <span class="match term0">invoice</span> for\n  March &amp; April '
+        'is <span class="match term1">due</span>'
+    )
+
+    assert preview("ignored", "invoice due", highlights) == (
+        "Your **invoice** for March & April is **due**"
+    )
+
+
+def test_window_starts_near_the_first_query_term():
+    content = "filler " * 50 + "the electricity invoice for March" + " tail" * 50
+
+    text = preview(content, "invoice")
+
+    assert text.startswith("...")
+    assert "**invoice**" in text
+    assert len(text) <= PREVIEW_LENGTH + 6
+
+
+def test_query_terms_match_word_starts_case_insensitively():
+    assert preview("Invoices and reinvoiced items", "invoice") == (
+        "**Invoices** and reinvoiced items"
+    )
+
+
+def test_field_prefixes_and_operators_are_not_terms():
+    pattern = term_pattern("tag:tax AND correspondent:bank OR NOT x")
+
+    assert pattern.pattern.count("|") == 1
+    assert pattern.search("the tax office")
+    assert pattern.search("my bank")
+    assert term_pattern("AND OR") is None
+
+
+def test_content_start_without_a_matching_term():
+    content = "word " * 100
+
+    assert preview(content, "missing") == content[:PREVIEW_LENGTH] + "..."
+    assert preview("short text") == "short text"
@@ -0,0 +1,195 @@
+"""Tests for tool-level caching against a fake Paperless-NGX."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from paperless_ngx_mcp import config as config_module
+from paperless_ngx_mcp import tools
+from paperless_ngx_mcp.api import AsyncPaperlessAPI
+from paperless_ngx_mcp.cache import LRUCache
+from paperless_ngx_mcp.http_cache import HttpCache
+from paperless_ngx_mcp.metadata import MetadataCache
+
+
+@pytest.fixture
+def document():
+    return {"id": 1, "content": "first draft", "modified": "2024-01-01T00:00:00Z"}
+
+
+@pytest.fixture
+def requested_paths():
+    return []
+
+
+@pytest.fixture
+def failing_params():
+    """Query parameters whose requests are answered with an error."""
+    return set()
+
+
+@pytest.fixture
+def search_hits():
+    """Full-text search results, best first; id__in lookups return them without hits."""
+    return []
+
+
+@pytest.fixture
+def api_factory(
+    monkeypatch, tmp_path: Path, document, requested_paths, failing_params, search_hits
+):
+    monkeypatch.setenv("PAPERLESS_API_TOKEN", "test-token")
+    monkeypatch.setattr(config_module, "config", None)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_paths.append(request.url.path)
+        if failing_params.intersection(request.url.params):
+            return httpx.Response(400, json={"detail": "Bad request"})
+        params = request.url.params
+        if request.url.path == "/api/documents/" and search_hits and "query" in params:
+            page_size = int(params["page_size"])
+            body = {
+                "count": len(search_hits),
+                "next": "?page=2" if len(search_hits) > page_size else None,
+                "all": [doc["id"] for doc in search_hits],
+                "results": search_hits[:page_size],
+            }
+            return httpx.Response(200, json=body)
+        if request.url.path == "/api/documents/" and search_hits and "id__in" in params:
+            ids = {int(doc_id) for doc_id in params["id__in"].split(",")}
+            results = [
+                {name: value for name, value in doc.items() if name != "__search_hit__"}
+                for doc in search_hits
+                if doc["id"] in ids
+            ]
+            return httpx.Response(200, json={"count": len(results), "results": results})
+        if request.url.path == "/api/documents/":
+            return httpx.Response(200, json={"count": 3, "results": [{"id": 2, "title": "Other"}]})
+        fields = request.url.params.get("fields")
+        body = document
+        if fields:
+            body = {name: document[name] for name in fields.split(",") if name in document}
+        return httpx.Response(200, json=body)
+
+    client = httpx.AsyncClient(
+        base_url="http://paperless.test", transport=httpx.MockTransport(handler)
+    )
+    http_cache = HttpCache(tmp_path / "http.db", max_bytes=1_000_000, ttl=3600)
+
+    def factory(**_kwargs) -> AsyncPaperlessAPI:
+        return AsyncPaperlessAPI(client=client, http_cache=http_cache)
+
+    return factory
+
+
+def test_changed_document_is_not_served_from_http_cache(monkeypatch, api_factory, document):
+    content_cache = LRUCache(max_entries=10, max_bytes=1_000_000, ttl=0)
+    monkeypatch.setattr(tools, "get_async_api", api_factory)
+    monkeypatch.setattr(tools, "get_content_cache", lambda: content_cache)
+
+    assert asyncio.run(tools._get_document_text(1)) == "first draft"
+
+    document.update(content="second draft", modified="2024-02-01T00:00:00Z")
+
+    assert asyncio.run(tools._get_document_text(1)) == "second draft"
+    # The stale response was evicted, so a later cached read sees the change too
+    content_cache.clear()
+    assert asyncio.run(tools._get_document_text(1)) == "second draft"
+
+
+def test_get_document_tool_refetches_changed_document(monkeypatch, api_factory, document):
+    document_cache = LRUCache(max_entries=10, max_bytes=1_000_000, ttl=0)
+    monkeypatch.setattr(tools, "get_async_api", api_factory)
+    monkeypatch.setattr(tools, "get_document_cache", lambda: document_cache)
+    monkeypatch.setattr(tools, "get_metadata", _no_metadata)
+
+    asyncio.run(tools.get_document_tool(1))
+    document.update(content="second draft", modified="2024-02-01T00:00:00Z")
+
+    assert json.loads(asyncio.run(tools.get_document_tool(1)))["content"] == "second draft"
+
+
+def test_document_stats_uses_cached_metadata_lists(monkeypatch, api_factory, requested_paths):
+    metadata = MetadataCache(refresh_interval=300)
+    metadata.update(
+        {
+            "tags": [
+                {"id": 1, "name": "invoice", "document_count": 2},
+                {"id": 2, "name": "receipt", "document_count": 1},
+            ]
+        }
+    )
+    monkeypatch.setattr(tools, "get_async_api", api_factory)
+    monkeypatch.setattr(tools, "get_metadata", _returning(metadata))
+
+    result = json.loads(asyncio.run(tools.document_stats_tool("tag")))
+
+    assert [(bucket["name"], bucket["count"]) for bucket in result["buckets"]] == [
+        ("invoice", 2),
+        ("receipt", 1),
+    ]
+    assert "/api/tags/" not in requested_paths
+
+
+def test_similarity_graph_falls_back_to_seed_ids(monkeypatch, api_factory, failing_params):
+    failing_params.add("id__in")
+    monkeypatch.setattr(tools, "get_async_api", api_factory)
+    monkeypatch.setattr(tools, "get_metadata", _no_metadata)
+
+    result = json.loads(asyncio.run(tools.similarity_graph_tool([1])))
+
+    assert [(node["id"], node["title"]) for node in result["nodes"]] == [(1, None), (2, "Other")]
+    assert result["adjacency"] == {"1": [2]}
+    assert "not_found" not in result
+    assert "Bad request" in result["seed_error"]
+
+
+def test_similarity_graph_keeps_searched_seed_missing_from_details(monkeypatch, api_factory):
+    # The id__in lookup of seed 1 only returns document 2
+    monkeypatch.setattr(tools, "get_async_api", api_factory)
+    monkeypatch.setattr(tools, "get_metadata", _no_metadata)
+
+    result = json.loads(asyncio.run(tools.similarity_graph_tool([1])))
+
+    assert [node["id"] for node in result["nodes"]] == [1, 2]
+    assert result["clusters"] == [[1, 2]]
+    assert "not_found" not in result
+
+
+def test_snapshot_pages_rank_by_position(monkeypatch, api_factory, search_hits):
+    search_hits.extend(
+        {"id": doc_id, "title": f"Match {doc_id}", "__search_hit__": {"score": 10 - i, "rank": i}}
+        for i, doc_id in enumerate((30, 10, 20))
+    )
+    snapshots = LRUCache(max_entries=10, max_bytes=1_000_000, ttl=600)
+    monkeypatch.setattr(tools, "get_async_api", api_factory)
+    monkeypatch.setattr(tools, "get_metadata", _no_metadata)
+    monkeypatch.setattr(tools, "get_snapshot_cache", lambda: snapshots)
+    monkeypatch.setattr(tools, "get_prefetcher", lambda: None)
+
+    first = json.loads(
+        asyncio.run(tools.search_documents_tool(query="match", page_size=2, snapshot=True))
+    )
+    second = json.loads(
+        asyncio.run(
+            tools.search_documents_tool(page=2, page_size=2, snapshot_id=first["snapshot_id"])
+        )
+    )
+
+    assert [(doc["id"], doc["rank"]) for doc in first["documents"]] == [(30, 1), (10, 2)]
+    assert [(doc["id"], doc["rank"], doc["score"]) for doc in second["documents"]] == [
+        (20, 3, None)
+    ]
+
+
+def _returning(value):
+    async def get():
+        return value
+
+    return get
+
+
+_no_metadata = _returning(None)
@@ -0,0 +1,159 @@
+"""Tests for the change watcher against a fake Paperless-NGX."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from paperless_ngx_mcp import config as config_module
+from paperless_ngx_mcp import watcher as watcher_module
+from paperless_ngx_mcp.api import AsyncPaperlessAPI
+from paperless_ngx_mcp.cache import LRUCache
+from paperless_ngx_mcp.metadata import MetadataCache
+from paperless_ngx_mcp.watcher import ChangeWatcher
+
+
+class FakePaperless:
+    """Documents and metadata list endpoints, as far as the watcher reads them."""
+
+    def __init__(self):
+        # Document ID to modified timestamp
+        self.documents = {1: "2024-01-01T00:00:00Z", 2: "2024-01-02T00:00:00Z"}
+        self.tags = [{"id": 1, "name": "invoice", "document_count": 2}]
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        if request.url.path == "/api/tags/":
+            results = self.tags
+        elif request.url.path == "/api/documents/":
+            docs = sorted(
+                (
+                    {"id": doc_id, "modified": modified}
+                    for doc_id, modified in self.documents.items()
+                ),
+                key=lambda doc: (doc["modified"], doc["id"]),
+                reverse=params.get("ordering") == "-modified",
+            )
+            if "modified__gt" in params:
+                docs = [doc for doc in docs if doc["modified"] > params["modified__gt"]]
+            results = docs[: int(params.get("page_size", 25))]
+            return httpx.Response(
+                200,
+                json={
+                    "count": len(docs),
+                    "next": None,
+                    "all": sorted(self.documents),
+                    "results": results,
+                },
+            )
+        else:
+            results = []
+        return httpx.Response(200, json={"count": len(results), "next": None, "results": results})
+
+
+@pytest.fixture
+def paperless(monkeypatch) -> FakePaperless:
+    monkeypatch.setenv("PAPERLESS_API_TOKEN", "test-token")
+    monkeypatch.setattr(config_module, "config", None)
+    fake = FakePaperless()
+    client = httpx.AsyncClient(
+        base_url="http://paperless.test", transport=httpx.MockTransport(fake.handler)
+    )
+    monkeypatch.setattr(
+        watcher_module, "get_async_api", lambda **_kwargs: AsyncPaperlessAPI(client=client)
+    )
+    for name in ("get_http_cache", "get_autocomplete_cache", "get_prefetcher"):
+        monkeypatch.setattr(watcher_module, name, lambda: None)
+    return fake
+
+
+@pytest.fixture
+def caches(monkeypatch) -> dict[str, LRUCache]:
+    caches = {
+        name: LRUCache(max_entries=10, max_bytes=1_000_000, ttl=300)
+        for name in ("document", "content", "list")
+    }
+    for name, cache in caches.items():
+        monkeypatch.setattr(watcher_module, f"get_{name}_cache", lambda cache=cache: cache)
+    return caches
+
+
+@pytest.fixture
+def metadata(monkeypatch) -> MetadataCache:
+    metadata = MetadataCache(refresh_interval=300)
+    monkeypatch.setattr(watcher_module, "get_metadata_cache", lambda: metadata)
+    return metadata
+
+
+def _fill(caches: dict[str, LRUCache]) -> None:
+    for document_id in (1, 2):
+        caches["document"].set(document_id, f"document {document_id}")
+        caches["content"].set(document_id, f"content {document_id}")
+    caches["list"].set("tags", "tag list")
+
+
+def test_changed_document_is_evicted(paperless, caches, metadata):
+    watcher = ChangeWatcher(interval=60)
+    asyncio.run(watcher.poll())
+    _fill(caches)
+
+    paperless.documents[1] = "2024-02-01T00:00:00Z"
+    paperless.tags = [{"id": 1, "name": "invoice", "document_count": 1}]
+    asyncio.run(watcher.poll())
+
+    assert caches["document"].get(1) is None
+    assert caches["content"].get(1) is None
+    assert caches["document"].get(2) == "document 2"
+    # The tag's document count changed with the document
+    assert caches["list"].get("tags") is None
+    assert watcher.changed_documents == 1
+
+
+def test_deleted_document_is_evicted(paperless, caches, metadata):
+    watcher = ChangeWatcher(interval=60)
+    asyncio.run(watcher.poll())
+    _fill(caches)
+
+    del paperless.documents[2]
+    paperless.tags = [{"id": 1, "name": "invoice", "document_count": 1}]
+    asyncio.run(watcher.poll())
+
+    assert caches["document"].get(2) is None
+    assert caches["content"].get(2) is None
+    assert caches["document"].get(1) == "document 1"
+    assert caches["list"].get("tags") is None
+    assert watcher.deleted_documents == 1
+
+
+def test_first_poll_evicts_nothing(paperless, caches, metadata):
+    _fill(caches)
+
+    asyncio.run(ChangeWatcher(interval=60).poll())
+
+    assert caches["document"].get(1) == "document 1"
+    assert caches["list"].get("tags") == "tag list"
+
+
+def test_metadata_change_updates_loaded_metadata_cache(paperless, caches, metadata):
+    metadata.update({"tags": paperless.tags})
+    watcher = ChangeWatcher(interval=60)
+    asyncio.run(watcher.poll())
+    _fill(caches)
+
+    paperless.tags = [{"id": 1, "name": "bill", "document_count": 2}]
+    asyncio.run(watcher.poll())
+
+    assert metadata.resolve("tags", 1) == "bill"
+    # Cached documents contain the old name
+    assert caches["document"].get(1) is None
+
+
+def test_metadata_change_leaves_unloaded_metadata_cache_alone(paperless, caches, metadata):
+    watcher = ChangeWatcher(interval=60)
+    asyncio.run(watcher.poll())
+
+    paperless.tags = [{"id": 1, "name": "bill", "document_count": 2}]
+    asyncio.run(watcher.poll())
+
+    assert not metadata.loaded
+    assert metadata.names["tags"] == {}